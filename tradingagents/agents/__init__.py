@@ -1,4 +1,4 @@
-from .utils.agent_utils import Toolkit, create_msg_delete
+from .utils.agent_utils import Toolkit, create_msg_delete, create_msg_prune
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
 
@@ -17,13 +17,14 @@ from .risk_mgmt.neutral_debator import create_neutral_debator
 from .managers.research_manager import create_research_manager
 from .managers.risk_manager import create_risk_manager
 
-from .trader.trader import create_trader
+from .trader.trader import create_trader, create_batch_trader
 
 __all__ = [
     "FinancialSituationMemory",
     "Toolkit",
     "AgentState",
     "create_msg_delete",
+    "create_msg_prune",
     "InvestDebateState",
     "RiskDebateState",
     "create_bear_researcher",
@@ -38,4 +39,5 @@ __all__ = [
     "create_safe_debator",
     "create_social_media_analyst",
     "create_trader",
+    "create_batch_trader",
 ]
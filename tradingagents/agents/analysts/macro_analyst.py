@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
-import json
 from langchain_core.messages import AIMessage, ToolMessage
+from tradingagents.agents.utils.agent_utils import execute_tool_calls, trading_context, TradingContext
 
 # Import prompt capture utility
 try:
@@ -20,6 +20,7 @@ def create_macro_analyst(llm, toolkit):
         try:
             current_date = state["trade_date"]
             ticker = state.get("company_of_interest", "MARKET")
+            trading_context.set(TradingContext(ticker, current_date))
             
             # print(f"[MACRO] Analyzing macro environment on {current_date}")
             
@@ -29,7 +30,7 @@ def create_macro_analyst(llm, toolkit):
                 tools = [
                     toolkit.get_macro_analysis,
                     toolkit.get_economic_indicators,
-                    toolkit.get_yield_curve_analysis
+                    toolkit.get_yield_curve_analysis,
                 ]
                 # print(f"[MACRO] Using online macro tools: FRED API + Economic Indicators")
             else:
@@ -37,9 +38,11 @@ def create_macro_analyst(llm, toolkit):
                 tools = [
                     toolkit.get_macro_analysis,
                     toolkit.get_economic_indicators,
-                    toolkit.get_yield_curve_analysis
+                    toolkit.get_yield_curve_analysis,
                 ]
                 # print(f"[MACRO] Using offline macro tools: Cached Economic Data")
+            # The batch tool may only fan out to the tools above
+            tools.append(toolkit.parallel_tool(tools))
 
             system_message = (
                 "You are an EOD TRADING macro analyst focused on identifying macroeconomic factors and events that could drive overnight and next-day market movements. "
@@ -136,58 +139,38 @@ For your reference, the current date is {current_date}. Focus on macroeconomic c
                 iteration_count += 1
                 # print(f"[MACRO] Tool execution iteration {iteration_count}")
                 
-                for tool_call in result.additional_kwargs["tool_calls"]:
-                    # Handle different tool call structures
-                    if isinstance(tool_call, dict):
-                        tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
-                        tool_args = tool_call.get("args", {}) or tool_call.get("function", {}).get("arguments", {})
-                        if isinstance(tool_args, str):
-                            try:
-                                tool_args = json.loads(tool_args)
-                            except json.JSONDecodeError:
-                                tool_args = {}
-                    else:
-                        # Handle LangChain ToolCall objects
-                        tool_name = getattr(tool_call, 'name', None)
-                        tool_args = getattr(tool_call, 'args', {})
-
-                    tool_fn = next((t for t in tools if t.name == tool_name), None)
-
-                    if tool_fn is None:
-                        tool_result = f"Tool '{tool_name}' not found."
-                        print(f"[MACRO] ⚠️ {tool_result}")
+                tool_outcomes = execute_tool_calls(tools, result.additional_kwargs["tool_calls"], "MACRO")
+                for tool_call, tool_name, tool_result, succeeded in tool_outcomes:
+                    if not succeeded:
                         tool_failures.append(tool_name)
                     else:
-                        try:
-                            if hasattr(tool_fn, "invoke"):
-                                tool_result = tool_fn.invoke(tool_args)
-                            else:
-                                tool_result = tool_fn.run(**tool_args)
-                            
-                            successful_tools.append(tool_name)
-                            
+                        # A batched call carries one report per sub-call; judge each on its own
+                        if tool_name == "run_tools_in_parallel" and isinstance(tool_result, str):
+                            reports = toolkit.split_batch_report(tool_result, tools).items()
+                        else:
+                            reports = [(tool_name, tool_result)]
+
+                        for report_name, report in reports:
                             # Check if tool returned an actual error message (be more specific)
                             # Only flag as error if the entire result is an error, not if it contains error sections
-                            if isinstance(tool_result, str) and (
-                                tool_result.lower().startswith("error") or 
-                                (len(tool_result) < 200 and (
-                                    "api key not found" in tool_result.lower() or
-                                    "failed to fetch" in tool_result.lower() or
-                                    "connection error" in tool_result.lower()
+                            if isinstance(report, str) and (
+                                report.lower().startswith("error") or 
+                                (len(report) < 200 and (
+                                    "api key not found" in report.lower() or
+                                    "failed to fetch" in report.lower() or
+                                    "connection error" in report.lower()
                                 ))
                             ):
-                                print(f"[MACRO] ⚠️ Tool '{tool_name}' returned error: {tool_result[:100]}...")
-                                tool_failures.append(tool_name)
-                            elif isinstance(tool_result, str) and len(tool_result) > 100:
-                                # This is likely a valid report, even if it contains some error sections
-                                # Don't flag as a complete failure
-                                print(f"[MACRO] 📊 Tool '{tool_name}' returned report with {len(tool_result)} characters")
+                                print(f"[MACRO] ⚠️ Tool '{report_name}' returned error: {report[:100]}...")
+                                tool_failures.append(report_name)
                             else:
-                                print(f"[MACRO] ✅ Tool '{tool_name}' completed successfully")
-                                
-                        except Exception as tool_err:
-                            tool_result = f"Error running tool '{tool_name}': {str(tool_err)}"
-                            tool_failures.append(tool_name)
+                                successful_tools.append(report_name)
+                                if isinstance(report, str) and len(report) > 100:
+                                    # This is likely a valid report, even if it contains some error sections
+                                    # Don't flag as a complete failure
+                                    print(f"[MACRO] 📊 Tool '{report_name}' returned report with {len(report)} characters")
+                                else:
+                                    print(f"[MACRO] ✅ Tool '{report_name}' completed successfully")
 
                     tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
                     ai_tool_call_msg = AIMessage(content="", additional_kwargs={"tool_calls": [tool_call]})
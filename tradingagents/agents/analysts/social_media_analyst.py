@@ -1,7 +1,7 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import AIMessage, ToolMessage
+from tradingagents.agents.utils.agent_utils import execute_tool_calls, trading_context, TradingContext
 import time
-import json
 
 # Import prompt capture utility
 try:
@@ -17,6 +17,7 @@ def create_social_media_analyst(llm, toolkit):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
+        trading_context.set(TradingContext(ticker, current_date))
 
         if toolkit.config["online_tools"]:
             tools = [
@@ -115,38 +116,8 @@ For your reference, the current date is {current_date}. The current company we w
 
         # Handle iterative tool calls until the model stops requesting them
         while getattr(result, "additional_kwargs", {}).get("tool_calls"):
-            for tool_call in result.additional_kwargs["tool_calls"]:
-                # Handle different tool call structures
-                if isinstance(tool_call, dict):
-                    tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
-                    tool_args = tool_call.get("args", {}) or tool_call.get("function", {}).get("arguments", {})
-                    if isinstance(tool_args, str):
-                        try:
-                            tool_args = json.loads(tool_args)
-                        except json.JSONDecodeError:
-                            tool_args = {}
-                else:
-                    # Handle LangChain ToolCall objects
-                    tool_name = getattr(tool_call, 'name', None)
-                    tool_args = getattr(tool_call, 'args', {})
-
-                # Find the matching tool by name
-                tool_fn = next((t for t in tools if t.name == tool_name), None)
-
-                if tool_fn is None:
-                    tool_result = f"Tool '{tool_name}' not found."
-                    print(f"[SOCIAL] ⚠️ {tool_result}")
-                else:
-                    try:
-                        # LangChain Tool objects expose `.run` (string IO) as well as `.invoke` (dict/kwarg IO)
-                        if hasattr(tool_fn, "invoke"):
-                            tool_result = tool_fn.invoke(tool_args)
-                        else:
-                            tool_result = tool_fn.run(**tool_args)
-                        
-                    except Exception as tool_err:
-                        tool_result = f"Error running tool '{tool_name}': {str(tool_err)}"
-
+            tool_outcomes = execute_tool_calls(tools, result.additional_kwargs["tool_calls"], "SOCIAL")
+            for tool_call, tool_name, tool_result, _ in tool_outcomes:
                 # Append the assistant tool call and tool result messages so the LLM can continue the conversation
                 tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
                 ai_tool_call_msg = AIMessage(
@@ -41,8 +41,9 @@ def create_risk_manager(llm, memory, config=None):
         # ---------------------------------------------------------
         # NEW: Fetch richer live account & position metrics from Alpaca
         # ---------------------------------------------------------
-        positions_data = AlpacaUtils.get_positions_data()
-        account_info = AlpacaUtils.get_account_info()
+        snapshot = AlpacaUtils.get_account_snapshot()
+        positions_data = snapshot["positions"]
+        account_info = snapshot["account"]
 
         # Build summary for specific symbol
         position_stats_desc = ""
@@ -100,9 +101,7 @@ def create_risk_manager(llm, memory, config=None):
         curr_situation = f"{macro_report}\n\n{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
+        past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
 
         # Use centralized trading mode context
         manager_context = f"""
@@ -1,6 +1,9 @@
+import concurrent.futures
 import functools
+import re
 import time
 import json
+from langchain_core.messages import AIMessage
 from ..utils.agent_trading_modes import get_trading_mode_context, get_agent_specific_context, extract_recommendation, format_final_decision
 from tradingagents.dataflows.alpaca_utils import AlpacaUtils
 
@@ -13,90 +16,9 @@ except ImportError:
         pass
 
 
-def create_trader(llm, memory, config=None):
-    def trader_node(state, name):
-        company_name = state["company_of_interest"]
-        investment_plan = state["investment_plan"]
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-        macro_report = state["macro_report"]
-        
-        # Determine current position from live Alpaca account (fallback to state)
-        current_position = AlpacaUtils.get_current_position_state(company_name)
-        # Persist into state so downstream agents see an accurate picture
-        state["current_position"] = current_position
-
-        # ---------------------------------------------------------
-        # NEW: Pull richer live account & position metrics from Alpaca
-        # ---------------------------------------------------------
-        positions_data = AlpacaUtils.get_positions_data()
-        account_info = AlpacaUtils.get_account_info()
-
-        # Build a user-friendly summary for the specific symbol the agent cares about
-        position_stats_desc = ""
-        symbol_key = company_name.upper().replace("/", "")
-        for pos in positions_data:
-            if pos["Symbol"].upper() == symbol_key:
-                qty = pos["Qty"]
-                avg_entry = pos["Avg Entry"]
-                today_pl_dollars = pos["Today's P/L ($)"]
-                today_pl_percent = pos["Today's P/L (%)"]
-                total_pl_dollars = pos["Total P/L ($)"]
-                total_pl_percent = pos["Total P/L (%)"]
-
-                position_stats_desc = (
-                    f"Position Details for {company_name}:\n"
-                    f"- Quantity: {qty}\n"
-                    f"- Average Entry Price: {avg_entry}\n"
-                    f"- Today's P/L: {today_pl_dollars} ({today_pl_percent})\n"
-                    f"- Total P/L: {total_pl_dollars} ({total_pl_percent})"
-                )
-                break
-        if not position_stats_desc:
-            position_stats_desc = "No open position details available for this symbol."
-
-        buying_power = account_info.get("buying_power", 0.0)
-        cash = account_info.get("cash", 0.0)
-        daily_change_dollars = account_info.get("daily_change_dollars", 0.0)
-        daily_change_percent = account_info.get("daily_change_percent", 0.0)
-        account_status_desc = (
-            "Account Status:\n"
-            f"- Buying Power: ${buying_power:,.2f}\n"
-            f"- Cash: ${cash:,.2f}\n"
-            f"- Daily Change: ${daily_change_dollars:,.2f} ({daily_change_percent:.2f}%)"
-        )
-        # ---------------------------------------------------------
-        # END NEW BLOCK
-        # ---------------------------------------------------------
-
-        # Human-readable description for the prompt
-        open_pos_desc = (
-            f"We currently have an open {current_position} position in {company_name}."
-            if current_position != "NEUTRAL"
-            else f"We do not have any open position in {company_name}."
-        )
-        
-        # Get centralized trading mode context
-        trading_context = get_trading_mode_context(config, current_position)
-        agent_context = get_agent_specific_context("trader", trading_context)
-        
-        # Get mode-specific terms for the prompt
-        actions = trading_context["actions"]
-        mode_name = trading_context["mode_name"]
-        decision_format = trading_context["decision_format"]
-        final_format = trading_context["final_format"]
-
-        curr_situation = f"{macro_report}\n\n{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
-
-        # Use centralized trading mode context for trader-specific instructions
-        trader_context = f"""
+# Static prompt skeletons for the trader node, filled in with str.format at
+# call time so the literal text is built once at import instead of per call.
+_TRADER_CONTEXT_TMPL = """
 {agent_context}
 
 **EOD TRADER DECISION MAKING:**
@@ -148,22 +70,20 @@ Always conclude with: {final_format}
 3. **Risk Management** - Stop loss placement and daily volatility-based sizing
 4. **Profit Targets** - Realistic targets based on daily ranges and technical levels
 5. **Overnight Risk** - Assessment of news risk and pre-market factors
-6. **Daily Context** - How market close conditions affect overnight positioning"""
+6. **Daily Context** - How market close conditions affect overnight positioning
 
-        # Enhanced content validation for investment plan
-        plan_content = investment_plan if investment_plan else ""
-        
-        # Check if investment plan is substantial enough
-        if len(plan_content.strip()) < 150 or ("FINAL TRANSACTION PROPOSAL:" in plan_content and len(plan_content.replace("FINAL TRANSACTION PROPOSAL:", "").strip()) < 100):
-            # Generate enhanced analysis prompt when investment plan is insufficient
-            enhanced_prompt = f"""As a EOD Trader specializing in overnight positions, provide a comprehensive trading plan for {company_name}.
+**OUTPUT REQUIREMENTS:**
+- Your response must be a complete analysis of at least 200 words covering every point above. If the proposed plan is thin or missing, build the full analysis yourself from the available reports.
+- The last line of your response must be exactly: {final_format} with a single action filled in."""
+
+_ENHANCED_PROMPT_TMPL = """As a EOD Trader specializing in overnight positions, provide a comprehensive trading plan for {company_name}.
 
 **AVAILABLE ANALYSIS:**
-Market Analysis: {market_research_report[:500] if market_research_report else 'Limited data available'}
-Sentiment Analysis: {sentiment_report[:300] if sentiment_report else 'Limited data available'}
-News Analysis: {news_report[:300] if news_report else 'Limited data available'}
-Fundamentals: {fundamentals_report[:300] if fundamentals_report else 'Limited data available'}
-Macro Analysis: {macro_report[:300] if macro_report else 'Limited data available'}
+Market Analysis: {market_research_report}
+Sentiment Analysis: {sentiment_report}
+News Analysis: {news_report}
+Fundamentals: {fundamentals_report}
+Macro Analysis: {macro_report}
 
 **REQUIRED EOD TRADING PLAN:**
 Provide a detailed analysis covering:
@@ -188,6 +108,204 @@ Include a markdown table with:
 
 Focus on actionable EOD trading insights with specific price levels and risk management."""
 
+_FINAL_PROMPT_TMPL = """Based on the following EOD trading analysis for {company_name}, provide your final trading decision.
+
+Analysis:
+{analysis_content}
+
+Provide a brief justification and conclude with: {final_format}"""
+
+
+# Index markers used to number the per-symbol sections of a batch prompt
+_BATCH_SECTION_RE = re.compile(r"^\s*\[(\d+)\]", re.MULTILINE)
+
+_BATCH_TRADER_TMPL = """You are a trading agent analyzing market data to make investment decisions for several symbols at once. {trader_context}
+
+You will receive {count} numbered EOD trading plans marked [1] to [{count}]. Treat every symbol independently and use the position and account details given with each plan.
+
+Answer every plan in its own section. Start each section on a new line with the same index marker as the plan (for example "[1] AAPL"), give the full analysis for that symbol, and end the section with: {final_format}"""
+
+_BATCH_PLAN_TMPL = """[{index}] {company_name}
+Current Alpaca Position Status:
+{open_pos_desc}
+
+{position_stats_desc}
+
+Lessons from similar past situations: {past_memory_str}
+
+Proposed EOD Trading Plan: {investment_plan}"""
+
+
+_LIMITED_DATA = "Limited data available"
+_FINAL_PROPOSAL_MARKER = "FINAL TRANSACTION PROPOSAL:"
+_NO_POSITION_DETAILS = "No open position details available for this symbol."
+
+
+def _report_excerpt(report, limit):
+    """Leading excerpt of an analyst report for the enhanced prompt."""
+    return report[:limit] if report else _LIMITED_DATA
+
+
+# State keys of the analyst reports that describe the current situation,
+# in the order they are joined for the memory lookup
+_SITUATION_REPORT_KEYS = (
+    "macro_report",
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+)
+
+
+def _situation_from_reports(*reports):
+    """Join analyst reports into the situation text used for memory lookups."""
+    return "\n\n".join(report or "" for report in reports)
+
+
+def _describe_open_position(company_name, current_position):
+    """Human-readable one-liner about the open position for a symbol."""
+    if current_position != "NEUTRAL":
+        return f"We currently have an open {current_position} position in {company_name}."
+    return f"We do not have any open position in {company_name}."
+
+
+def _describe_position_stats(company_name, positions_data):
+    """Summarise the live Alpaca position metrics for a single symbol."""
+    symbol_key = company_name.upper().replace("/", "")
+    for pos in positions_data:
+        if pos["Symbol"].upper() == symbol_key:
+            today_pl_dollars = pos["Today's P/L ($)"]
+            today_pl_percent = pos["Today's P/L (%)"]
+            total_pl_dollars = pos["Total P/L ($)"]
+            total_pl_percent = pos["Total P/L (%)"]
+            return (
+                f"Position Details for {company_name}:\n"
+                f"- Quantity: {pos['Qty']}\n"
+                f"- Average Entry Price: {pos['Avg Entry']}\n"
+                f"- Today's P/L: {today_pl_dollars} ({today_pl_percent})\n"
+                f"- Total P/L: {total_pl_dollars} ({total_pl_percent})"
+            )
+    return _NO_POSITION_DETAILS
+
+
+def _describe_account_status(account_info):
+    """Summarise the Alpaca account balances for the prompt."""
+    buying_power = account_info.get("buying_power", 0.0)
+    cash = account_info.get("cash", 0.0)
+    daily_change_dollars = account_info.get("daily_change_dollars", 0.0)
+    daily_change_percent = account_info.get("daily_change_percent", 0.0)
+    return (
+        "Account Status:\n"
+        f"- Buying Power: ${buying_power:,.2f}\n"
+        f"- Cash: ${cash:,.2f}\n"
+        f"- Daily Change: ${daily_change_dollars:,.2f} ({daily_change_percent:.2f}%)"
+    )
+
+
+def _split_batch_response(content, count):
+    """Split an indexed batch response into one section per plan.
+
+    Returns a list of length ``count``; plans the model did not answer are
+    left as empty strings.
+    """
+    sections = [""] * count
+    markers = list(_BATCH_SECTION_RE.finditer(content))
+    for pos, marker in enumerate(markers):
+        index = int(marker.group(1)) - 1
+        if 0 <= index < count:
+            end = markers[pos + 1].start() if pos + 1 < len(markers) else len(content)
+            sections[index] = content[marker.start():end].strip()
+    return sections
+
+
+def create_trader(llm, memory, config=None):
+    def trader_node(state, name):
+        company_name = state["company_of_interest"]
+        investment_plan = state["investment_plan"]
+        market_research_report = state["market_report"]
+        sentiment_report = state["sentiment_report"]
+        news_report = state["news_report"]
+        fundamentals_report = state["fundamentals_report"]
+        macro_report = state["macro_report"]
+        
+        curr_situation = _situation_from_reports(
+            macro_report, market_research_report, sentiment_report, news_report, fundamentals_report
+        )
+
+        # The memory lookup (embedding + similarity search) and the Alpaca
+        # account calls are independent, so run them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            memories_future = executor.submit(memory.get_memories, curr_situation, n_matches=2)
+            account_future = executor.submit(AlpacaUtils.get_account_info)
+            position_future = executor.submit(AlpacaUtils.get_current_position_state, company_name)
+
+            # Determine current position from live Alpaca account (fallback to state)
+            current_position = position_future.result()
+            # Persist into state so downstream agents see an accurate picture
+            state["current_position"] = current_position
+
+            # ---------------------------------------------------------
+            # NEW: Pull richer live account & position metrics from Alpaca
+            # ---------------------------------------------------------
+            # Build a user-friendly summary for the specific symbol the agent
+            # cares about. With no open position there is nothing to describe,
+            # so skip the positions round-trip entirely.
+            if current_position == "NEUTRAL":
+                position_stats_desc = _NO_POSITION_DETAILS
+            else:
+                positions_data = AlpacaUtils.get_positions_data()
+                position_stats_desc = _describe_position_stats(company_name, positions_data)
+
+            account_status_desc = _describe_account_status(account_future.result())
+            # ---------------------------------------------------------
+            # END NEW BLOCK
+            # ---------------------------------------------------------
+
+            past_memories = memories_future.result()
+
+        # Human-readable description for the prompt
+        open_pos_desc = _describe_open_position(company_name, current_position)
+        
+        # Get centralized trading mode context
+        trading_context = get_trading_mode_context(config, current_position)
+        agent_context = get_agent_specific_context("trader", trading_context)
+        
+        # Get mode-specific terms for the prompt
+        actions = trading_context["actions"]
+        mode_name = trading_context["mode_name"]
+        decision_format = trading_context["decision_format"]
+        final_format = trading_context["final_format"]
+
+        past_memory_str = "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
+
+        # Use centralized trading mode context for trader-specific instructions
+        trader_context = _TRADER_CONTEXT_TMPL.format(
+            agent_context=agent_context,
+            open_pos_desc=open_pos_desc,
+            position_stats_desc=position_stats_desc,
+            account_status_desc=account_status_desc,
+            decision_format=decision_format,
+            final_format=final_format,
+        )
+
+        # Enhanced content validation for investment plan
+        plan_content = investment_plan if investment_plan else ""
+        
+        # Check if investment plan is substantial enough, i.e. it is not just
+        # FINAL TRANSACTION PROPOSAL lines with little else around them
+        plan_length = len(plan_content.strip())
+        marker_length = plan_content.count(_FINAL_PROPOSAL_MARKER) * len(_FINAL_PROPOSAL_MARKER)
+        if plan_length < 150 or (marker_length and plan_length - marker_length < 100):
+            # Generate enhanced analysis prompt when investment plan is insufficient
+            enhanced_prompt = _ENHANCED_PROMPT_TMPL.format(
+                company_name=company_name,
+                market_research_report=_report_excerpt(market_research_report, 500),
+                sentiment_report=_report_excerpt(sentiment_report, 300),
+                news_report=_report_excerpt(news_report, 300),
+                fundamentals_report=_report_excerpt(fundamentals_report, 300),
+                macro_report=_report_excerpt(macro_report, 300),
+            )
+
             context = {
                 "role": "user", 
                 "content": enhanced_prompt
@@ -228,51 +346,30 @@ USER MESSAGE:
 
         result = llm.invoke(messages)
 
-        # Enhanced validation and final proposal handling
+        # The system prompt requires a full analysis ending in a FINAL line, so
+        # only fall back to a second call when no decision can be parsed.
         analysis_content = result.content if hasattr(result, 'content') else str(result)
-        
-        # Check if we have substantial analysis content
-        if len(analysis_content.strip()) < 200 or ("FINAL TRANSACTION PROPOSAL:" in analysis_content and len(analysis_content.replace("FINAL TRANSACTION PROPOSAL:", "").strip()) < 150):
-            # Generate fallback comprehensive analysis
-            fallback_prompt = f"""As an expert EOD trader, create a comprehensive trading plan for {company_name} focusing on overnight positions.
-
-**EOD TRADING ANALYSIS:**
-1. **Technical Setup** - Analyze current price action and key levels
-2. **Entry Strategy** - Define specific entry points and signals
-3. **Risk Management** - Calculate stop losses and position size
-4. **Profit Targets** - Set realistic price objectives
-5. **Trading Timeline** - Establish expected holding period
-
-Include detailed reasoning for EOD trading decisions and conclude with a clear recommendation.
-
-Focus on actionable insights with specific price levels and risk parameters."""
-            
-            fallback_result = llm.invoke(fallback_prompt)
-            analysis_content = fallback_result.content if hasattr(fallback_result, 'content') else str(fallback_result)
-        
-        # Ensure we have a final recommendation
-        if "FINAL TRANSACTION PROPOSAL:" not in analysis_content:
-            # Create final recommendation based on analysis
-            final_prompt = f"""Based on the following EOD trading analysis for {company_name}, provide your final trading decision.
-
-Analysis:
-{analysis_content}
-
-Provide a brief justification and conclude with: FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**"""
+        trading_mode = trading_context["mode"]
+        extracted_recommendation = extract_recommendation(analysis_content, trading_mode)
+
+        if extracted_recommendation is None:
+            # Ask for the final decision based on the analysis we already have
+            final_prompt = _FINAL_PROMPT_TMPL.format(
+                company_name=company_name,
+                analysis_content=analysis_content,
+                final_format=final_format,
+            )
             
             final_result = llm.invoke(final_prompt)
             final_content = final_result.content if hasattr(final_result, 'content') else str(final_result)
             
             # Properly combine analysis with final proposal
             combined_content = analysis_content + "\n\n---\n\n## Final Trading Decision\n\n" + final_content
-            result = type(result)(content=combined_content)
+            result = AIMessage(content=combined_content)
+            extracted_recommendation = extract_recommendation(result.content, trading_mode)
         else:
             # Analysis already contains final proposal
-            result = type(result)(content=analysis_content)
-
-        # Extract the recommendation from the response
-        trading_mode = trading_context["mode"]
-        extracted_recommendation = extract_recommendation(result.content, trading_mode)
+            result = AIMessage(content=analysis_content)
         
         # Format the final decision if extraction was successful
         final_decision_content = result.content
@@ -289,3 +386,107 @@ Provide a brief justification and conclude with: FINAL TRANSACTION PROPOSAL: **B
         }
 
     return functools.partial(trader_node, name="Trader")
+
+
+# Replaces the single-symbol open position description in the batch trader's shared prompt
+_BATCH_POSITION_NOTE = (
+    "Positions differ per symbol: each plan below states that symbol's current position. "
+    "Apply the position logic to that position, not to the default Current Position above."
+)
+
+
+def create_batch_trader(llm, memory, config=None):
+    """Create a trader that decides on several symbols with one LLM call.
+
+    Portfolio runs otherwise pay the full trader system prompt once per
+    symbol. The returned node takes a list of graph states (one per symbol),
+    sends them as an indexed batch of ``trader_batch_size`` plans per call
+    and returns one trader update per state, in the same order. The input
+    states are not modified. The node is not wired into the trading graph,
+    which runs one symbol at a time; portfolio drivers call it directly.
+    """
+    batch_size = max(1, (config or {}).get("trader_batch_size", 16))
+
+    def batch_trader_node(states, name):
+        # Account metrics are shared by every symbol in the batch
+        snapshot = AlpacaUtils.get_account_snapshot()
+        positions_data = snapshot["positions"]
+        account_status_desc = _describe_account_status(snapshot["account"])
+
+        # The shared prompt is built for a flat book; each plan carries its symbol's real position
+        trading_context = get_trading_mode_context(config, "NEUTRAL")
+        agent_context = get_agent_specific_context("trader", trading_context)
+        trading_mode = trading_context["mode"]
+        final_format = trading_context["final_format"]
+
+        trader_context = _TRADER_CONTEXT_TMPL.format(
+            agent_context=agent_context,
+            open_pos_desc=_BATCH_POSITION_NOTE,
+            position_stats_desc="",
+            account_status_desc=account_status_desc,
+            decision_format=trading_context["decision_format"],
+            final_format=final_format,
+        )
+
+        updates = []
+        for start in range(0, len(states), batch_size):
+            chunk = states[start:start + batch_size]
+            plans = []
+            positions = []
+            for index, state in enumerate(chunk, 1):
+                company_name = state["company_of_interest"]
+                current_position = AlpacaUtils.get_current_position_state(company_name)
+                positions.append(current_position)
+
+                curr_situation = _situation_from_reports(*(state[key] for key in _SITUATION_REPORT_KEYS))
+                past_memories = memory.get_memories(curr_situation, n_matches=2)
+                past_memory_str = "\n\n".join(rec["recommendation"] for rec in past_memories)
+
+                plans.append(_BATCH_PLAN_TMPL.format(
+                    index=index,
+                    company_name=company_name,
+                    open_pos_desc=_describe_open_position(company_name, current_position),
+                    position_stats_desc=_describe_position_stats(company_name, positions_data),
+                    past_memory_str=past_memory_str or "None available.",
+                    investment_plan=state["investment_plan"] or "No plan provided; build one from the analyst reports.",
+                ))
+
+            messages = [
+                {
+                    "role": "system",
+                    "content": _BATCH_TRADER_TMPL.format(
+                        trader_context=trader_context,
+                        count=len(chunk),
+                        final_format=final_format,
+                    ),
+                },
+                {"role": "user", "content": "\n\n".join(plans)},
+            ]
+            capture_agent_prompt(
+                "trader_investment_plan",
+                f"SYSTEM MESSAGE:\n{messages[0]['content']}\n\nUSER MESSAGE:\n{messages[1]['content']}",
+                ",".join(state["company_of_interest"] for state in chunk),
+            )
+
+            result = llm.invoke(messages)
+            content = result.content if hasattr(result, 'content') else str(result)
+            sections = _split_batch_response(content, len(chunk))
+
+            for section, current_position in zip(sections, positions):
+                extracted_recommendation = extract_recommendation(section, trading_mode) if section else None
+                final_decision_content = section
+                if extracted_recommendation:
+                    final_decision_content = format_final_decision(extracted_recommendation, trading_mode)
+
+                updates.append({
+                    "messages": [AIMessage(content=section)],
+                    "trader_investment_plan": final_decision_content,
+                    "sender": name,
+                    "trading_mode": trading_mode,
+                    "current_position": current_position,
+                    "recommended_action": extracted_recommendation,
+                })
+
+        return updates
+
+    return functools.partial(batch_trader_node, name="Trader")
@@ -9,7 +9,10 @@ Two trading modes supported:
 2. Trading Mode (allow_shorts=True): LONG/NEUTRAL/SHORT actions with position logic
 """
 
-from typing import Dict, Any, Optional, Tuple
+import functools
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 
 class TradingModeConfig:
@@ -28,7 +31,7 @@ class TradingModeConfig:
 
 
 def get_trading_mode_context(config: Optional[Dict[str, Any]] = None, 
-                           current_position: str = "NEUTRAL") -> Dict[str, str]:
+                           current_position: str = "NEUTRAL") -> Mapping[str, Any]:
     """
     Get trading mode context information for agent prompts
     
@@ -37,14 +40,25 @@ def get_trading_mode_context(config: Optional[Dict[str, Any]] = None,
         current_position: Current position state (LONG/SHORT/NEUTRAL)
         
     Returns:
-        Dict containing trading mode context information
+        Read-only mapping containing trading mode context information. The
+        mapping is shared between calls, so copy it before modifying.
     """
-    allow_shorts = config.get("allow_shorts", False) if config else False
+    allow_shorts = bool(config.get("allow_shorts", False)) if config else False
     
     if allow_shorts:
-        return _get_trading_context(current_position)
+        return _cached_trading_mode_context(True, current_position)
     else:
-        return _get_investment_context()
+        # Investment mode does not depend on the current position
+        return _cached_trading_mode_context(False, None)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_trading_mode_context(allow_shorts: bool,
+                                 current_position: Optional[str]) -> Mapping[str, Any]:
+    """Build the context for one (mode, position) combination only once"""
+    if allow_shorts:
+        return MappingProxyType(_get_trading_context(current_position))
+    return MappingProxyType(_get_investment_context())
 
 
 def _get_investment_context() -> Dict[str, str]:
@@ -147,24 +161,10 @@ Focus on daily decision-making with overnight position management, emphasizing e
     }
 
 
-def get_agent_specific_context(agent_type: str, trading_context: Dict[str, str]) -> str:
-    """
-    Get agent-specific trading mode instructions
-    
-    Args:
-        agent_type: Type of agent (analyst, researcher, trader, risk_mgmt, manager)
-        trading_context: Trading context from get_trading_mode_context()
-        
-    Returns:
-        Agent-specific instruction string
-    """
-    
-    base_context = trading_context["instructions"]
-    mode_name = trading_context["mode_name"]
-    actions = trading_context["actions"]
-    
-    agent_contexts = {
-        "analyst": f"""
+# Per-agent instruction templates. Only the template for the requested agent
+# type is formatted, rather than building all of them on every call.
+_AGENT_CONTEXT_TEMPLATES = {
+    "analyst": """
 As an Analyst in {mode_name}, your analysis should consider {actions} perspectives.
 
 Your analysis should:
@@ -175,8 +175,8 @@ Your analysis should:
 
 {base_context}
 """,
-        
-        "researcher": f"""
+
+    "researcher": """
 As a Researcher in {mode_name}, develop arguments supporting {actions} strategies.
 
 Your research should:
@@ -187,8 +187,8 @@ Your research should:
 
 {base_context}
 """,
-        
-        "trader": f"""
+
+    "trader": """
 As a Trader in {mode_name}, make decisive {actions} recommendations.
 
 Your decisions should:
@@ -199,8 +199,8 @@ Your decisions should:
 
 {base_context}
 """,
-        
-        "risk_mgmt": f"""
+
+    "risk_mgmt": """
 As a Risk Management Analyst in {mode_name}, evaluate {actions} decisions.
 
 Your risk assessment should:
@@ -211,8 +211,8 @@ Your risk assessment should:
 
 {base_context}
 """,
-        
-        "manager": f"""
+
+    "manager": """
 As a Manager in {mode_name}, synthesize team input for final {actions} decisions.
 
 Your management approach should:
@@ -222,10 +222,44 @@ Your management approach should:
 - Provide clear reasoning for the chosen course of action
 
 {base_context}
-"""
-    }
+""",
+}
+
+
+def get_agent_specific_context(agent_type: str, trading_context: Mapping[str, Any]) -> str:
+    """
+    Get agent-specific trading mode instructions
     
-    return agent_contexts.get(agent_type, base_context)
+    Args:
+        agent_type: Type of agent (analyst, researcher, trader, risk_mgmt, manager)
+        trading_context: Trading context from get_trading_mode_context()
+        
+    Returns:
+        Agent-specific instruction string
+    """
+    
+    base_context = trading_context["instructions"]
+    mode_name = trading_context["mode_name"]
+    actions = trading_context["actions"]
+    
+    template = _AGENT_CONTEXT_TEMPLATES.get(agent_type)
+    if template is None:
+        return base_context
+
+    return template.format(mode_name=mode_name, actions=actions, base_context=base_context)
+
+
+# Decision markers recognised by extract_recommendation: either a
+# "FINAL ...: **ACTION**" line or a standalone "**ACTION**". One compiled
+# pattern covers both so the response is scanned in a single pass.
+_DECISION_RE = re.compile(
+    r"(FINAL (?:TRANSACTION PROPOSAL|INVESTMENT DECISION|TRADING DECISION|RISK MANAGEMENT DECISION|DECISION):\s*)?"
+    r"\*\*(BUY|HOLD|SELL|LONG|NEUTRAL|SHORT)\*\*",
+    re.IGNORECASE,
+)
+
+# Standalone actions are only trusted near the end of the response
+_STANDALONE_ACTION_WINDOW = 100
 
 
 def extract_recommendation(response_content: str, trading_mode: str) -> Optional[str]:
@@ -239,58 +273,26 @@ def extract_recommendation(response_content: str, trading_mode: str) -> Optional
     Returns:
         Extracted recommendation or None if not found
     """
-    content = response_content.upper()
-    
     if trading_mode == "investment":
-        # Look for BUY/HOLD/SELL patterns
-        patterns = [
-            "FINAL TRANSACTION PROPOSAL: **BUY**",
-            "FINAL TRANSACTION PROPOSAL: **HOLD**", 
-            "FINAL TRANSACTION PROPOSAL: **SELL**",
-            "FINAL INVESTMENT DECISION: **BUY**",
-            "FINAL INVESTMENT DECISION: **HOLD**",
-            "FINAL INVESTMENT DECISION: **SELL**",
-            "FINAL DECISION: **BUY**",
-            "FINAL DECISION: **HOLD**",
-            "FINAL DECISION: **SELL**"
-        ]
-        
-        for pattern in patterns:
-            if pattern in content:
-                return pattern.split("**")[1]
-                
-        # Fallback - look for standalone actions at end
-        for action in TradingModeConfig.INVESTMENT_ACTIONS:
-            if f"**{action}**" in content[-100:]:  # Check last 100 chars
-                return action
-                
+        allowed_actions = TradingModeConfig.INVESTMENT_ACTIONS
     else:  # trading mode
-        # Look for LONG/NEUTRAL/SHORT patterns
-        patterns = [
-            "FINAL TRANSACTION PROPOSAL: **LONG**",
-            "FINAL TRANSACTION PROPOSAL: **NEUTRAL**",
-            "FINAL TRANSACTION PROPOSAL: **SHORT**",
-            "FINAL TRADING DECISION: **LONG**", 
-            "FINAL TRADING DECISION: **NEUTRAL**",
-            "FINAL TRADING DECISION: **SHORT**",
-            "FINAL RISK MANAGEMENT DECISION: **LONG**",
-            "FINAL RISK MANAGEMENT DECISION: **NEUTRAL**", 
-            "FINAL RISK MANAGEMENT DECISION: **SHORT**",
-            "FINAL DECISION: **LONG**",
-            "FINAL DECISION: **NEUTRAL**",
-            "FINAL DECISION: **SHORT**"
-        ]
-        
-        for pattern in patterns:
-            if pattern in content:
-                return pattern.split("**")[1]
-                
-        # Fallback - look for standalone actions at end
-        for action in TradingModeConfig.TRADING_ACTIONS:
-            if f"**{action}**" in content[-100:]:  # Check last 100 chars
-                return action
-    
-    return None
+        allowed_actions = TradingModeConfig.TRADING_ACTIONS
+
+    tail_start = len(response_content) - _STANDALONE_ACTION_WINDOW
+    final_action = None
+    standalone_action = None
+
+    # Prefer the last FINAL marker; fall back to a standalone action at the end
+    for match in _DECISION_RE.finditer(response_content):
+        action = match.group(2).upper()
+        if action not in allowed_actions:
+            continue
+        if match.group(1):
+            final_action = action
+        elif match.start() >= tail_start:
+            standalone_action = action
+
+    return final_action or standalone_action
 
 
 def validate_recommendation(recommendation: str, trading_mode: str) -> bool:
@@ -315,6 +317,25 @@ def validate_recommendation(recommendation: str, trading_mode: str) -> bool:
         return recommendation in TradingModeConfig.TRADING_ACTIONS
 
 
+# Position transition table laid out as a flat 3x3 grid indexed by
+# _POSITION_INDEX[current] * 3 + _POSITION_INDEX[signal]
+_POSITION_INDEX = {"LONG": 0, "SHORT": 1, "NEUTRAL": 2}
+_POSITION_TRANSITIONS = (
+    # Current position: LONG
+    {"action": "HOLD", "description": "Keep existing LONG position", "new_position": "LONG"},
+    {"action": "REVERSE_TO_SHORT", "description": "Close LONG position and open SHORT position", "new_position": "SHORT"},
+    {"action": "CLOSE_LONG", "description": "Close LONG position, exit to neutral", "new_position": "NEUTRAL"},
+    # Current position: SHORT
+    {"action": "REVERSE_TO_LONG", "description": "Close SHORT position and open LONG position", "new_position": "LONG"},
+    {"action": "HOLD", "description": "Keep existing SHORT position", "new_position": "SHORT"},
+    {"action": "CLOSE_SHORT", "description": "Close SHORT position, exit to neutral", "new_position": "NEUTRAL"},
+    # Current position: NEUTRAL
+    {"action": "OPEN_LONG", "description": "Open LONG position", "new_position": "LONG"},
+    {"action": "OPEN_SHORT", "description": "Open SHORT position", "new_position": "SHORT"},
+    {"action": "STAY_NEUTRAL", "description": "Stay in neutral position", "new_position": "NEUTRAL"},
+)
+
+
 def get_position_transition(current_position: str, new_signal: str) -> Dict[str, str]:
     """
     Get position transition information for trading mode
@@ -329,59 +350,26 @@ def get_position_transition(current_position: str, new_signal: str) -> Dict[str,
     current = current_position.upper()
     signal = new_signal.upper()
     
-    transitions = {
-        ("LONG", "LONG"): {
-            "action": "HOLD",
-            "description": "Keep existing LONG position",
-            "new_position": "LONG"
-        },
-        ("LONG", "NEUTRAL"): {
-            "action": "CLOSE_LONG", 
-            "description": "Close LONG position, exit to neutral",
-            "new_position": "NEUTRAL"
-        },
-        ("LONG", "SHORT"): {
-            "action": "REVERSE_TO_SHORT",
-            "description": "Close LONG position and open SHORT position", 
-            "new_position": "SHORT"
-        },
-        ("SHORT", "SHORT"): {
-            "action": "HOLD",
-            "description": "Keep existing SHORT position",
-            "new_position": "SHORT"
-        },
-        ("SHORT", "NEUTRAL"): {
-            "action": "CLOSE_SHORT",
-            "description": "Close SHORT position, exit to neutral",
-            "new_position": "NEUTRAL"
-        },
-        ("SHORT", "LONG"): {
-            "action": "REVERSE_TO_LONG", 
-            "description": "Close SHORT position and open LONG position",
-            "new_position": "LONG"
-        },
-        ("NEUTRAL", "LONG"): {
-            "action": "OPEN_LONG",
-            "description": "Open LONG position",
-            "new_position": "LONG"
-        },
-        ("NEUTRAL", "SHORT"): {
-            "action": "OPEN_SHORT",
-            "description": "Open SHORT position", 
-            "new_position": "SHORT"
-        },
-        ("NEUTRAL", "NEUTRAL"): {
-            "action": "STAY_NEUTRAL",
-            "description": "Stay in neutral position",
-            "new_position": "NEUTRAL"
+    current_idx = _POSITION_INDEX.get(current)
+    signal_idx = _POSITION_INDEX.get(signal)
+    if current_idx is None or signal_idx is None:
+        return {
+            "action": "UNKNOWN",
+            "description": f"Unknown transition from {current} to {signal}",
+            "new_position": signal
         }
-    }
-    
-    return transitions.get((current, signal), {
-        "action": "UNKNOWN",
-        "description": f"Unknown transition from {current} to {signal}",
-        "new_position": signal
-    })
+
+    return dict(_POSITION_TRANSITIONS[current_idx * 3 + signal_idx])
+
+
+# Pre-built final decision strings for every valid (mode, action) pair
+_FINAL_DECISIONS = {
+    **{("investment", action): f"FINAL TRANSACTION PROPOSAL: **{action}**"
+       for action in TradingModeConfig.INVESTMENT_ACTIONS},
+    **{("trading", action): f"FINAL TRANSACTION PROPOSAL: **{action}**"
+       for action in TradingModeConfig.TRADING_ACTIONS},
+}
+_NO_RECOMMENDATION_DECISION = "FINAL DECISION: **NO_RECOMMENDATION**"
 
 
 def format_final_decision(recommendation: str, trading_mode: str) -> str:
@@ -396,11 +384,11 @@ def format_final_decision(recommendation: str, trading_mode: str) -> str:
         Formatted final decision string
     """
     if not recommendation:
-        return "FINAL DECISION: **NO_RECOMMENDATION**"
+        return _NO_RECOMMENDATION_DECISION
         
     recommendation = recommendation.upper()
     
-    if trading_mode == "investment":
-        return f"FINAL TRANSACTION PROPOSAL: **{recommendation}**"
-    else:  # trading mode
-        return f"FINAL TRANSACTION PROPOSAL: **{recommendation}**" 
\ No newline at end of file
+    final_decision = _FINAL_DECISIONS.get((trading_mode, recommendation))
+    if final_decision is not None:
+        return final_decision
+    return f"FINAL TRANSACTION PROPOSAL: **{recommendation}**"
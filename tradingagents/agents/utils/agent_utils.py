@@ -1,124 +1,291 @@
 from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage, AIMessage
-from typing import List
+from typing import List, NamedTuple, Optional
 from typing import Annotated
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import RemoveMessage
 from langchain_core.tools import tool
-from datetime import date, timedelta, datetime
+from datetime import date, timedelta
 import functools
 import pandas as pd
 import os
 from dateutil.relativedelta import relativedelta
 from langchain_openai import ChatOpenAI
 import tradingagents.dataflows.interface as interface
+from tradingagents.dataflows.utils import parse_date
+from tradingagents.dataflows._cache_db import is_error_result
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.agents.utils.parallel_executor import get_executor
+import asyncio
+import concurrent.futures
+import contextvars
+import inspect
 import json
+import logging
+import re
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
+from types import MappingProxyType
+
+
+tool_logger = logging.getLogger("tradingagents.tools")
+_tool_log_listener = None
+
+
+def enable_background_tool_logging(level=logging.DEBUG, stream=None):
+    """Print tool progress to `stream` (stdout by default) from a background thread.
+
+    Records are handed to a QueueHandler, so a tool call only enqueues its
+    message; formatting and the single write per line happen in a
+    QueueListener thread. Calling this again is a no-op.
+    """
+    global _tool_log_listener
+    if _tool_log_listener is not None:
+        return
+
+    import atexit
+    import logging.handlers
+    import queue
+    import sys
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    _tool_log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _tool_log_listener.start()
+    atexit.register(_tool_log_listener.stop)
+
+    tool_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    tool_logger.setLevel(level)
+    tool_logger.propagate = False
+
+
+class TradingContext(NamedTuple):
+    ticker: Optional[str]
+    curr_date: Optional[str]
+
+
+# Ticker and date of the analysis in progress, set by each analyst before it calls tools
+trading_context = contextvars.ContextVar("trading_context", default=None)
+
+# Tool parameters that fall back to the active TradingContext when omitted
+_CONTEXT_PARAMS = {"ticker": "ticker", "symbol": "ticker", "curr_date": "curr_date"}
+
+
+def with_trading_context(func):
+    """Decorator filling omitted ticker/symbol/curr_date arguments from `trading_context`"""
+    param_names = list(inspect.signature(func).parameters)
+    context_params = [(i, name) for i, name in enumerate(param_names) if name in _CONTEXT_PARAMS]
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = trading_context.get()
+        for position, name in context_params:
+            if position < len(args) or kwargs.get(name) is not None:
+                continue
+            value = getattr(ctx, _CONTEXT_PARAMS[name]) if ctx is not None else None
+            if value is None:
+                raise ValueError(f"'{name}' is required when no trading context is active")
+            kwargs[name] = value
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+# Longest tool output kept in the UI log; full outputs still go to the LLM
+TOOL_OUTPUT_PREVIEW_CHARS = 15000
+
+
+def _trunc(value, limit=100):
+    """Shorten long strings for display; other values (dates, numbers, ...) pass through untouched"""
+    if type(value) is str and len(value) > limit:
+        return value[:limit - 3] + "..."
+    return value
+
+
+def _make_input_summarizer(func):
+    """Build a summarizer specialized to `func`'s parameters, mapping call arguments
+    to parameter names and truncating long strings for display"""
+    # Get function signature to map args to parameter names, once per tool
+    param_names = tuple(inspect.signature(func).parameters)
+
+    def summarize(args, kwargs):
+        input_summary = {name: _trunc(arg) for name, arg in zip(param_names, args)}
+        for key, value in kwargs.items():
+            input_summary[key] = _trunc(value)
+        return input_summary
+
+    return summarize
+
+
+class _LazyInputs:
+    """Defers building the input summary until a log record is actually emitted"""
+
+    __slots__ = ("summarize", "args", "kwargs")
+
+    def __init__(self, summarize, args, kwargs):
+        self.summarize = summarize
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return str(self.summarize(self.args, self.kwargs))
+
+
+# Set TRADINGAGENTS_TOOL_TRACKING=0 to skip tool timing and tracking (e.g. headless backtests)
+TRACKING_ENABLED = os.environ.get("TRADINGAGENTS_TOOL_TRACKING", "1") == "1"
 
 
 def timing_wrapper(analyst_type):
     """Decorator to time function calls and track them for UI display"""
     
     def decorator(func):
+        tool_name = func.__name__
+        summarize_inputs = _make_input_summarizer(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if not TRACKING_ENABLED:
+                return func(*args, **kwargs)
+
             # Start timing
-            start_time = time.time()
-            
-            # Get the function (tool) name
-            tool_name = func.__name__
-            
-            # Format tool inputs for display
-            input_summary = {}
-            
-            # Get function signature to map args to parameter names
-            import inspect
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())
-            
-            # Map positional args to parameter names
-            for i, arg in enumerate(args):
-                if i < len(param_names):
-                    param_name = param_names[i]
-                    # Truncate long string arguments for display
-                    if isinstance(arg, str) and len(arg) > 100:
-                        input_summary[param_name] = arg[:97] + "..."
-                    else:
-                        input_summary[param_name] = arg
-            
-            # Add keyword arguments
-            for key, value in kwargs.items():
-                if isinstance(value, str) and len(value) > 100:
-                    input_summary[key] = value[:97] + "..."
-                else:
-                    input_summary[key] = value
-
-            print(f"[{analyst_type}] 🔧 Starting tool '{tool_name}' with inputs: {input_summary}")
+            start_time = time.perf_counter()
+
+            tool_logger.debug("[%s] Starting tool '%s' with inputs: %s",
+                              analyst_type, tool_name, _LazyInputs(summarize_inputs, args, kwargs))
             
-            # Notify the state management system of tool call execution
             try:
-                from webui.utils.state import app_state
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                
-                # Execute the original function first to get the result
                 result = func(*args, **kwargs)
-                
-                # Calculate execution time
-                elapsed = time.time() - start_time
-                print(f"[{analyst_type}] ✅ Tool '{tool_name}' completed in {elapsed:.2f}s")
-                
-                # Format the result for display (truncate if too long)
-                result_summary = result
-                
-                # Store the complete tool call information including the output
-                tool_call_info = {
-                    "timestamp": timestamp,
-                    "tool_name": tool_name,
-                    "inputs": input_summary,
-                    "output": result_summary,
-                    "execution_time": f"{elapsed:.2f}s",
-                    "status": "success",
-                    "agent_type": analyst_type  # Add agent type for filtering
-                }
-                
-                app_state.tool_calls_log.append(tool_call_info)
-                app_state.tool_calls_count = len(app_state.tool_calls_log)
-                app_state.needs_ui_update = True
-                print(f"[TOOL TRACKER] Registered tool call: {tool_name} for {analyst_type} (Total: {app_state.tool_calls_count})")
-                
-                return result
-                
             except Exception as e:
-                elapsed = time.time() - start_time
-                print(f"[{analyst_type}] ❌ Tool '{tool_name}' failed after {elapsed:.2f}s: {str(e)}")
-                
-                # Store the failed tool call information
-                try:
-                    from webui.utils.state import app_state
-                    import datetime
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                    
-                    tool_call_info = {
-                        "timestamp": timestamp,
-                        "tool_name": tool_name,
-                        "inputs": input_summary,
-                        "output": f"ERROR: {str(e)}",
-                        "execution_time": f"{elapsed:.2f}s",
-                        "status": "error",
-                        "agent_type": analyst_type  # Add agent type for filtering
-                    }
-                    
-                    app_state.tool_calls_log.append(tool_call_info)
-                    app_state.tool_calls_count = len(app_state.tool_calls_log)
-                    app_state.needs_ui_update = True
-                    print(f"[TOOL TRACKER] Registered failed tool call: {tool_name} for {analyst_type} (Total: {app_state.tool_calls_count})")
-                except Exception as track_error:
-                    print(f"[TOOL TRACKER] Failed to track failed tool call: {track_error}")
-                
+                elapsed = time.perf_counter() - start_time
+                tool_logger.warning("[%s] Tool '%s' failed after %.2fs: %s",
+                                    analyst_type, tool_name, elapsed, e)
+                _track_tool_call(analyst_type, tool_name, summarize_inputs, args, kwargs,
+                                 f"ERROR: {str(e)}", elapsed, "error")
                 raise  # Re-raise the exception
-                
+
+            elapsed = time.perf_counter() - start_time
+            tool_logger.debug("[%s] Tool '%s' completed in %.2fs", analyst_type, tool_name, elapsed)
+            _track_tool_call(analyst_type, tool_name, summarize_inputs, args, kwargs,
+                             result, elapsed, "success")
+            return result
+
+        # Lets Toolkit.tools_for pick out the tools belonging to an analyst
+        wrapper._analyst_type = analyst_type
+        return wrapper
+    return decorator
+
+
+class _NullState:
+    """Stand-in for the web UI state when running headless: tool calls are dropped"""
+
+    tool_calls_count = 0
+
+    def record_tool_call(self, tool_call_info):
+        pass
+
+
+_app_state = None
+
+
+def _get_app_state():
+    """Return the web UI state, importing it on first use only.
+
+    The import cannot happen at module load: webui's package init pulls in
+    the Dash app, which imports this module back. Falls back to a _NullState
+    when the web UI is not available.
+    """
+    global _app_state
+    if _app_state is None:
+        try:
+            from webui.utils.state import app_state
+            _app_state = app_state
+        except ImportError:
+            _app_state = _NullState()
+    return _app_state
+
+
+def _track_tool_call(analyst_type, tool_name, summarize_inputs, args, kwargs, output, elapsed, status):
+    """Register a tool call with the web UI state, if the UI is available"""
+    if _prefetching.get():
+        # Speculative calls are only shown once the agent actually asks for them
+        return
+    app_state = _get_app_state()
+    if isinstance(app_state, _NullState):
+        return
+    try:
+        timestamp = time.strftime("%H:%M:%S")
+
+        # Store the complete tool call information including the output
+        tool_call_info = {
+            "timestamp": timestamp,
+            "tool_name": tool_name,
+            "inputs": summarize_inputs(args, kwargs),
+            "output": _trunc(output if type(output) is str else str(output), TOOL_OUTPUT_PREVIEW_CHARS),
+            "execution_time": elapsed,  # seconds, formatted by the UI
+            "status": status,
+            "agent_type": analyst_type  # Add agent type for filtering
+        }
+
+        app_state.record_tool_call(tool_call_info)
+        tool_logger.debug("[TOOL TRACKER] Registered %s tool call: %s for %s (Total: %s)",
+                          status, tool_name, analyst_type, app_state.tool_calls_count)
+    except Exception as track_error:
+        tool_logger.warning("[TOOL TRACKER] Failed to track tool call: %s", track_error)
+
+
+# Time-to-live (seconds) of cached tool results, per data cadence
+TOOL_CACHE_TTLS = {
+    "quotes": 60,                   # prices, bars and indicators
+    "news": 60 * 60,                # news, sentiment and macro reports
+    "financials": 7 * 24 * 60 * 60,  # statements, insider data and earnings
+}
+TOOL_CACHE_MAXSIZE = 256
+
+_tool_cache = OrderedDict()
+_tool_cache_lock = threading.Lock()
+
+
+def cached_tool(ttl_category):
+    """Decorator to memoize tool results for the TTL of their data category
+
+    The same tool is often re-invoked with identical arguments during a run
+    (debate rounds, retries, several analysts), so identical calls within the
+    TTL are answered from memory instead of hitting the upstream API again.
+    Error messages are not stored, so a transient failure is retried next call.
+    """
+    ttl = TOOL_CACHE_TTLS[ttl_category]
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arguments cannot be cached
+                return func(*args, **kwargs)
+
+            now = time.monotonic()
+            with _tool_cache_lock:
+                entry = _tool_cache.get(key)
+                if entry is not None and entry[0] > now:
+                    _tool_cache.move_to_end(key)
+                    return entry[1]
+
+            result = func(*args, **kwargs)
+            if is_error_result(result):
+                return result
+
+            with _tool_cache_lock:
+                _tool_cache[key] = (now + ttl, result)
+                _tool_cache.move_to_end(key)
+                while len(_tool_cache) > TOOL_CACHE_MAXSIZE:
+                    _tool_cache.popitem(last=False)
+            return result
+
         return wrapper
     return decorator
 
@@ -132,28 +299,457 @@ def create_msg_delete():
     return delete_messages
 
 
+def create_msg_prune(max_messages=20, keep_first=True):
+    def prune_messages(state):
+        """Keep the opening message and the most recent `max_messages` messages, removing the rest"""
+        messages = state["messages"]
+        window = list(messages[-max_messages:]) if max_messages > 0 else []
+
+        # A tool result cannot open the window without the AI message that requested it
+        while window and isinstance(window[0], ToolMessage):
+            window.pop(0)
+
+        keep = {m.id for m in window}
+        if keep_first and messages:
+            keep.add(messages[0].id)
+        return {"messages": [RemoveMessage(id=m.id) for m in messages if m.id not in keep]}
+
+    return prune_messages
+
+
+def _parse_tool_call(tool_call):
+    """Return (tool_name, tool_args) for a raw or LangChain tool call"""
+    if isinstance(tool_call, dict):
+        tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
+        tool_args = tool_call.get("args", {}) or tool_call.get("function", {}).get("arguments", {})
+        if isinstance(tool_args, str):
+            try:
+                tool_args = json.loads(tool_args)
+            except json.JSONDecodeError:
+                tool_args = {}
+    else:
+        # Handle LangChain ToolCall objects
+        tool_name = getattr(tool_call, 'name', None)
+        tool_args = getattr(tool_call, 'args', {})
+    return tool_name, tool_args
+
+
+def _find_tool(tools, tool_name, agent_label):
+    """Return the tool named `tool_name`, or None (with a warning) if it is not bound"""
+    tool_fn = next((t for t in tools if t.name == tool_name), None)
+    if tool_fn is None:
+        print(f"[{agent_label}] ⚠️ Tool '{tool_name}' not found.")
+    return tool_fn
+
+
+def _run_tool_call(tools, tool_call, agent_label):
+    """Run a single tool call, returning (tool_call, tool_name, tool_result, succeeded)"""
+    tool_name, tool_args = _parse_tool_call(tool_call)
+
+    # Find the matching tool by name
+    tool_fn = _find_tool(tools, tool_name, agent_label)
+
+    if tool_fn is None:
+        return tool_call, tool_name, f"Tool '{tool_name}' not found.", False
+
+    try:
+        # LangChain Tool objects expose `.run` (string IO) as well as `.invoke` (dict/kwarg IO)
+        if hasattr(tool_fn, "invoke"):
+            tool_result = tool_fn.invoke(tool_args)
+        else:
+            tool_result = tool_fn.run(**tool_args)
+    except Exception as tool_err:
+        return tool_call, tool_name, f"Error running tool '{tool_name}': {str(tool_err)}", False
+
+    return tool_call, tool_name, tool_result, True
+
+
+# Tools an analyst usually calls next after a given one, on the same ticker and
+# date. Only tools whose other arguments all have defaults can be prefetched.
+PREFETCH_MAP = {
+    "get_macro_analysis": ["get_economic_indicators", "get_yield_curve_analysis"],
+    "get_economic_indicators": ["get_yield_curve_analysis", "get_macro_analysis"],
+    "get_stock_data_table": ["get_indicators_table"],
+    "get_fundamentals_openai": ["get_earnings_surprise_analysis", "get_finnhub_company_insider_sentiment"],
+    "get_finnhub_company_insider_sentiment": ["get_finnhub_company_insider_transactions"],
+}
+
+# Set inside speculative calls so they are not tracked as agent tool calls
+_prefetching = contextvars.ContextVar("prefetching", default=False)
+_pending_prefetches = {}
+_pending_prefetches_lock = threading.Lock()
+
+
+def _prefetch(tool_fn):
+    """Run a tool with arguments from the trading context, warming the tool caches"""
+    _prefetching.set(True)
+    try:
+        tool_fn.invoke({})
+    except Exception as e:
+        tool_logger.debug("Prefetch of '%s' failed: %s", tool_fn.name, e)
+
+
+def _start_prefetches(tools, tool_names, agent_label):
+    """Speculatively run the likely next tools of an agent while its LLM is thinking.
+
+    The results land in the tool caches, so the follow-up call, if it comes,
+    returns immediately. Prefetches still queued when the agent's next turn
+    starts are cancelled.
+    """
+    if trading_context.get() is None:
+        return
+
+    bound = {t.name: t for t in tools}
+    candidates = dict.fromkeys(
+        partner for name in tool_names for partner in PREFETCH_MAP.get(name, ())
+        if partner in bound and partner not in tool_names
+    )
+    executor = get_executor("PREFETCH")
+    futures = [executor.submit(_prefetch, bound[name]) for name in candidates]
+    with _pending_prefetches_lock:
+        _pending_prefetches[agent_label] = futures
+
+
+def _cancel_prefetches(agent_label):
+    """Drop the agent's prefetches that have not started yet"""
+    with _pending_prefetches_lock:
+        futures = _pending_prefetches.pop(agent_label, ())
+    for future in futures:
+        future.cancel()
+
+
+def execute_tool_calls(tools, tool_calls, agent_label="TOOLS"):
+    """Execute the tool calls requested by an LLM in a single turn.
+
+    The tools are independent network-bound lookups, so they are dispatched
+    concurrently on the agent's ParallelToolExecutor and the wall time is
+    that of the slowest call rather than the sum. Results come back in the
+    order of ``tool_calls`` as (tool_call, tool_name, tool_result, succeeded)
+    tuples, where ``succeeded`` is False when the tool was unknown or raised.
+    """
+    tool_calls = list(tool_calls)
+    _cancel_prefetches(agent_label)
+    if len(tool_calls) <= 1:
+        results = [_run_tool_call(tools, tool_call, agent_label) for tool_call in tool_calls]
+    else:
+        results = get_executor(agent_label).map(
+            lambda tool_call: _run_tool_call(tools, tool_call, agent_label), tool_calls
+        )
+
+    _start_prefetches(tools, {tool_name for _, tool_name, _, _ in results}, agent_label)
+    return results
+
+
+async def _arun_tool_call(tools, tool_call, agent_label):
+    """Async counterpart of _run_tool_call, awaiting the tool's `ainvoke`"""
+    tool_name, tool_args = _parse_tool_call(tool_call)
+
+    tool_fn = _find_tool(tools, tool_name, agent_label)
+    if tool_fn is None:
+        return tool_call, tool_name, f"Tool '{tool_name}' not found.", False
+
+    try:
+        tool_result = await tool_fn.ainvoke(tool_args)
+    except Exception as tool_err:
+        return tool_call, tool_name, f"Error running tool '{tool_name}': {str(tool_err)}", False
+
+    return tool_call, tool_name, tool_result, True
+
+
+async def aexecute_tool_calls(tools, tool_calls, agent_label="TOOLS"):
+    """Execute one turn's tool calls from async code, overlapping them with asyncio.gather.
+
+    Same results as execute_tool_calls, for drivers that already run an
+    event loop (e.g. `graph.ainvoke`) and should not block it.
+    """
+    return list(await asyncio.gather(
+        *(_arun_tool_call(tools, tool_call, agent_label) for tool_call in tool_calls)
+    ))
+
+
+class lazy_tool:
+    """Toolkit attribute that builds its LangChain tool on first access.
+
+    Turning a function into a StructuredTool infers a pydantic schema from
+    its signature; deferring that means importing the Toolkit only pays for
+    the tools a run actually uses. Class and instance access both return the
+    same tool, like the @staticmethod @tool pair it replaces.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self._tool = None
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner=None):
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    self._tool = tool(self.func)
+        return self._tool
+
+
+# Pooled ChatOpenAI clients unused for this long (seconds) are dropped
+LLM_POOL_IDLE_TTL = 30 * 60
+
+# Indicators of get_indicators_table, optimized for EOD trading
+_TABLE_INDICATORS = (
+    'close_8_ema',      # 8-day EMA (faster trend detection for EOD)
+    'close_21_ema',     # 21-day EMA (key swing level)
+    'close_50_sma',     # 50-day SMA (major trend)
+    'rsi_14',           # 14-day RSI (optimal for daily signals)
+    'macd',             # MACD Line (12,26,9 default)
+    'macds',            # MACD Signal Line
+    'macdh',            # MACD Histogram
+    'boll_ub',          # Bollinger Upper (20,2 default)
+    'boll_lb',          # Bollinger Lower (20,2 default)
+    'kdjk_9',           # Stochastic %K (9-period for EOD)
+    'kdjd_9',           # Stochastic %D (9-period for EOD)
+    'wr_14',            # Williams %R (14-period)
+    'atr_14',           # ATR (14-period for position sizing)
+    'obv',              # On-Balance Volume (volume confirmation)
+)
+_TABLE_HEADER = "\n".join([
+    "| Date | " + " | ".join(ind.replace('_', ' ').title() for ind in _TABLE_INDICATORS) + " |",
+    "|------|" + "|".join("------" for _ in _TABLE_INDICATORS) + "|",
+])
+_TABLE_FOOTER = "\n".join([
+    "",
+    "## Key EOD Trading Signals Analysis:",
+    "- **Trend Structure:** 8-EMA > 21-EMA > 50-SMA = Strong uptrend | Price above all EMAs = Bullish",
+    "- **Momentum:** RSI 30-50 = Accumulation zone | RSI 50-70 = Trending | RSI >70 = Overbought",
+    "- **MACD Signals:** MACD > Signal = Bullish momentum | Histogram growing = Acceleration",
+    "- **Bollinger Bands:** Price at Upper Band = Breakout potential | Price at Lower Band = Support test",
+    "- **Stochastic:** %K crossing above %D in oversold (<20) = Buy signal | In overbought (>80) = Sell signal",
+    "- **Williams %R:** Values -20 to -80 = Normal range | Below -80 = Oversold (buy) | Above -20 = Overbought (sell)",
+    "- **ATR:** Use for position sizing (1-2x ATR for stop loss) | Higher ATR = More volatile",
+    "",
+    "**EOD Strategy:** Look for trend + momentum + volume confirmation for overnight positions",
+])
+
+# Value formatters of the indicator reports, keyed by indicator; others use two decimals
+_INDICATOR_FORMATS = {
+    'rsi_14': "{:.1f}".format,
+    'kdjk_9': "{:.1f}".format,
+    'kdjd_9': "{:.1f}".format,
+    'wr_14': "{:.1f}".format,
+    'macd': "{:.3f}".format,
+    'macds': "{:.3f}".format,
+    'macdh': "{:.3f}".format,
+}
+_DEFAULT_INDICATOR_FORMAT = "{:.2f}".format
+
+# Formatter of each get_indicators_table column, bound once
+_TABLE_FORMATS = tuple(_INDICATOR_FORMATS.get(ind, _DEFAULT_INDICATOR_FORMAT) for ind in _TABLE_INDICATORS)
+
+# Number of most recent trading days shown by get_indicators_table
+INDICATORS_TABLE_DAYS = 25
+
+
+@functools.lru_cache(maxsize=64)
+def _recent_trading_days(curr_date: str, look_back_days: int, count: int = INDICATORS_TABLE_DAYS) -> tuple:
+    """Return the last `count` weekdays within `look_back_days` of `curr_date`, oldest first"""
+    curr_d = parse_date(curr_date)
+    days = pd.bdate_range(start=curr_d - timedelta(days=look_back_days), end=curr_d)
+    return tuple(days[-count:].strftime("%Y-%m-%d"))
+
+
+def _format_indicator(indicator, value) -> str:
+    """Format a raw indicator value for the LLM, "N/A" when it is missing"""
+    if pd.isna(value):
+        return "N/A"
+    return _INDICATOR_FORMATS.get(indicator, _DEFAULT_INDICATOR_FORMAT)(value)
+
+
+# Indicators of the comprehensive ('all') technical report
+_KEY_INDICATORS = (
+    'close_10_ema',     # 10-day Exponential Moving Average
+    'close_20_sma',     # 20-day Simple Moving Average
+    'close_50_sma',     # 50-day Simple Moving Average
+    'rsi_14',           # 14-day Relative Strength Index
+    'macd',             # Moving Average Convergence Divergence
+    'boll_ub',          # Bollinger Bands Upper Band
+    'boll_lb',          # Bollinger Bands Lower Band
+    'volume_delta',     # Volume Delta
+)
+_PRETTY_NAMES = {ind: ind.replace('_', ' ').title() for ind in _KEY_INDICATORS}
+_EOD_FOOTER = "\n".join([
+    "",
+    "",
+    "## EOD Trading Analysis",
+    "These indicators provide key signals for end-of-day trading decisions:",
+    "- **EMAs/SMAs:** Trend direction and support/resistance levels",
+    "- **RSI:** Overbought (>70) or oversold (<30) conditions",
+    "- **MACD:** Momentum and trend change signals",
+    "- **Bollinger Bands:** Volatility and price extremes",
+])
+
+
 class Toolkit:
-    _config = DEFAULT_CONFIG.copy()
+    # Tools are static; an instance only carries its own config overrides
+    __slots__ = ("_instance_config",)
+
+    # Read-only defaults for instances created without a config
+    _config = MappingProxyType(DEFAULT_CONFIG.copy())
+    _llm_pool = {}
+    _llm_pool_lock = threading.Lock()
 
     @classmethod
-    def update_config(cls, config):
-        """Update the class-level configuration."""
-        cls._config.update(config)
+    def get_llm(cls, **llm_kwargs):
+        """Return a shared ChatOpenAI client for these settings, creating it on first use.
+
+        Every graph built by the web UI or CLI asks for the same few models, so
+        reusing the client keeps its HTTP connection pool warm across runs.
+        """
+        key = tuple(sorted(llm_kwargs.items()))
+        now = time.monotonic()
+        with cls._llm_pool_lock:
+            # Evict clients that have sat idle past the TTL
+            for stale_key in [k for k, (_, last_used) in cls._llm_pool.items()
+                              if now - last_used > LLM_POOL_IDLE_TTL]:
+                del cls._llm_pool[stale_key]
+
+            entry = cls._llm_pool.get(key)
+            llm = entry[0] if entry is not None else ChatOpenAI(**llm_kwargs)
+            cls._llm_pool[key] = (llm, now)
+        return llm
 
     @property
     def config(self):
-        """Access the configuration."""
-        return self._config
+        """Access the configuration (read-only)."""
+        return self._instance_config
 
     def __init__(self, config=None):
-        if config:
-            self.update_config(config)
+        # Each instance gets its own frozen config; nothing shared is ever mutated
+        self._instance_config = MappingProxyType({**self._config, **config}) if config else self._config
+
+    @classmethod
+    def tools_for(cls, analyst_type):
+        """Return the tools tagged with `analyst_type` by @timing_wrapper, in definition order."""
+        analyst_type = analyst_type.upper()
+        tools = []
+        for name, attr in vars(cls).items():
+            # Match on the raw function so tools of other analysts are not built
+            if isinstance(attr, lazy_tool) and getattr(attr.func, "_analyst_type", None) == analyst_type:
+                tools.append(getattr(cls, name))
+        return tools
+
+    @staticmethod
+    def fetch_many(tool, symbols, **kwargs):
+        """
+        Run one tool for several symbols concurrently.
+        Args:
+            tool: A Toolkit tool (e.g. Toolkit.get_alpaca_data) or a plain callable taking the symbol first
+            symbols (list): Ticker symbols to fetch
+            **kwargs: Remaining arguments shared by every call (e.g. start_date, end_date)
+        Returns:
+            dict: {symbol: result}; a failed symbol maps to an "Error: ..." string
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        if hasattr(tool, "invoke"):
+            # LangChain tools take a single dict; the symbol is their first argument
+            symbol_arg = next(iter(tool.args))
+            call = lambda symbol: tool.invoke({symbol_arg: symbol, **kwargs})
+        else:
+            call = lambda symbol: tool(symbol, **kwargs)
+
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(symbols), 16)) as executor:
+            futures = {executor.submit(call, symbol): symbol for symbol in symbols}
+            for future in concurrent.futures.as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    results[symbol] = f"Error: {str(e)}"
+
+        # Keep the caller's symbol order
+        return {symbol: results[symbol] for symbol in symbols}
 
     @staticmethod
-    @tool
+    def run_batch(tool_specs, tools):
+        """
+        Run several independent Toolkit tools concurrently.
+        Args:
+            tool_specs (list): (tool name, arguments dict) pairs, e.g. [("get_macro_analysis", {"curr_date": "2025-01-02"})]
+            tools (list): The calling agent's tools; any other name is rejected as unknown
+        Returns:
+            dict: {tool name: result} in request order; a repeated tool gets a "#2", "#3", ... suffix
+                  and a failed call maps to an "Error: ..." string
+        """
+        allowed = {t.name: t for t in tools if t.name != "run_tools_in_parallel"}
+
+        def run(spec):
+            name, args = spec
+            batch_tool = allowed.get(name)
+            if batch_tool is None:
+                return f"Error: unknown tool '{name}'"
+            try:
+                return batch_tool.invoke(args or {})
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        tool_specs = list(tool_specs)
+        # A separate pool from the agents' so a batch issued from a tool call cannot starve itself
+        outputs = get_executor("BATCH").map(run, tool_specs)
+
+        results = {}
+        for (name, _), output in zip(tool_specs, outputs):
+            key, n = name, 1
+            while key in results:
+                n += 1
+                key = f"{name}#{n}"
+            results[key] = output
+        return results
+
+    @staticmethod
+    def parallel_tool(tools):
+        """Return a run_tools_in_parallel tool that can only dispatch to `tools`.
+
+        Each agent gets its own, so batching cannot reach tools (e.g. the paid
+        OpenAI lookups) that were trimmed from that agent's tool set.
+        """
+        tools = list(tools)
+
+        def run_tools_in_parallel(
+            tool_calls: Annotated[
+                list,
+                'Independent tool calls as objects {"name": tool name, "args": {argument: value}}',
+            ],
+        ) -> str:
+            """
+            Run several independent data tools at once and return all of their reports. Prefer this over calling such tools one at a time when none of them needs another's output (e.g. macro analysis, economic indicators and yield curve, or several news sources). Only your other tools can be called.
+            Args:
+                tool_calls (list): Objects {"name": tool name, "args": {argument: value}}; ticker and curr_date may be omitted
+            Returns:
+                str: Every tool's report under a heading with its name
+            """
+            specs = [(call.get("name", ""), call.get("args") or {}) for call in tool_calls]
+            results = Toolkit.run_batch(specs, tools)
+            return "\n\n".join(f"## {name}\n{output}" for name, output in results.items())
+
+        return tool(run_tools_in_parallel)
+
+    @staticmethod
+    def split_batch_report(report, tools):
+        """Split a run_tools_in_parallel report back into {tool name: output}.
+
+        Only headings naming one of `tools`, or a rejected unknown tool, start a
+        section, so markdown headings inside the reports themselves are left alone.
+        """
+        names = "|".join(re.escape(t.name) for t in tools)
+        parts = re.split(rf"^## ((?:{names})(?:#\d+)?|\S+(?=\nError: unknown tool))\n", report, flags=re.M)
+        return {name: output.rstrip("\n") for name, output in zip(parts[1::2], parts[2::2])}
+
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("NEWS")
+    @cached_tool("news")
     def get_reddit_news(
-        curr_date: Annotated[str, "Date you want to get news for in yyyy-mm-dd format"],
+        curr_date: Annotated[Optional[str], "Date you want to get news for in yyyy-mm-dd format"] = None,
     ) -> str:
         """
         Retrieve global news from Reddit within a specified time frame.
@@ -167,9 +763,9 @@ class Toolkit:
 
         return global_news_result
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("NEWS")
+    @cached_tool("news")
     def get_finnhub_news(
         ticker: Annotated[
             str,
@@ -188,27 +784,24 @@ class Toolkit:
             str: A formatted dataframe containing news about the company within the date range from start_date to end_date
         """
 
-        end_date_str = end_date
-
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        look_back_days = (end_date - start_date).days
+        look_back_days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days
 
         finnhub_news_result = interface.get_finnhub_news(
-            ticker, end_date_str, look_back_days
+            ticker, end_date, look_back_days
         )
 
         return finnhub_news_result
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("SOCIAL")
+    @cached_tool("news")
     def get_reddit_stock_info(
         ticker: Annotated[
-            str,
+            Optional[str],
             "Ticker of a company. e.g. AAPL, TSM",
-        ],
-        curr_date: Annotated[str, "Current date you want to get news for"],
+        ] = None,
+        curr_date: Annotated[Optional[str], "Current date you want to get news for"] = None,
     ) -> str:
         """
         Retrieve the latest news about a given stock from Reddit, given the current date.
@@ -223,9 +816,9 @@ class Toolkit:
 
         return stock_news_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_alpaca_data(
         symbol: Annotated[str, "ticker symbol of the company"],
         start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -247,9 +840,9 @@ class Toolkit:
 
         return result_data
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_stockstats_indicators_report(
         symbol: Annotated[str, "ticker symbol of the company"],
         indicator: Annotated[
@@ -277,9 +870,9 @@ class Toolkit:
 
         return result_stockstats
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_stockstats_indicators_report_online(
         symbol: Annotated[str, "ticker symbol of the company"],
         indicator: Annotated[
@@ -303,44 +896,15 @@ class Toolkit:
 
         if indicator.lower() == 'all':
             # Handle comprehensive indicator report
-            key_indicators = [
-                'close_10_ema',     # 10-day Exponential Moving Average
-                'close_20_sma',     # 20-day Simple Moving Average  
-                'close_50_sma',     # 50-day Simple Moving Average
-                'rsi_14',           # 14-day Relative Strength Index
-                'macd',             # Moving Average Convergence Divergence
-                'boll_ub',          # Bollinger Bands Upper Band
-                'boll_lb',          # Bollinger Bands Lower Band
-                'volume_delta'      # Volume Delta
-            ]
-            
-            results = []
-            results.append(f"# Comprehensive Technical Indicators Report for {symbol} on {curr_date}")
-            results.append("")
-            
-            for ind in key_indicators:
-                try:
-                    result = interface.get_stockstats_indicator(symbol, ind, curr_date, True)
-                    # Clean up the result format
-                    if result.startswith(f"## {ind} for"):
-                        # Extract just the value part
-                        value_part = result.split(": ")[-1]
-                        indicator_name = ind.replace('_', ' ').title()
-                        results.append(f"**{indicator_name}:** {value_part}")
-                    else:
-                        results.append(f"**{ind}:** {result}")
-                except Exception as e:
-                    results.append(f"**{ind}:** Error - {str(e)}")
-            
-            results.append("")
-            results.append("## EOD Trading Analysis")
-            results.append("These indicators provide key signals for end-of-day trading decisions:")
-            results.append("- **EMAs/SMAs:** Trend direction and support/resistance levels")
-            results.append("- **RSI:** Overbought (>70) or oversold (<30) conditions")  
-            results.append("- **MACD:** Momentum and trend change signals")
-            results.append("- **Bollinger Bands:** Volatility and price extremes")
-            
-            return "\n".join(results)
+            lines = [f"# Comprehensive Technical Indicators Report for {symbol} on {curr_date}", ""]
+
+            # Compute every indicator from one (cached) indicator frame; the raw
+            # values are only turned into text here
+            frame = interface.get_stock_stats_indicators_frame(symbol, _KEY_INDICATORS, [curr_date])
+            for ind, value in zip(_KEY_INDICATORS, frame.iloc[0]):
+                lines.append(f"**{_PRETTY_NAMES[ind]}:** {_format_indicator(ind, value)}")
+
+            return "\n".join(lines) + _EOD_FOOTER
         else:
             # For single indicator, use the existing method
             result_stockstats = interface.get_stockstats_indicator(
@@ -348,15 +912,16 @@ class Toolkit:
             )
             return result_stockstats
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_finnhub_company_insider_sentiment(
-        ticker: Annotated[str, "ticker symbol for the company"],
+        ticker: Annotated[Optional[str], "ticker symbol for the company"] = None,
         curr_date: Annotated[
-            str,
+            Optional[str],
             "current date of you are trading at, yyyy-mm-dd",
-        ],
+        ] = None,
     ):
         """
         Retrieve insider sentiment information about a company (retrieved from public SEC information) for the past 30 days
@@ -373,15 +938,16 @@ class Toolkit:
 
         return data_sentiment
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_finnhub_company_insider_transactions(
-        ticker: Annotated[str, "ticker symbol"],
+        ticker: Annotated[Optional[str], "ticker symbol"] = None,
         curr_date: Annotated[
-            str,
+            Optional[str],
             "current date you are trading at, yyyy-mm-dd",
-        ],
+        ] = None,
     ):
         """
         Retrieve insider transaction information about a company (retrieved from public SEC information) for the past 30 days
@@ -398,9 +964,9 @@ class Toolkit:
 
         return data_trans
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_simfin_balance_sheet(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -423,9 +989,9 @@ class Toolkit:
 
         return data_balance_sheet
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_simfin_cashflow(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -448,10 +1014,11 @@ class Toolkit:
 
         return data_cashflow
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
+    @cached_tool("news")
     def get_coindesk_news(
-        ticker: Annotated[str, "Ticker symbol, e.g. 'BTCUSD', 'ETH', etc."],
+        ticker: Annotated[Optional[str], "Ticker symbol, e.g. 'BTCUSD', 'ETH', etc."] = None,
         num_sentences: Annotated[int, "Number of sentences to include from news body."] = 5,
     ):
         """
@@ -468,9 +1035,9 @@ class Toolkit:
         """
         return interface.get_coindesk_news(ticker, num_sentences)
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_simfin_income_stmt(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -495,9 +1062,9 @@ class Toolkit:
 
         return data_income_stmt
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("NEWS")
+    @cached_tool("news")
     def get_google_news(
         query: Annotated[str, "Query to search with"],
         curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -516,12 +1083,13 @@ class Toolkit:
 
         return google_news_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("SOCIAL")
+    @cached_tool("news")
     def get_stock_news_openai(
-        ticker: Annotated[str, "the company's ticker"],
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        ticker: Annotated[Optional[str], "the company's ticker"] = None,
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
     ):
         """
         Retrieve the latest news about a given stock by using OpenAI's news API.
@@ -536,11 +1104,12 @@ class Toolkit:
 
         return openai_news_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("NEWS")
+    @cached_tool("news")
     def get_global_news_openai(
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
     ):
         """
         Retrieve the latest macroeconomics news on a given date using OpenAI's macroeconomics news API.
@@ -554,12 +1123,13 @@ class Toolkit:
 
         return openai_news_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("news")
     def get_fundamentals_openai(
-        ticker: Annotated[str, "the company's ticker"],
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        ticker: Annotated[Optional[str], "the company's ticker"] = None,
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
     ):
         """
         Retrieve the latest fundamental information about a given stock on a given date by using OpenAI's news API.
@@ -576,9 +1146,9 @@ class Toolkit:
 
         return openai_fundamentals_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_earnings_calendar(
         ticker: Annotated[str, "Stock or crypto ticker symbol"],
         start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -604,12 +1174,13 @@ class Toolkit:
         
         return earnings_calendar_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("financials")
     def get_earnings_surprise_analysis(
-        ticker: Annotated[str, "Stock ticker symbol"],
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        ticker: Annotated[Optional[str], "Stock ticker symbol"] = None,
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
         lookback_quarters: Annotated[int, "Number of quarters to analyze"] = 8,
     ) -> str:
         """
@@ -631,11 +1202,12 @@ class Toolkit:
         
         return earnings_surprise_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("MACRO")
+    @cached_tool("news")
     def get_macro_analysis(
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
         lookback_days: Annotated[int, "Number of days to look back for data"] = 90,
     ) -> str:
         """
@@ -656,10 +1228,12 @@ class Toolkit:
         
         return macro_analysis_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
+    @timing_wrapper("MACRO")
+    @cached_tool("news")
     def get_economic_indicators(
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
         lookback_days: Annotated[int, "Number of days to look back for data"] = 90,
     ) -> str:
         """
@@ -679,10 +1253,12 @@ class Toolkit:
         
         return economic_indicators_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
+    @timing_wrapper("MACRO")
+    @cached_tool("news")
     def get_yield_curve_analysis(
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
     ) -> str:
         """
         Retrieve Treasury yield curve analysis including inversion signals and recession indicators.
@@ -698,11 +1274,12 @@ class Toolkit:
         
         return yield_curve_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("FUNDAMENTALS")
+    @cached_tool("news")
     def get_defillama_fundamentals(
-        ticker: Annotated[str, "Crypto ticker symbol (without USD/USDT suffix)"],
+        ticker: Annotated[Optional[str], "Crypto ticker symbol (without USD/USDT suffix)"] = None,
         lookback_days: Annotated[int, "Number of days to look back for data"] = 30,
     ):
         """
@@ -724,8 +1301,9 @@ class Toolkit:
         
         return defillama_results
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_alpaca_data_report(
         symbol: Annotated[str, "ticker symbol of the company"],
         curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -749,12 +1327,13 @@ class Toolkit:
 
         return result_alpaca
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_stock_data_table(
-        symbol: Annotated[str, "ticker symbol of the company"],
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        symbol: Annotated[Optional[str], "ticker symbol of the company"] = None,
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
         look_back_days: Annotated[int, "how many days to look back"] = 90,
         timeframe: Annotated[str, "Timeframe for data: 1Min, 5Min, 15Min, 1Hour, 1Day"] = "1Day",
     ) -> str:
@@ -772,44 +1351,33 @@ class Toolkit:
             str: A comprehensive table containing Date, OHLCV, VWAP data for the lookback period
         """
 
-        # Get the raw data from the interface
-        raw_result = interface.get_alpaca_data_window(
-            symbol, curr_date, look_back_days, timeframe
-        )
-        
-        # Parse and reformat the timestamp column to be more readable
-        import re
-        
         try:
-            # Use regex to replace complex timestamps with simple dates
-            # Pattern: 2025-07-08 04:00:00+00:00 -> 2025-07-08
-            timestamp_pattern = r'(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}:\d{2}[+\-]\d{2}:\d{2}'
-            
-            # Replace the header line
-            result = raw_result.replace('timestamp', 'Date')
-            
-            # Replace all timestamp values with just the date
-            result = re.sub(timestamp_pattern, r'\1', result)
-            
-            # Also clean up any remaining timezone info
-            result = re.sub(r'\s+\d{2}:\d{2}:\d{2}[+\-]\d{2}:\d{2}', '', result)
-            
-            # Update the title
-            result = result.replace('Stock data for', 'Stock Data Table for')
-            result = result.replace('from 2025-', f'({look_back_days}-day lookback)\nFrom 2025-')
-            
-            return result
-                
+            start_date, data = interface.get_alpaca_data_window_df(
+                symbol, curr_date, look_back_days, timeframe
+            )
         except Exception as e:
-            # Fallback to original if any processing fails
-            return raw_result
+            return f"Error getting stock data for {symbol}: {str(e)}"
+        
+        if data.empty:
+            return f"No data found for {symbol} from {start_date} to present"
+        
+        # Replace the full timestamps with readable dates (keeping the time for intraday bars)
+        date_format = "%Y-%m-%d" if timeframe == "1Day" else "%Y-%m-%d %H:%M"
+        data.insert(0, "Date", pd.to_datetime(data.pop("timestamp"), utc=True).dt.strftime(date_format))
+        
+        result = f"## Stock Data Table for {symbol} ({look_back_days}-day lookback)\nFrom {start_date} to present:\n\n"
+        result += data.to_csv(index=False, float_format="%.4f")
+        result += interface.get_alpaca_latest_quote_text(symbol)
+        
+        return result
 
-    @staticmethod
-    @tool
+    @lazy_tool
+    @with_trading_context
     @timing_wrapper("MARKET")
+    @cached_tool("quotes")
     def get_indicators_table(
-        symbol: Annotated[str, "ticker symbol of the company"],
-        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+        symbol: Annotated[Optional[str], "ticker symbol of the company"] = None,
+        curr_date: Annotated[Optional[str], "Current date in yyyy-mm-dd format"] = None,
         look_back_days: Annotated[int, "how many days to look back"] = 90,
     ) -> str:
         """
@@ -826,105 +1394,34 @@ class Toolkit:
             str: A comprehensive table containing Date and all technical indicators for the lookback period
         """
         
-        # Define the key indicators optimized for EOD trading
-        key_indicators = [
-            'close_8_ema',      # 8-day EMA (faster trend detection for EOD)
-            'close_21_ema',     # 21-day EMA (key swing level)
-            'close_50_sma',     # 50-day SMA (major trend)
-            'rsi_14',           # 14-day RSI (optimal for daily signals)
-            'macd',             # MACD Line (12,26,9 default)
-            'macds',            # MACD Signal Line
-            'macdh',            # MACD Histogram
-            'boll_ub',          # Bollinger Upper (20,2 default)
-            'boll_lb',          # Bollinger Lower (20,2 default)
-            'kdjk_9',           # Stochastic %K (9-period for EOD)
-            'kdjd_9',           # Stochastic %D (9-period for EOD)
-            'wr_14',            # Williams %R (14-period)
-            'atr_14',           # ATR (14-period for position sizing)
-            'obv'               # On-Balance Volume (volume confirmation)
-        ]
-        
-        # Get indicator data for each indicator across the time window
-        import pandas as pd
-        from datetime import datetime, timedelta
+        key_indicators = _TABLE_INDICATORS
         
         # Calculate date range
-        curr_dt = pd.to_datetime(curr_date)
-        start_dt = curr_dt - pd.Timedelta(days=look_back_days)
+        curr_d = parse_date(curr_date)
+        start_d = curr_d - timedelta(days=look_back_days)
         
         results = []
         results.append(f"# Technical Indicators Table for {symbol}")
-        results.append(f"**Period:** {start_dt.strftime('%Y-%m-%d')} to {curr_date} ({look_back_days} days lookback)")
+        results.append(f"**Period:** {start_d.isoformat()} to {curr_date} ({look_back_days} days lookback)")
         results.append(f"**Showing:** Last 25 trading days for EOD analysis")
         results.append("")
         
-        # Create table header
-        header_row = "| Date | " + " | ".join([ind.replace('_', ' ').title() for ind in key_indicators]) + " |"
-        separator_row = "|------|" + "|".join(["------" for _ in key_indicators]) + "|"
-        
-        results.append(header_row)
-        results.append(separator_row)
-        
-        # Generate dates for the lookback period - only trading days
-        dates = []
-        trading_days_found = 0
-        days_back = 0
-        
-        # Get the last 45 trading days (roughly 9 weeks of trading data)
-        while trading_days_found < 45 and days_back <= look_back_days:
-            date = curr_dt - pd.Timedelta(days=days_back)
-            # Skip weekends (Saturday=5, Sunday=6)
-            if date.weekday() < 5:  # Monday=0, Friday=4
-                dates.append(date.strftime("%Y-%m-%d"))
-                trading_days_found += 1
-            days_back += 1
-        
-        # Reverse to get chronological order, then take the most recent portion
-        dates = dates[::-1]
-        recent_dates = dates[-25:] if len(dates) > 25 else dates  # Show last 25 trading days
-        
-        # For each date, get all indicator values
-        for date in recent_dates:
-            row_values = [date]
-            
-            for indicator in key_indicators:
-                try:
-                    # Get indicator value for this date using the window method
-                    value = interface.get_stock_stats_indicators_window(
-                        symbol, indicator, date, 1, True  # Get just this date's value
-                    )
-                    # Extract just the numeric value from the response
-                    if ":" in value:
-                        numeric_part = value.split(":")[-1].strip().split("(")[0].strip()
-                        try:
-                            float_val = float(numeric_part)
-                            if indicator in ['rsi_14', 'kdjk', 'kdjd', 'wr_14']:
-                                row_values.append(f"{float_val:.1f}")
-                            elif 'macd' in indicator:
-                                row_values.append(f"{float_val:.3f}")
-                            else:
-                                row_values.append(f"{float_val:.2f}")
-                        except:
-                            row_values.append("N/A")
-                    else:
-                        row_values.append("N/A")
-                except:
-                    row_values.append("N/A")
-            
-            # Format the table row
-            table_row = "| " + " | ".join(row_values) + " |"
-            results.append(table_row)
+        results.append(_TABLE_HEADER)
         
-        results.append("")
-        results.append("## Key EOD Trading Signals Analysis:")
-        results.append("- **Trend Structure:** 8-EMA > 21-EMA > 50-SMA = Strong uptrend | Price above all EMAs = Bullish")
-        results.append("- **Momentum:** RSI 30-50 = Accumulation zone | RSI 50-70 = Trending | RSI >70 = Overbought")
-        results.append("- **MACD Signals:** MACD > Signal = Bullish momentum | Histogram growing = Acceleration")
-        results.append("- **Bollinger Bands:** Price at Upper Band = Breakout potential | Price at Lower Band = Support test")
-        results.append("- **Stochastic:** %K crossing above %D in oversold (<20) = Buy signal | In overbought (>80) = Sell signal")
-        results.append("- **Williams %R:** Values -20 to -80 = Normal range | Below -80 = Oversold (buy) | Above -20 = Overbought (sell)")
-        results.append("- **ATR:** Use for position sizing (1-2x ATR for stop loss) | Higher ATR = More volatile")
-        results.append("")
-        results.append("**EOD Strategy:** Look for trend + momentum + volume confirmation for overnight positions")
+        # Last 25 trading days (weekdays) of the lookback period, in chronological order
+        recent_dates = list(_recent_trading_days(curr_d.isoformat(), look_back_days))
+        
+        # Compute every indicator once over the price history, then look up each date
+        frame = interface.get_stock_stats_indicators_frame(symbol, key_indicators, recent_dates)
+        
+        # Format column by column, then concatenate the columns into table rows in one call
+        cells = [
+            frame[indicator].map(fmt, na_action="ignore").fillna("N/A")
+            for indicator, fmt in zip(key_indicators, _TABLE_FORMATS)
+        ]
+        rows = pd.Series(recent_dates, index=frame.index).str.cat(cells, sep=" | ")
+        results.extend("| " + rows + " |")
+        
+        results.append(_TABLE_FOOTER)
         
         return "\n".join(results)
@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import chromadb
 from chromadb.config import Settings
 from openai import OpenAI
@@ -6,12 +10,19 @@ from tradingagents.dataflows.config import get_api_key
 
 
 class FinancialSituationMemory:
+    # Max number of (situation, n_matches) lookups kept per memory instance
+    QUERY_CACHE_SIZE = 64
+
     def __init__(self, name):
         # Get API key from environment variables or config
         api_key = get_api_key("openai_api_key", "OPENAI_API_KEY")
         self.client = OpenAI(api_key=api_key)
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
+        # Situations repeat across debate rounds and downstream nodes, so
+        # cache lookups by a digest of the situation text
+        self._query_cache = OrderedDict()
+        self._query_cache_lock = threading.Lock()
 
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
@@ -42,9 +53,32 @@ class FinancialSituationMemory:
             embeddings=embeddings,
             ids=ids,
         )
+        # New situations can change the best matches
+        with self._query_cache_lock:
+            self._query_cache.clear()
 
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
+        cache_key = (
+            hashlib.blake2b(current_situation.encode("utf-8"), digest_size=16).digest(),
+            n_matches,
+        )
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_cache.move_to_end(cache_key)
+                return [dict(match) for match in cached]
+
+        matched_results = self._query_memories(current_situation, n_matches)
+
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = matched_results
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return [dict(match) for match in matched_results]
+
+    def _query_memories(self, current_situation, n_matches):
+        """Embed the situation and run the similarity search"""
         query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
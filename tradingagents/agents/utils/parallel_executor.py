@@ -0,0 +1,50 @@
+import concurrent.futures
+import contextvars
+import threading
+
+
+# Maximum number of tool calls one agent runs at the same time
+TOOL_CONCURRENCY_LIMIT = 8
+
+
+class ParallelToolExecutor:
+    """Long-lived thread pool that runs one agent's independent tool calls concurrently.
+
+    Each agent gets its own pool (see get_executor) so a tool that fans out
+    again can never wait on a worker held by its own caller. Calls run in a
+    copy of the submitting thread's context, so context variables such as
+    the active trading context are visible inside the tools.
+    """
+
+    def __init__(self, max_workers=TOOL_CONCURRENCY_LIMIT, name="tools"):
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-tool"
+        )
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) and return its Future."""
+        return self._pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def map(self, fn, items):
+        """Apply fn to every item concurrently, returning the results in input order."""
+        futures = [self.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(agent_label):
+    """Return the shared ParallelToolExecutor of an agent, creating it on first use."""
+    executor = _executors.get(agent_label)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(agent_label)
+            if executor is None:
+                executor = ParallelToolExecutor(name=agent_label.lower())
+                _executors[agent_label] = executor
+    return executor
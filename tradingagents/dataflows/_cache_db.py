@@ -0,0 +1,273 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from functools import wraps
+
+import pandas as pd
+
+from .config import get_config
+
+
+CACHE_DB_NAME = "tool_cache.sqlite3"
+
+# How long a persisted result stays valid, per data cadence
+DISK_CACHE_TTLS = {
+    "news": timedelta(hours=1),          # news, sentiment and macro reports
+    "daily": timedelta(days=1),          # fundamentals summaries refreshed daily
+    "earnings": timedelta(days=7),       # earnings calendar and surprise history
+    "financials": timedelta(days=30),    # quarterly financial statements
+}
+
+# Hit/miss counters of the disk cache for this process (read with get_cache_stats)
+_cache_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+_conn = None
+_conn_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (once) the on-disk cache database in the configured data cache dir."""
+    global _conn
+    if _conn is None:
+        cache_dir = get_config()["data_cache_dir"]
+        os.makedirs(cache_dir, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(cache_dir, CACHE_DB_NAME), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, inserted_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bars ("
+            "symbol TEXT NOT NULL, timeframe TEXT NOT NULL, timestamp TEXT NOT NULL, "
+            "open REAL, high REAL, low REAL, close REAL, volume REAL, trade_count REAL, vwap REAL, "
+            "PRIMARY KEY (symbol, timeframe, timestamp))"
+        )
+        # Inclusive date range per (symbol, timeframe) whose bars are completely stored
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bar_coverage ("
+            "symbol TEXT NOT NULL, timeframe TEXT NOT NULL, start TEXT NOT NULL, end TEXT NOT NULL, "
+            "PRIMARY KEY (symbol, timeframe))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS earnings ("
+            "symbol TEXT NOT NULL, date TEXT NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (symbol, date))"
+        )
+        # Inclusive date range per symbol whose reported earnings are completely stored
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS earnings_coverage ("
+            "symbol TEXT PRIMARY KEY, start TEXT NOT NULL, end TEXT NOT NULL)"
+        )
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _cache_stats[outcome] += 1
+
+
+def get_cache_stats() -> dict:
+    """Return a snapshot of this process's disk cache {"hits": n, "misses": n}."""
+    with _stats_lock:
+        return dict(_cache_stats)
+
+
+def is_error_result(result) -> bool:
+    """Whether a data function's string result reports a failure and must not be cached.
+
+    Failures are reported as "Error ..." messages; reports assembled from
+    several sources mark a failed section with "**Error**:".
+    """
+    return isinstance(result, str) and (result.startswith("Error") or "**Error**:" in result)
+
+
+def cache_get(key: str, ttl_seconds: float):
+    """Return the payload stored under `key` if it is younger than `ttl_seconds`."""
+    with _conn_lock:
+        row = _get_connection().execute(
+            "SELECT payload, inserted_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+    if row is None or time.time() - row[1] > ttl_seconds:
+        return None
+    return row[0]
+
+
+def cache_put(key: str, payload: str) -> None:
+    """Store `payload` under `key`, replacing any previous entry."""
+    with _conn_lock:
+        conn = _get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, payload, inserted_at) VALUES (?, ?, ?)",
+            (key, payload, time.time()),
+        )
+        conn.commit()
+
+
+def disk_cached(ttl="earnings"):
+    """Decorator persisting a data function's string result on disk.
+
+    `ttl` is a DISK_CACHE_TTLS category or a timedelta. Reruns and backtests
+    revisiting the same ticker and date then skip the network entirely.
+    Empty results and error messages (see is_error_result) are not stored.
+    """
+    if not isinstance(ttl, timedelta):
+        ttl = DISK_CACHE_TTLS[ttl]
+    ttl_seconds = ttl.total_seconds()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = json.dumps([func.__module__, func.__qualname__, args, kwargs], sort_keys=True)
+            except TypeError:
+                # Arguments that cannot be serialised are not cached
+                return func(*args, **kwargs)
+
+            try:
+                cached = cache_get(key, ttl_seconds)
+            except sqlite3.Error:
+                cached = None
+            if cached is not None:
+                _count("hits")
+                return cached
+
+            _count("misses")
+            result = func(*args, **kwargs)
+            if isinstance(result, str) and result and not is_error_result(result):
+                try:
+                    cache_put(key, result)
+                except sqlite3.Error:
+                    pass
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_or_fetch(key: str, fetcher, ttl="daily"):
+    """Return the JSON value persisted under `key`, or call `fetcher()` and persist its result.
+
+    For raw API responses shared by several tools (e.g. one endpoint rendered
+    with different options). `ttl` is a DISK_CACHE_TTLS category or a
+    timedelta. Exceptions from `fetcher` propagate and are not stored.
+    """
+    if not isinstance(ttl, timedelta):
+        ttl = DISK_CACHE_TTLS[ttl]
+    key = "json:" + key
+
+    try:
+        cached = cache_get(key, ttl.total_seconds())
+    except sqlite3.Error:
+        cached = None
+    if cached is not None:
+        _count("hits")
+        return json.loads(cached)
+
+    _count("misses")
+    value = fetcher()
+    try:
+        cache_put(key, json.dumps(value))
+    except (sqlite3.Error, TypeError, ValueError):
+        pass
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Price bars
+# ---------------------------------------------------------------------------
+
+BAR_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume", "trade_count", "vwap"]
+
+
+def get_bar_coverage(symbol: str, timeframe: str):
+    """Return the (start, end) dates, inclusive, whose bars are fully stored, or None."""
+    with _conn_lock:
+        row = _get_connection().execute(
+            "SELECT start, end FROM bar_coverage WHERE symbol = ? AND timeframe = ?",
+            (symbol, timeframe),
+        ).fetchone()
+    return tuple(row) if row else None
+
+
+def store_bars(symbol: str, timeframe: str, df: pd.DataFrame, coverage=None) -> None:
+    """Upsert bars from an Alpaca bars DataFrame and optionally record the new coverage."""
+    rows = []
+    for record in df.to_dict("records"):
+        rows.append(
+            (symbol, timeframe, record["timestamp"].isoformat())
+            + tuple(record.get(col) for col in BAR_COLUMNS[1:])
+        )
+    with _conn_lock:
+        conn = _get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO bars (symbol, timeframe, timestamp, open, high, low, close, "
+            "volume, trade_count, vwap) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        if coverage is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO bar_coverage (symbol, timeframe, start, end) VALUES (?, ?, ?, ?)",
+                (symbol, timeframe) + tuple(coverage),
+            )
+        conn.commit()
+
+
+def read_bars(symbol: str, timeframe: str, start: str, end_exclusive: str) -> pd.DataFrame:
+    """Return stored bars with start <= timestamp < end_exclusive, oldest first."""
+    with _conn_lock:
+        rows = _get_connection().execute(
+            "SELECT " + ", ".join(BAR_COLUMNS) + " FROM bars "
+            "WHERE symbol = ? AND timeframe = ? AND timestamp >= ? AND timestamp < ? "
+            "ORDER BY timestamp",
+            (symbol, timeframe, start, end_exclusive),
+        ).fetchall()
+    df = pd.DataFrame(rows, columns=BAR_COLUMNS)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Reported earnings
+# ---------------------------------------------------------------------------
+
+def get_earnings_coverage(symbol: str):
+    """Return the (start, end) dates, inclusive, whose earnings are fully stored, or None."""
+    with _conn_lock:
+        row = _get_connection().execute(
+            "SELECT start, end FROM earnings_coverage WHERE symbol = ?", (symbol,)
+        ).fetchone()
+    return tuple(row) if row else None
+
+
+def store_earnings(symbol: str, rows, coverage=None) -> None:
+    """Upsert earnings calendar rows (dicts with a 'date') and optionally record the new coverage."""
+    records = [(symbol, row["date"], json.dumps(row)) for row in rows if row.get("date")]
+    with _conn_lock:
+        conn = _get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO earnings (symbol, date, payload) VALUES (?, ?, ?)", records
+        )
+        if coverage is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO earnings_coverage (symbol, start, end) VALUES (?, ?, ?)",
+                (symbol,) + tuple(coverage),
+            )
+        conn.commit()
+
+
+def read_earnings(symbol: str, start: str, end: str) -> list:
+    """Return stored earnings rows with start <= date <= end, most recent first."""
+    with _conn_lock:
+        rows = _get_connection().execute(
+            "SELECT payload FROM earnings WHERE symbol = ? AND date >= ? AND date <= ? "
+            "ORDER BY date DESC",
+            (symbol, start, end),
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
@@ -0,0 +1,37 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+# Maximum number of DataFrames kept in memory
+FRAME_CACHE_MAXSIZE = 32
+
+_frames = OrderedDict()
+_frames_lock = threading.Lock()
+
+
+def get_frame(key) -> "pd.DataFrame | None":
+    """Return a copy of the DataFrame stored under `key`, or None.
+
+    Tools render their data to text for the LLM; the raw frames are kept
+    here so the next tool that needs the same bars reuses them instead of
+    re-downloading or re-parsing a CSV. A copy is returned because callers
+    add indicator columns in place.
+    """
+    with _frames_lock:
+        df = _frames.get(key)
+        if df is None:
+            return None
+        _frames.move_to_end(key)
+    return df.copy()
+
+
+def put_frame(key, df: pd.DataFrame) -> None:
+    """Store a private copy of `df` under `key`, evicting the oldest entries."""
+    df = df.copy()
+    with _frames_lock:
+        _frames[key] = df
+        _frames.move_to_end(key)
+        while len(_frames) > FRAME_CACHE_MAXSIZE:
+            _frames.popitem(last=False)
@@ -0,0 +1,122 @@
+import threading
+import time
+from functools import wraps
+
+import requests
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from .config import get_config
+
+
+# Fallback requests-per-minute used when a provider has no entry in the config
+DEFAULT_RATE_PER_MIN = 60
+
+# HTTP statuses worth retrying: rate limited or a temporary server-side failure
+TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Longest single wait between retries, in seconds
+RETRY_MAX_WAIT = 30
+
+
+class TokenBucket:
+    """Thread-safe token bucket: callers block until a token is available
+    instead of bursting into the provider's rate cap and backing off on 429s."""
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        self.rate = float(rate_per_sec)
+        self.capacity = max(1, int(burst))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1):
+        """Take `tokens` from the bucket, sleeping until enough have accumulated."""
+        with self._cond:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                self._cond.wait((tokens - self._tokens) / self.rate)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(provider: str) -> TokenBucket:
+    """Return the shared bucket for a provider, sized from config["rate_limits"]."""
+    bucket = _buckets.get(provider)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(provider)
+            if bucket is None:
+                limits = get_config().get("rate_limits", {})
+                per_min = limits.get(provider, DEFAULT_RATE_PER_MIN)
+                # Allow up to a second's worth of calls to go out back to back
+                bucket = TokenBucket(per_min / 60.0, burst=max(1, per_min // 60))
+                _buckets[provider] = bucket
+    return bucket
+
+
+def rate_limited(provider: str):
+    """Decorator that takes one token from the provider's bucket before each call."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            get_bucket(provider).acquire()
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class ProviderRateLimitError(Exception):
+    """A provider answered with a rate-limit message in an otherwise successful response."""
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, (ProviderRateLimitError, requests.ConnectionError, requests.Timeout)):
+        return True
+    # requests.HTTPError carries the response; client libraries such as finnhub set status_code
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status_code", None)
+    return status in TRANSIENT_STATUS
+
+
+_jittered_wait = wait_random_exponential(multiplier=0.1, max=RETRY_MAX_WAIT)
+
+
+def _wait_retry_after(retry_state) -> float:
+    """Wait as long as the failed response's Retry-After asks, else a jittered backoff."""
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return min(RETRY_MAX_WAIT, max(0.0, float(headers.get("Retry-After"))))
+    except (TypeError, ValueError):
+        # No header, or an HTTP-date we don't parse
+        return _jittered_wait(retry_state)
+
+
+def retry_transient(attempts: int = 5):
+    """Decorator retrying rate-limit and server errors with jittered exponential backoff.
+
+    Waits are drawn uniformly from [0, 0.1s * 2**attempt], capped at 30s, so
+    tickers refreshed together do not retry in lockstep. A Retry-After header
+    on the failed response (requests.HTTPError and finnhub's API exception
+    keep it) takes precedence. Put it above rate_limited so every attempt
+    takes a token. The last error is re-raised.
+    """
+    return retry(
+        retry=retry_if_exception(_is_transient),
+        wait=_wait_retry_after,
+        stop=stop_after_attempt(attempts),
+        reraise=True,
+    )
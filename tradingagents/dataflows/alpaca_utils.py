@@ -1,8 +1,15 @@
 # alpaca_utils.py
 
+import concurrent.futures
+import functools
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Annotated, Union, Optional, List
 from alpaca.data.historical import StockHistoricalDataClient, CryptoHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest, CryptoBarsRequest, StockLatestQuoteRequest, CryptoLatestQuoteRequest
@@ -11,7 +18,12 @@ from alpaca.data.enums import DataFeed
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import GetAssetsRequest, GetOrdersRequest, MarketOrderRequest, ClosePositionRequest
 from alpaca.trading.enums import AssetClass, OrderSide, TimeInForce
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config import get_api_key
+from ._cache_db import disk_cached, get_bar_coverage, read_bars, store_bars
+from ._ratelimit import rate_limited
+from .utils import parse_date
 
 
 # Fallback dictionary for company names
@@ -57,66 +69,235 @@ ticker_to_company_fallback = {
 }
 
 
-def get_alpaca_stock_client() -> StockHistoricalDataClient:
+# Connections kept open per Alpaca host, sized for the concurrent tool threads
+ALPACA_POOL_MAXSIZE = 32
+
+# Transient Alpaca failures are retried in the transport with exponential backoff.
+# Only GETs are retried: replaying an order POST after a 5xx could place it twice.
+ALPACA_RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(kind, factory, *credentials):
+    """
+    Return the shared client of one kind for the given credentials, creating it on first use.
+    Each client keeps its own HTTP session, so reusing it reuses open TLS connections.
+    """
+    key = (kind,) + credentials
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory(*credentials)
+            session = getattr(client, "_session", None)
+            if session is not None:
+                adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=ALPACA_POOL_MAXSIZE, max_retries=ALPACA_RETRY
+                )
+                session.mount("https://", adapter)
+            _clients[key] = client
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def _creds() -> tuple:
+    """
+    Resolve the Alpaca key and secret once per process.
+    Raises ValueError (which is not cached) while either is missing.
+    """
     api_key = get_api_key("alpaca_api_key", "ALPACA_API_KEY")
     api_secret = get_api_key("alpaca_secret_key", "ALPACA_SECRET_KEY")
     if not api_key or not api_secret:
-        print(f"Warning: Missing Alpaca API credentials. API key: {'present' if api_key else 'missing'}, Secret: {'present' if api_secret else 'missing'}")
         raise ValueError("Alpaca API key or secret not found. Please set ALPACA_API_KEY and ALPACA_SECRET_KEY.")
+    return api_key, api_secret
+
+
+def get_alpaca_stock_client() -> StockHistoricalDataClient:
     try:
-        return StockHistoricalDataClient(api_key, api_secret)
+        api_key, api_secret = _creds()
+    except ValueError:
+        print("Warning: Missing Alpaca API credentials (ALPACA_API_KEY / ALPACA_SECRET_KEY).")
+        raise
+    try:
+        return _get_client("stock", StockHistoricalDataClient, api_key, api_secret)
     except Exception as e:
         print(f"Error creating Alpaca stock client: {e}")
         raise
 
 
 def get_alpaca_crypto_client() -> CryptoHistoricalDataClient:
-    api_key = get_api_key("alpaca_api_key", "ALPACA_API_KEY")
-    api_secret = get_api_key("alpaca_secret_key", "ALPACA_SECRET_KEY")
     # Crypto calls work without keys, but keys raise rate limits
-    if api_key and api_secret:
-        return CryptoHistoricalDataClient(api_key, api_secret)
-    else:
-        return CryptoHistoricalDataClient()
+    try:
+        api_key, api_secret = _creds()
+    except ValueError:
+        return _get_client("crypto", CryptoHistoricalDataClient)
+    return _get_client("crypto", CryptoHistoricalDataClient, api_key, api_secret)
 
 
 def get_alpaca_trading_client() -> TradingClient:
-    api_key = get_api_key("alpaca_api_key", "ALPACA_API_KEY")
-    api_secret = get_api_key("alpaca_secret_key", "ALPACA_SECRET_KEY")
-    if not api_key or not api_secret:
-        raise ValueError("Alpaca API key or secret not found. Please set ALPACA_API_KEY and ALPACA_SECRET_KEY.")
-    return TradingClient(api_key, api_secret, paper=True)
+    api_key, api_secret = _creds()
+    return _get_client("trading", lambda key, secret: TradingClient(key, secret, paper=True), api_key, api_secret)
+
+
+def _reset_clients():
+    """Drop the shared clients and cached credentials, e.g. after the credentials were rotated."""
+    _creds.cache_clear()
+    with _clients_lock:
+        _clients.clear()
+
+
+# Seconds a fetched positions list is reused for symbol lookups
+POSITIONS_CACHE_TTL = 2.0
+
+_positions_cache = {"ts": 0.0, "map": {}}
+_positions_lock = threading.Lock()
+
+
+@rate_limited("alpaca")
+def _fetch_positions() -> list:
+    # `get_all_positions()` is more broadly supported across Alpaca versions
+    # than `get_position(symbol)` and avoids raising when the asset is not found.
+    return get_alpaca_trading_client().get_all_positions()
+
+
+def _get_positions_indexed(ttl: float = POSITIONS_CACHE_TTL) -> dict:
+    """
+    Return the account's open positions keyed by normalised symbol ("BTC/USD" -> "BTCUSD").
+    The positions list is fetched at most once per `ttl` seconds, so checking several
+    tickers in a row costs a single REST call.
+    """
+    with _positions_lock:
+        if time.monotonic() - _positions_cache["ts"] > ttl:
+            positions = _fetch_positions()
+            _positions_cache["map"] = {pos.symbol.upper().replace("/", ""): pos for pos in positions}
+            _positions_cache["ts"] = time.monotonic()
+        return _positions_cache["map"]
+
+
+def _invalidate_positions():
+    """Force the next position lookup to refetch, e.g. after an order was placed."""
+    with _positions_lock:
+        _positions_cache["ts"] = 0.0
+
+
+@disk_cached("financials")
+@rate_limited("alpaca")
+def _lookup_company_name(symbol: str) -> str:
+    """Return the asset name Alpaca lists for `symbol` ("" if none), cached on disk."""
+    asset = get_alpaca_trading_client().get_asset(symbol)
+    return getattr(asset, "name", None) or ""
+
+
+def _qty_from_quote(quote: dict, amount: float) -> int:
+    """Return the whole number of shares (at least 1) that `amount` dollars buys at the quote."""
+    price = quote.get("bid_price") or quote.get("ask_price")
+    if not price or price <= 0:
+        # Fallback: assume $1 to avoid div-by-zero; will raise later if Alpaca rejects
+        price = 1
+    return max(int(amount / price), 1)
+
+
+# Order enums by side string and by whether the symbol is crypto (crypto orders only allow GTC)
+_SIDE_MAP = {"buy": OrderSide.BUY, "sell": OrderSide.SELL}
+_TIF_MAP = {True: TimeInForce.GTC, False: TimeInForce.DAY}
+
+
+# Pages of the orders table whose server-side cursor is remembered
+ORDER_CURSORS_MAXSIZE = 64
+
+# (page_size, page) -> submission time of the oldest order of the previous page
+_order_cursors = OrderedDict()
+_order_cursors_lock = threading.Lock()
+
+
+def _get_order_cursor(page_size: int, page: int):
+    with _order_cursors_lock:
+        cursor = _order_cursors.get((page_size, page))
+        if cursor is not None:
+            _order_cursors.move_to_end((page_size, page))
+        return cursor
+
+
+def _remember_order_cursor(page_size: int, page: int, orders: list) -> None:
+    """Record where page + 1 starts, given the orders shown on `page` (newest first).
+
+    Other orders submitted at exactly the same instant as the oldest one shown
+    are skipped by the next page; Alpaca stamps orders to the microsecond, so
+    this only matters for orders submitted together in bulk.
+    """
+    if len(orders) < page_size or orders[-1].submitted_at is None:
+        return
+    with _order_cursors_lock:
+        # `until` is exclusive, so the oldest order already shown is not repeated
+        _order_cursors[(page_size, page + 1)] = orders[-1].submitted_at
+        _order_cursors.move_to_end((page_size, page + 1))
+        while len(_order_cursors) > ORDER_CURSORS_MAXSIZE:
+            _order_cursors.popitem(last=False)
+
+
+def save_bars(df: pd.DataFrame, path: str) -> None:
+    """Write a bars DataFrame to `path`, picking parquet, feather or CSV from its suffix."""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".parquet":
+        df.to_parquet(path, compression="zstd", index=False)
+    elif suffix == ".feather":
+        df.to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
+
+def load_bars(path: str) -> pd.DataFrame:
+    """Read bars written by save_bars, keeping 'timestamp' as a tz-aware datetime column."""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix == ".feather":
+        return pd.read_feather(path)
+    df = pd.read_csv(path)
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    return df
+
+
+_BAR_FIELDS = ("open", "high", "low", "close", "volume", "trade_count", "vwap")
+
+
+def _bars_to_frame(bar_list) -> pd.DataFrame:
+    """Turn a list of Alpaca Bar objects into the bars DataFrame, one column at a time."""
+    columns = {"timestamp": pd.to_datetime([bar.timestamp for bar in bar_list], utc=True)}
+    for field in _BAR_FIELDS:
+        # Missing values (e.g. no vwap) become NaN
+        columns[field] = np.array([getattr(bar, field, None) for bar in bar_list], dtype=float)
+    return pd.DataFrame(columns)
+
+
+# Timeframe strings such as "1Min", "15min", "1Hour" or "1Day"
+_TF_RE = re.compile(r"^(\d+)?(min|hour|day)$", re.IGNORECASE)
+_TF_UNITS = {"min": TimeFrameUnit.Minute, "hour": TimeFrameUnit.Hour, "day": TimeFrameUnit.Day}
 
 
 def _parse_timeframe(tf: Union[str, TimeFrame]) -> TimeFrame:
     """Convert a string like '5Min' or a TimeFrame instance into a TimeFrame."""
     if isinstance(tf, TimeFrame):
         return tf
+    return _parse_timeframe_str(tf.strip())
 
-    tf = tf.strip()
-    
-    # mapping common strings
-    if tf.lower() == "1min":
-        result = TimeFrame.Minute
-    elif tf.lower().endswith("min"):
-        # e.g. "5Min", "15min"
-        amount = int(tf[:-3])
-        result = TimeFrame(amount, TimeFrameUnit.Minute)
-    elif tf.lower() == "1hour":
-        result = TimeFrame.Hour
-    elif tf.lower().endswith("hour"):
-        amount = int(tf[:-4])
-        result = TimeFrame(amount, TimeFrameUnit.Hour)
-    elif tf.lower() == "1day":
-        result = TimeFrame.Day
-    elif tf.lower().endswith("day"):
-        amount = int(tf[:-3])
-        result = TimeFrame(amount, TimeFrameUnit.Day)
-    else:
+
+@functools.lru_cache(maxsize=32)
+def _parse_timeframe_str(tf: str) -> TimeFrame:
+    match = _TF_RE.match(tf)
+    if match is None:
         # fallback
-        result = TimeFrame.Day
-    
-    return result
+        return TimeFrame.Day
+    return TimeFrame(int(match[1] or 1), _TF_UNITS[match[2].lower()])
 
 
 class AlpacaUtils:
@@ -138,61 +319,98 @@ class AlpacaUtils:
             start_date: 'YYYY-MM-DD' string or datetime
             end_date: optional 'YYYY-MM-DD' string or datetime
             timeframe: e.g. "1Min","5Min","15Min","1Hour","1Day" or a TimeFrame instance
-            save_path: if provided, path to write a CSV
+            save_path: if provided, path to write the bars to; a ".parquet" or
+                ".feather" suffix writes that binary format (needs pyarrow), anything else CSV
             feed: DataFeed enum (default IEX)
 
         Returns:
             pandas DataFrame with columns ['timestamp','open','high','low','close','volume']
         """
+        df = AlpacaUtils.get_stock_data_multi(
+            [symbol], start_date, end_date, timeframe, feed
+        ).get(symbol, pd.DataFrame())
+        if save_path and not df.empty:
+            save_bars(df, save_path)
+        return df
+
+    @staticmethod
+    def get_stock_data_multi(
+        symbols: List[str],
+        start_date: Union[str, datetime],
+        end_date: Optional[Union[str, datetime]] = None,
+        timeframe: Union[str, TimeFrame] = "1Day",
+        feed: DataFeed = DataFeed.IEX
+    ) -> dict:
+        """
+        Fetch historical OHLCV data for several stock and/or crypto symbols.
+        Equities and crypto are each fetched with a single bars request.
+
+        Args:
+            symbols: The ticker symbols (e.g. ["SPY", "AAPL", "BTC/USD"])
+            start_date: 'YYYY-MM-DD' string or datetime
+            end_date: optional 'YYYY-MM-DD' string or datetime
+            timeframe: e.g. "1Min","5Min","15Min","1Hour","1Day" or a TimeFrame instance
+            feed: DataFeed enum (default IEX)
+
+        Returns:
+            dict: {symbol: DataFrame with columns ['timestamp','open','high','low','close','volume', ...]};
+            symbols whose request failed map to an empty DataFrame
+        """
         # normalize dates
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date) + timedelta(days=1) if end_date else None
 
         tf = _parse_timeframe(timeframe)
 
-        # choose client
-        is_crypto = "/" in symbol
+        symbols = list(dict.fromkeys(symbols))
+        results = {}
+        for is_crypto in (False, True):
+            group = [symbol for symbol in symbols if ("/" in symbol) == is_crypto]
+            if group:
+                results.update(AlpacaUtils._fetch_bars(group, is_crypto, tf, start, end, feed))
+        return {symbol: results.get(symbol, pd.DataFrame()) for symbol in symbols}
+
+    @staticmethod
+    @rate_limited("alpaca")
+    def _fetch_bars(symbols, is_crypto, tf, start, end, feed) -> dict:
+        """Issue one bars request for symbols of the same asset class and split the result per symbol."""
         client = get_alpaca_crypto_client() if is_crypto else get_alpaca_stock_client()
 
-        # build request params; always use a list for symbol_or_symbols
-        params = (
-            CryptoBarsRequest(
-                symbol_or_symbols=[symbol],
-                timeframe=tf,
-                start=start,
-                end=end,
-                feed=feed
-            ) if is_crypto else
-            StockBarsRequest(
-                symbol_or_symbols=[symbol],
-                timeframe=tf,
-                start=start,
-                end=end,
-                feed=feed
-            )
+        request_class = CryptoBarsRequest if is_crypto else StockBarsRequest
+        params = request_class(
+            symbol_or_symbols=symbols,
+            timeframe=tf,
+            start=start,
+            end=end,
+            feed=feed
         )
 
         try:
             bars = client.get_crypto_bars(params) if is_crypto else client.get_stock_bars(params)
+            data = getattr(bars, "data", None)
+            if isinstance(data, dict):
+                # Build each symbol's columns straight from the Bar objects
+                return {
+                    symbol: _bars_to_frame(bar_list)
+                    for symbol, bar_list in data.items() if bar_list
+                }
             # convert to DataFrame via the .df property
-            df = bars.df.reset_index()  # multi-index ['symbol','timestamp']
-            
-            # filter for our symbol (in case of list) - only if symbol column exists
-            if "symbol" in df.columns:
-                df = df[df["symbol"] == symbol].drop(columns="symbol")
-            else:
-                # If no symbol column, assume all data is for the requested symbol
-                pass
-                
-            if save_path:
-                df.to_csv(save_path, index=False)
-            return df
-
+            df = bars.df  # multi-index ['symbol','timestamp']
         except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
-            return pd.DataFrame()
+            print(f"Error fetching data for {', '.join(symbols)}: {e}")
+            return {}
+
+        if "symbol" not in df.index.names:
+            # If no symbol level, assume all data is for the single requested symbol
+            return {symbols[0]: df.reset_index()} if len(symbols) == 1 else {}
+        # Split on the index level so only each symbol's rows are copied once
+        return {
+            symbol: group.droplevel("symbol").reset_index()
+            for symbol, group in df.groupby(level="symbol", sort=False)
+        }
 
     @staticmethod
+    @rate_limited("alpaca")
     def get_latest_quote(symbol: str) -> dict:
         """
         Get the latest bid/ask quote for a symbol.
@@ -215,10 +433,99 @@ class AlpacaUtils:
             print(f"Error fetching latest quote for {symbol}: {e}")
             return {}
 
-    
     @staticmethod
-    def get_stock_data_window(
+    def get_latest_quotes(symbols: List[str]) -> dict:
+        """
+        Get the latest bid/ask quotes of several symbols, with one request per asset class.
+        Returns {symbol: quote dict as returned by get_latest_quote}; failed symbols are left out.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        quotes = {}
+        for is_crypto in (False, True):
+            group = [symbol for symbol in symbols if ("/" in symbol) == is_crypto]
+            if group:
+                quotes.update(AlpacaUtils._fetch_latest_quotes(group, is_crypto))
+        return quotes
+
+    @staticmethod
+    @rate_limited("alpaca")
+    def _fetch_latest_quotes(symbols, is_crypto) -> dict:
+        client = get_alpaca_crypto_client() if is_crypto else get_alpaca_stock_client()
+        req = CryptoLatestQuoteRequest(symbol_or_symbols=symbols) if is_crypto else StockLatestQuoteRequest(symbol_or_symbols=symbols)
+        try:
+            resp = client.get_crypto_latest_quote(req) if is_crypto else client.get_stock_latest_quote(req)
+        except Exception as e:
+            print(f"Error fetching latest quotes for {', '.join(symbols)}: {e}")
+            return {}
+        return {
+            symbol: {
+                "symbol": symbol,
+                "bid_price": quote.bid_price,
+                "bid_size": quote.bid_size,
+                "ask_price": quote.ask_price,
+                "ask_size": quote.ask_size,
+                "timestamp": quote.timestamp
+            }
+            for symbol, quote in resp.items() if symbol in symbols
+        }
+
+    @staticmethod
+    def get_stock_data_cached(
         symbol: Annotated[str, "ticker symbol"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"] = None,
+        timeframe: Annotated[str, "Timeframe for data: 1Min, 5Min, 15Min, 1Hour, 1Day"] = "1Day",
+    ) -> pd.DataFrame:
+        """
+        Fetch bars through the on-disk bar store, downloading only the days it does not hold yet.
+        The store keeps one contiguous, fully downloaded date range per (symbol, timeframe);
+        the current day is always re-fetched since its bar is still forming.
+        """
+        try:
+            req_start = date.fromisoformat(start_date)
+            req_end = date.fromisoformat(end_date) if end_date else date.today()
+        except (TypeError, ValueError):
+            return AlpacaUtils.get_stock_data(
+                symbol=symbol, start_date=start_date, end_date=end_date, timeframe=timeframe
+            )
+
+        last_complete_day = date.today() - timedelta(days=1)
+        coverage = get_bar_coverage(symbol, timeframe)
+        if coverage:
+            cov_start, cov_end = date.fromisoformat(coverage[0]), date.fromisoformat(coverage[1])
+            gaps = []
+            if req_start < cov_start:
+                gaps.append((req_start, cov_start - timedelta(days=1)))
+            if req_end > cov_end:
+                gaps.append((cov_end + timedelta(days=1), req_end))
+        else:
+            cov_start = cov_end = None
+            gaps = [(req_start, req_end)]
+
+        for gap_start, gap_end in gaps:
+            # Leave the end open when the caller did, to stay within the data subscription
+            fetch_end = None if end_date is None and gap_end == req_end else gap_end.isoformat()
+            data = AlpacaUtils.get_stock_data(
+                symbol=symbol, start_date=gap_start.isoformat(), end_date=fetch_end, timeframe=timeframe
+            )
+            if data.empty:
+                # Could be a failed request as well as a holiday: do not record it as covered
+                continue
+
+            # Coverage stays contiguous: each gap borders the stored range on one side
+            new_start = min(gap_start, cov_start) if cov_start else gap_start
+            new_end = max(min(gap_end, last_complete_day), cov_end) if cov_end else min(gap_end, last_complete_day)
+            if new_end >= new_start:
+                cov_start, cov_end = new_start, new_end
+                store_bars(symbol, timeframe, data, (cov_start.isoformat(), cov_end.isoformat()))
+            else:
+                store_bars(symbol, timeframe, data)
+
+        return read_bars(symbol, timeframe, req_start.isoformat(), (req_end + timedelta(days=1)).isoformat())
+
+    @staticmethod
+    def get_stock_data_window(
+        symbol: Annotated[Union[str, List[str]], "ticker symbol, or a list of them"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"] = None,
         look_back_days: Annotated[int, "Number of days to look back"] = 30,
         timeframe: Annotated[str, "Timeframe for data: 1Min, 5Min, 15Min, 1Hour, 1Day"] = "1Day",
@@ -233,27 +540,30 @@ class AlpacaUtils:
             timeframe: Timeframe for data (1Min, 5Min, 15Min, 1Hour, 1Day)
             
         Returns:
-            DataFrame containing the historical stock data
+            DataFrame containing the historical stock data, or {symbol: DataFrame}
+            (fetched in one request per asset class) when a list of symbols is given
         """
         # Calculate start date based on look_back_days
-        if curr_date:
-            curr_dt = pd.to_datetime(curr_date)
-        else:
-            curr_dt = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-            
-        start_dt = curr_dt - pd.Timedelta(days=look_back_days)
+        curr_d = parse_date(curr_date) if curr_date else date.today()
+        start_date = (curr_d - timedelta(days=look_back_days)).isoformat()
         
         # Don't pass end_date to avoid subscription limitations
-        return AlpacaUtils.get_stock_data(
+        if isinstance(symbol, (list, tuple)):
+            return AlpacaUtils.get_stock_data_multi(
+                symbols=list(symbol),
+                start_date=start_date,
+                timeframe=timeframe
+            )
+        return AlpacaUtils.get_stock_data_cached(
             symbol=symbol,
-            start_date=start_dt.strftime("%Y-%m-%d"),
+            start_date=start_date,
             timeframe=timeframe
-        ) 
+        )
 
     @staticmethod
     def get_company_name(symbol: str) -> str:
         """
-        Get company name for a ticker symbol using Alpaca API.
+        Get company name for a ticker symbol, from the fallback table or the Alpaca API.
         
         Args:
             symbol: The ticker symbol (e.g. "AAPL")
@@ -261,21 +571,20 @@ class AlpacaUtils:
         Returns:
             Company name as string or original symbol if not found
         """
+        # Skip crypto or symbols with special characters
+        if "/" in symbol:
+            return symbol
+
+        # Known tickers resolve without a network round trip
+        if symbol in ticker_to_company_fallback:
+            return ticker_to_company_fallback[symbol]
+
         try:
-            # Skip crypto or symbols with special characters
-            if "/" in symbol:
-                return symbol
-                
-            client = get_alpaca_trading_client()
-            asset = client.get_asset(symbol)
-            
-            if asset and hasattr(asset, 'name') and asset.name:
-                return asset.name
-            else:
-                # Use fallback if name is not available
-                print(f"No company name found for {symbol} via API, using fallback.")
-                return ticker_to_company_fallback.get(symbol, symbol)
-                
+            name = _lookup_company_name(symbol)
+            if name:
+                return name
+            print(f"No company name found for {symbol} via API, using ticker.")
+            return symbol
         except Exception as e:
             print(f"Error fetching company name for {symbol}: {e}")
             print("This might be due to invalid API keys or insufficient permissions.")
@@ -283,52 +592,75 @@ class AlpacaUtils:
             return ticker_to_company_fallback.get(symbol, symbol) 
 
     @staticmethod
+    @rate_limited("alpaca")
     def get_positions_data():
         """Get current positions from Alpaca account"""
         try:
             client = get_alpaca_trading_client()
             positions = client.get_all_positions()
             
-            # Convert positions to a list of dictionaries
-            positions_data = []
-            for position in positions:
-                current_price = float(position.current_price)
-                avg_entry_price = float(position.avg_entry_price)
-                qty = float(position.qty)
-                market_value = float(position.market_value)
-                cost_basis = avg_entry_price * qty
-                
-                # Calculate P/L values
-                today_pl_dollars = float(position.unrealized_intraday_pl)
-                total_pl_dollars = float(position.unrealized_pl)
-                today_pl_percent = (today_pl_dollars / cost_basis) * 100 if cost_basis != 0 else 0
-                total_pl_percent = (total_pl_dollars / cost_basis) * 100 if cost_basis != 0 else 0
-                
-                positions_data.append({
-                    "Symbol": position.symbol,
-                    "Qty": qty,
-                    "Market Value": f"${market_value:.2f}",
-                    "Avg Entry": f"${avg_entry_price:.2f}",
-                    "Cost Basis": f"${cost_basis:.2f}",
-                    "Today's P/L (%)": f"{today_pl_percent:.2f}%",
-                    "Today's P/L ($)": f"${today_pl_dollars:.2f}",
-                    "Total P/L (%)": f"{total_pl_percent:.2f}%",
-                    "Total P/L ($)": f"${total_pl_dollars:.2f}"
-                })
-            
-            return positions_data
+            if not positions:
+                return []
+
+            # Work column-wise: one numeric conversion and one format pass per field
+            raw = pd.DataFrame([
+                (p.symbol, p.qty, p.market_value, p.avg_entry_price,
+                 p.unrealized_intraday_pl, p.unrealized_pl)
+                for p in positions
+            ], columns=["symbol", "qty", "market_value", "avg_entry_price",
+                        "unrealized_intraday_pl", "unrealized_pl"])
+            num = raw.drop(columns="symbol").apply(pd.to_numeric).astype(float)
+
+            cost_basis = num["avg_entry_price"] * num["qty"]
+            # Percentages are 0 for a zero cost basis
+            safe_basis = cost_basis.where(cost_basis != 0)
+            today_pl_percent = (num["unrealized_intraday_pl"] / safe_basis * 100).fillna(0)
+            total_pl_percent = (num["unrealized_pl"] / safe_basis * 100).fillna(0)
+
+            dollars = "${:.2f}".format
+            percent = "{:.2f}%".format
+            table = pd.DataFrame({
+                "Symbol": raw["symbol"],
+                "Qty": num["qty"],
+                "Market Value": num["market_value"].map(dollars),
+                "Avg Entry": num["avg_entry_price"].map(dollars),
+                "Cost Basis": cost_basis.map(dollars),
+                "Today's P/L (%)": today_pl_percent.map(percent),
+                "Today's P/L ($)": num["unrealized_intraday_pl"].map(dollars),
+                "Total P/L (%)": total_pl_percent.map(percent),
+                "Total P/L ($)": num["unrealized_pl"].map(dollars),
+            })
+            return table.to_dict("records")
         except Exception as e:
             print(f"Error fetching positions: {e}")
             return []
 
     @staticmethod
+    @rate_limited("alpaca")
     def get_recent_orders(page=1, page_size=7):
-        """Get recent orders from Alpaca account, with simple pagination."""
+        """
+        Get recent orders from Alpaca account, with simple pagination.
+        Walking the pages in order fetches only one page per call: each page remembers
+        where the next one starts and passes it to Alpaca as `until`.
+        """
         try:
             client = get_alpaca_trading_client()
-            req = GetOrdersRequest(status="all", limit=page_size * page, nested=False)
-            orders_page = client.get_orders(req)
-            orders = list(orders_page)
+            if page == 1:
+                # New orders shift every page, so a fresh first page resets the cursors
+                with _order_cursors_lock:
+                    _order_cursors.clear()
+                cursor = None
+            else:
+                cursor = _get_order_cursor(page_size, page)
+
+            if page == 1 or cursor is not None:
+                req = GetOrdersRequest(status="all", limit=page_size, until=cursor, nested=False)
+                orders = list(client.get_orders(req))
+            else:
+                # No cursor for a page reached directly: fetch everything up to it
+                req = GetOrdersRequest(status="all", limit=page_size * page, nested=False)
+                orders = list(client.get_orders(req))[(page - 1) * page_size:]
+            _remember_order_cursor(page_size, page, orders)
 
             # Convert orders to a list of dictionaries
             orders_data = []
@@ -348,15 +680,14 @@ class AlpacaUtils:
                     "Source": order.client_order_id
                 })
 
-            # Now slice out the exact page we want (newest first)
-            start = (page - 1) * page_size
-            return orders_data[start : start + page_size]
+            return orders_data[:page_size]
 
         except Exception as e:
             print(f"Error fetching orders: {e}")
             return []
 
     @staticmethod
+    @rate_limited("alpaca")
     def get_account_info():
         """Get account information from Alpaca"""
         try:
@@ -388,6 +719,42 @@ class AlpacaUtils:
                 "daily_change_percent": 0
             } 
 
+    @staticmethod
+    def get_account_snapshot(include_orders: bool = False, orders_page: int = 1,
+                             orders_page_size: int = 7, quote_symbols=(),
+                             include_account: bool = True) -> dict:
+        """
+        Fetch positions, account info and, optionally, recent orders and latest
+        quotes concurrently, so the snapshot costs one round-trip instead of one per call.
+
+        Args:
+            include_orders: Also fetch a page of recent orders
+            orders_page: Page of recent orders to fetch
+            orders_page_size: Number of orders per page
+            quote_symbols: Symbols whose latest quote to fetch
+            include_account: Also fetch the account info
+
+        Returns:
+            dict with "positions", plus "account", "orders" and "quotes" ({symbol: quote})
+            when requested; each value is what the individual AlpacaUtils call returns
+        """
+        calls = {"positions": AlpacaUtils.get_positions_data}
+        if include_account:
+            calls["account"] = AlpacaUtils.get_account_info
+        if include_orders:
+            calls["orders"] = functools.partial(
+                AlpacaUtils.get_recent_orders, page=orders_page, page_size=orders_page_size
+            )
+        quote_symbols = list(dict.fromkeys(quote_symbols))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls) + len(quote_symbols)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+            quote_futures = {symbol: executor.submit(AlpacaUtils.get_latest_quote, symbol) for symbol in quote_symbols}
+            snapshot = {name: future.result() for name, future in futures.items()}
+            if quote_symbols:
+                snapshot["quotes"] = {symbol: future.result() for symbol, future in quote_futures.items()}
+        return snapshot
+
     @staticmethod
     def get_current_position_state(symbol: str) -> str:
         """Return current position state for a symbol in the Alpaca account.
@@ -405,41 +772,35 @@ class AlpacaUtils:
         try:
             # Skip if credentials are missing – the helper will raise inside but we
             # want to fail gracefully and just assume no position.
-            client = get_alpaca_trading_client()
-
-            # `get_all_positions()` is more broadly supported across Alpaca
-            # versions than `get_position(symbol)` and avoids raising when the
-            # asset is not found.
-            positions = client.get_all_positions()
-
-            # Normalise the requested symbol for comparisons – Alpaca symbols
+            # Normalise the requested symbol for the lookup – Alpaca symbols
             # for crypto are often returned without the "/" (e.g. "BTCUSD"), so
-            # we remove it for the comparison.
+            # we remove it.
             requested_symbol_key = symbol.upper().replace("/", "")
+            pos = _get_positions_indexed().get(requested_symbol_key)
+            if pos is None:
+                # No open position for symbol.
+                return "NEUTRAL"
 
-            for pos in positions:
-                if pos.symbol.upper() == requested_symbol_key:
-                    try:
-                        qty = float(pos.qty)
-                    except (ValueError, AttributeError):
-                        qty = 0.0
-
-                    if qty > 0:
-                        return "LONG"
-                    elif qty < 0:
-                        return "SHORT"
-                    else:
-                        # Zero quantity technically shouldn't appear but treat as
-                        # neutral just in case.
-                        return "NEUTRAL"
-            # If we fall through the loop there is no open position for symbol.
-            return "NEUTRAL"
+            try:
+                qty = float(pos.qty)
+            except (ValueError, AttributeError):
+                qty = 0.0
+
+            if qty > 0:
+                return "LONG"
+            elif qty < 0:
+                return "SHORT"
+            else:
+                # Zero quantity technically shouldn't appear but treat as
+                # neutral just in case.
+                return "NEUTRAL"
         except Exception as e:
             # Log and default to neutral so agent prompts still work.
             print(f"Error determining current position for {symbol}: {e}")
             return "NEUTRAL"
 
     @staticmethod
+    @rate_limited("alpaca")
     def place_market_order(symbol: str, side: str, notional: float = None, qty: float = None) -> dict:
         """
         Place a market order with Alpaca
@@ -459,12 +820,9 @@ class AlpacaUtils:
             # Normalize symbol for Alpaca (remove "/" for crypto)
             alpaca_symbol = symbol.upper().replace("/", "")
             
-            # Determine order side
-            order_side = OrderSide.BUY if side.lower() == "buy" else OrderSide.SELL
-            
-            # Determine proper time-in-force: crypto orders only allow GTC
-            is_crypto = "/" in symbol.upper()
-            tif = TimeInForce.GTC if is_crypto else TimeInForce.DAY
+            # Determine order side and time-in-force
+            order_side = _SIDE_MAP.get(side.lower(), OrderSide.SELL)
+            tif = _TIF_MAP["/" in symbol]
 
             # Create market order request
             if notional and notional > 0:
@@ -488,6 +846,7 @@ class AlpacaUtils:
             
             # Submit the order
             order = client.submit_order(order_request)
+            _invalidate_positions()
             
             return {
                 "success": True,
@@ -506,6 +865,7 @@ class AlpacaUtils:
             return {"success": False, "error": error_msg}
 
     @staticmethod
+    @rate_limited("alpaca")
     def close_position(symbol: str, percentage: float = 100.0) -> dict:
         """
         Close a position (partially or completely)
@@ -533,6 +893,7 @@ class AlpacaUtils:
                     percentage=str(percentage / 100.0)  # Convert percentage to decimal string
                 )
                 order = client.close_position(alpaca_symbol, close_request)
+            _invalidate_positions()
             
             return {
                 "success": True,
@@ -549,9 +910,60 @@ class AlpacaUtils:
             print(error_msg)
             return {"success": False, "error": error_msg}
 
+    @staticmethod
+    def execute_trading_actions_bulk(orders: Union[List[dict], dict], allow_shorts: bool = False) -> List[dict]:
+        """
+        Execute trading actions for several symbols concurrently
+        
+        Args:
+            orders: execute_trading_action keyword arguments, one dict per symbol
+                    (symbol, current_position, signal, dollar_amount, allow_shorts),
+                    or a {symbol: (current_position, signal, dollar_amount)} mapping
+            allow_shorts: Whether short selling is allowed, for orders that don't say
+            
+        Returns:
+            List of execution results, in the order of `orders`; several orders for
+            one symbol run one after another, so each sees the positions the
+            previous one left
+        """
+        if not orders:
+            return []
+        if isinstance(orders, dict):
+            orders = [
+                {"symbol": symbol, "current_position": position, "signal": signal, "dollar_amount": amount}
+                for symbol, (position, signal, amount) in orders.items()
+            ]
+        orders = [{"allow_shorts": allow_shorts, **order} for order in orders]
+        
+        # Alpaca has no batch order endpoint, but the quotes used for sizing can be
+        # fetched in one request up front instead of one per order
+        quotes = AlpacaUtils.get_latest_quotes([order["symbol"] for order in orders])
+        
+        # Group by symbol: concurrent orders for one symbol would all size
+        # themselves off the same cached positions snapshot
+        by_symbol = {}
+        for i, order in enumerate(orders):
+            by_symbol.setdefault(order["symbol"], []).append(i)
+
+        def run_symbol(indices):
+            return [
+                AlpacaUtils.execute_trading_action(
+                    **{**orders[i], "quote": orders[i].get("quote") or quotes.get(orders[i]["symbol"])}
+                )
+                for i in indices
+            ]
+
+        results = [None] * len(orders)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(by_symbol))) as executor:
+            for indices, symbol_results in zip(by_symbol.values(), executor.map(run_symbol, by_symbol.values())):
+                for i, result in zip(indices, symbol_results):
+                    results[i] = result
+        return results
+
     @staticmethod
     def execute_trading_action(symbol: str, current_position: str, signal: str, 
-                             dollar_amount: float, allow_shorts: bool = False) -> dict:
+                             dollar_amount: float, allow_shorts: bool = False,
+                             quote: Optional[dict] = None) -> dict:
         """
         Execute trading action based on current position and signal
         
@@ -561,6 +973,7 @@ class AlpacaUtils:
             signal: Trading signal from analysis
             dollar_amount: Dollar amount for trades
             allow_shorts: Whether short selling is allowed
+            quote: Latest quote of the symbol if already fetched; fetched when sizing an order otherwise
             
         Returns:
             Dictionary with execution results
@@ -568,25 +981,19 @@ class AlpacaUtils:
         try:
             results = []
             
+            # Helper to calculate integer quantity for short orders (or any qty-based order)
+            def _calc_qty(sym: str, amount: float) -> int:
+                """Return integer share qty based on latest quote price."""
+                try:
+                    return _qty_from_quote(quote or AlpacaUtils.get_latest_quote(sym), amount)
+                except Exception:
+                    # Fallback: at least 1 share
+                    return 1
+            
             if allow_shorts:
                 # Trading mode: LONG/NEUTRAL/SHORT signals
                 signal = signal.upper()
                 
-                # Helper to calculate integer quantity for short orders (or any qty-based order)
-                def _calc_qty(sym: str, amount: float) -> int:
-                    """Return integer share qty based on latest quote price."""
-                    try:
-                        quote = AlpacaUtils.get_latest_quote(sym)
-                        price = quote.get("bid_price") or quote.get("ask_price")
-                        if not price or price <= 0:
-                            # Fallback: assume $1 to avoid div-by-zero; will raise later if Alpaca rejects
-                            price = 1
-                        qty = int(amount / price)
-                        return max(qty, 1)
-                    except Exception:
-                        # Fallback: at least 1 share
-                        return 1
-                
                 if current_position == "LONG":
                     if signal == "LONG":
                         results.append({"action": "hold", "message": f"Keeping LONG position in {symbol}"})
@@ -2,6 +2,25 @@ import requests
 import re
 import datetime
 from .config import get_api_key
+from .utils import HTTP_TIMEOUT, get_http_session
+from ._cache_db import get_or_fetch
+from ._ratelimit import ProviderRateLimitError, rate_limited, retry_transient
+
+
+# Boundary between sentences: whitespace after terminal punctuation
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@retry_transient()
+@rate_limited("coindesk")
+def _fetch_news_json(url: str, api_key: str) -> dict:
+    response = get_http_session().get(url, headers={"Authorization": f"Apikey {api_key}"}, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    news_data = response.json()
+    # CryptoCompare reports rate limiting as a 200 with an error message
+    if news_data.get("Response") == "Error" and "rate limit" in str(news_data.get("Message", "")).lower():
+        raise ProviderRateLimitError(news_data["Message"])
+    return news_data
 
 
 def get_news(symbol: str, n: int = 5):
@@ -18,16 +37,13 @@ def get_news(symbol: str, n: int = 5):
     api_key = get_api_key("coindesk_api_key", "COINDESK_API_KEY")
     if not api_key:
         print("COINDESK_API_KEY not found in environment variables.")
-        return "COINDESK_API_KEY not found in environment variables."
+        return "Error: COINDESK_API_KEY not found in environment variables."
 
     url = f"https://min-api.cryptocompare.com/data/v2/news/?lang=EN&categories={symbol}"
 
-    headers = {"Authorization": f"Apikey {api_key}"}
-
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        news_data = response.json()
+        # The raw feed is kept on disk, so any number of sentences reuses one download
+        news_data = get_or_fetch(f"coindesk:{url}", lambda: _fetch_news_json(url, api_key), "news")
 
         if news_data.get("Type") != 100 or not news_data.get("Data"):
             return f"No news found for {symbol}."
@@ -42,15 +58,14 @@ def get_news(symbol: str, n: int = 5):
             published_timestamp = article.get("published_on", 0)
             published_date = datetime.datetime.fromtimestamp(published_timestamp).strftime('%Y-%m-%d %H:%M:%S')
 
-            # Split body into sentences and take the first N.
-            sentences = re.split(r"(?<=[.!?])\s+", body)
-            summary = " ".join(sentences[:n])
+            # Take the first N sentences; maxsplit stops scanning the body after them.
+            summary = " ".join(_SENT_RE.split(body, maxsplit=n)[:n])
 
             formatted_news.append(f"### {title} (source: {source}, published: {published_date})\n\n{summary}\n\n")
 
         return "".join(formatted_news)
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ProviderRateLimitError) as e:
         return f"Error fetching news from CryptoCompare: {e}"
     except Exception as e:
-        return f"An error occurred: {e}" 
\ No newline at end of file
+        return f"Error processing CryptoCompare news: {e}" 
\ No newline at end of file
@@ -1,9 +1,15 @@
 # defillama_utils.py
 
-import requests
+import concurrent.futures
 import datetime
+import functools
+import time
 from typing import List, Dict, Tuple, Optional
 
+from .utils import HTTP_TIMEOUT, get_http_session
+from ._cache_db import get_or_fetch
+from ._ratelimit import rate_limited
+
 """defillama_utils.py — lightweight helpers that pull free on‑chain fundamentals
 from DeFi Llama’s open API so your agent can issue Buy / Sell / Hold
 signals without paid data feeds.
@@ -14,22 +20,57 @@ All endpoints used here require **no API key**.
 
 BASE_URL = "https://api.llama.fi"
 
+# The protocols list changes over days, so it is refetched at most once a day
+PROTOCOLS_TTL = 86_400
+
+# How long raw responses are kept on disk: TVL moves intraday, fees are daily totals
+TVL_TTL = datetime.timedelta(hours=1)
+FEES_TTL = datetime.timedelta(days=1)
+
+# Threads issuing the independent per-protocol requests side by side
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="defillama")
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _fetch_json(endpoint: str) -> Dict:
-    """GET a DeFi Llama endpoint and return its JSON body.
+def _fetch_json(endpoint: str, ttl: datetime.timedelta) -> Dict:
+    """GET a DeFi Llama endpoint and return its JSON body, reusing it from disk for `ttl`.
     Raises requests.HTTPError on 4xx / 5xx.
     """
-    resp = requests.get(f"{BASE_URL}{endpoint}", timeout=10)
+    return get_or_fetch(f"defillama:{endpoint}", lambda: _get_json(endpoint), ttl)
+
+
+@rate_limited("defillama")
+def _get_json(endpoint: str) -> Dict:
+    resp = get_http_session().get(f"{BASE_URL}{endpoint}", timeout=HTTP_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
 
 def _get_protocols() -> List[Dict]:
-    """Return the full list of tracked protocols (cached by caller)."""
-    return _fetch_json("/protocols")
+    """Return the full list of tracked protocols (cached for PROTOCOLS_TTL seconds)."""
+    return _protocols_by_symbol(int(time.time() // PROTOCOLS_TTL))[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _protocols_by_symbol(ttl_hash: int) -> Tuple[List[Dict], Dict[str, Tuple[str, str]]]:
+    """Fetch the protocols list and index it by upper‑case symbol.
+
+    `ttl_hash` changes once per PROTOCOLS_TTL window, which expires the single
+    cached entry. The first protocol listing a symbol wins.
+    """
+    protocols = _fetch_json("/protocols", datetime.timedelta(seconds=PROTOCOLS_TTL))
+    index: Dict[str, Tuple[str, str]] = {}
+    for proto in protocols:
+        proto_symbol = proto.get("symbol")
+        if not proto_symbol:
+            continue
+        # symbol can be string or list in API response
+        symbols = proto_symbol if isinstance(proto_symbol, list) else [proto_symbol]
+        for sym in symbols:
+            index.setdefault(sym.upper(), (proto.get("slug"), proto.get("name")))
+    return protocols, index
 
 
 def _find_slug(symbol: str) -> Tuple[Optional[str], Optional[str]]:
@@ -39,20 +80,8 @@ def _find_slug(symbol: str) -> Tuple[Optional[str], Optional[str]]:
     slug; in that case the caller should treat the symbol as a chain name and
     use chain‑level endpoints.
     """
-    symbol = symbol.upper()
-    for proto in _get_protocols():
-        proto_symbol = proto.get("symbol")
-        if not proto_symbol:
-            continue
-        # symbol can be string or list in API response
-        symbols = (
-            [s.upper() for s in proto_symbol]
-            if isinstance(proto_symbol, list)
-            else [proto_symbol.upper()]
-        )
-        if symbol in symbols:
-            return proto.get("slug"), proto.get("name")
-    return None, None
+    index = _protocols_by_symbol(int(time.time() // PROTOCOLS_TTL))[1]
+    return index.get(symbol.upper(), (None, None))
 
 
 # ---------------------------------------------------------------------------
@@ -79,9 +108,12 @@ def get_fundamentals(symbol: str, lookback_days: int = 30) -> str:
     if not slug:
         return f"Symbol '{symbol}' not found on DeFi Llama."
 
+    # TVL and fees are independent requests: fetch the fees in the background
+    fees_future = _pool.submit(_fetch_json, f"/summary/fees/{slug}", FEES_TTL)
+
     # ---------------- TVL ----------------
     try:
-        proto_json = _fetch_json(f"/protocol/{slug}")
+        proto_json = _fetch_json(f"/protocol/{slug}", TVL_TTL)
         tvl_series = sorted(proto_json.get("tvl", []), key=lambda d: d["date"])
     except Exception as exc:
         return f"Error fetching TVL data: {exc}"
@@ -101,7 +133,7 @@ def get_fundamentals(symbol: str, lookback_days: int = 30) -> str:
     # ---------------- Fees / Revenue ----------------
     fees_sum = rev_sum = None
     try:
-        fees_json = _fetch_json(f"/summary/fees/{slug}")
+        fees_json = fees_future.result()
         fees_chart = fees_json.get("totalDataChart", [])
         rev_chart = fees_json.get("revenueDataChart", [])
 
@@ -134,6 +166,25 @@ def get_fundamentals(symbol: str, lookback_days: int = 30) -> str:
     return "\n".join(lines)
 
 
+def get_fundamentals_multi(symbols: List[str], lookback_days: int = 30) -> Dict[str, str]:
+    """Return get_fundamentals for several symbols, fetched concurrently.
+
+    Args:
+        symbols: Token tickers such as ['UNI', 'GMX'].
+        lookback_days: Window size for change / sum calculations.
+
+    Returns:
+        {symbol: markdown summary}, in the order of *symbols*.
+    """
+    # Warm the shared protocols list once instead of racing to fetch it per symbol
+    _get_protocols()
+    # Symbols fan out on their own threads: each one also submits its fees
+    # request to _pool, which must not wait on its own workers
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, max(1, len(symbols)))) as executor:
+        summaries = executor.map(lambda s: get_fundamentals(s, lookback_days), symbols)
+        return dict(zip(symbols, summaries))
+
+
 # ---------------------------------------------------------------------------
 # Quick‑check (only runs when executed directly)
 # ---------------------------------------------------------------------------
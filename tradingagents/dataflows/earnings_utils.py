@@ -1,8 +1,10 @@
 import requests
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Annotated, Dict, List, Optional
 from .config import get_api_key, DATA_DIR
+from ._ratelimit import rate_limited, retry_transient
+from ._cache_db import get_earnings_coverage, store_earnings, read_earnings
 import os
 import pandas as pd
 
@@ -16,10 +18,71 @@ def get_earnings_calendar_api_key():
     return api_key
 
 
+# Earnings reported this many days ago are final: estimates and actuals no longer change
+EARNINGS_SETTLED_DAYS = 90
+
+
+@retry_transient()
+@rate_limited("finnhub")
+def _fetch_finnhub_earnings(ticker: str, start_date: str, end_date: str) -> list:
+    """Return the raw Finnhub earnings calendar rows for a ticker and date range"""
+    from .finnhub_utils import get_finnhub_client
+    client = get_finnhub_client()
+
+    earnings_calendar = client.earnings_calendar(
+        _from=start_date,
+        to=end_date,
+        symbol=ticker
+    )
+    return earnings_calendar.get('earningsCalendar') or []
+
+
+def _get_earnings_rows(ticker: str, start_date: str, end_date: str) -> list:
+    """
+    Earnings calendar rows through the on-disk store, most recent first.
+    Settled quarters are kept for good and only missing ranges are fetched;
+    the recent, still-changing part of the range is always fetched fresh.
+    """
+    req_start = date.fromisoformat(start_date)
+    req_end = date.fromisoformat(end_date)
+    settled_end = min(req_end, date.today() - timedelta(days=EARNINGS_SETTLED_DAYS))
+
+    rows = []
+    if settled_end >= req_start:
+        coverage = get_earnings_coverage(ticker)
+        if coverage:
+            cov_start, cov_end = date.fromisoformat(coverage[0]), date.fromisoformat(coverage[1])
+            gaps = []
+            if req_start < cov_start:
+                gaps.append((req_start, cov_start - timedelta(days=1)))
+            if settled_end > cov_end:
+                gaps.append((cov_end + timedelta(days=1), settled_end))
+        else:
+            cov_start = cov_end = None
+            gaps = [(req_start, settled_end)]
+
+        for gap_start, gap_end in gaps:
+            fetched = _fetch_finnhub_earnings(ticker, gap_start.isoformat(), gap_end.isoformat())
+            # Each gap borders the stored range, so the coverage stays contiguous
+            cov_start = min(gap_start, cov_start) if cov_start else gap_start
+            cov_end = max(gap_end, cov_end) if cov_end else gap_end
+            store_earnings(ticker, fetched, (cov_start.isoformat(), cov_end.isoformat()))
+
+        rows = read_earnings(ticker, start_date, settled_end.isoformat())
+        live_start = settled_end + timedelta(days=1)
+    else:
+        live_start = req_start
+
+    if live_start <= req_end:
+        rows = _fetch_finnhub_earnings(ticker, live_start.isoformat(), end_date) + rows
+    return rows
+
+
 def get_finnhub_earnings_calendar(
     ticker: str,
     start_date: str,
-    end_date: str
+    end_date: str,
+    earnings: Optional[list] = None
 ) -> str:
     """
     Get earnings calendar data from Finnhub API
@@ -28,31 +91,26 @@ def get_finnhub_earnings_calendar(
         ticker: Stock ticker symbol
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        earnings: Calendar rows already at hand; fetched from Finnhub when omitted
         
     Returns:
         Formatted string with earnings calendar data
     """
     try:
-        from .finnhub_utils import get_finnhub_client
-        client = get_finnhub_client()
-        
         # Convert dates to timestamps
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(start_date)
+        end_dt = datetime.fromisoformat(end_date)
         
         # Get earnings calendar
-        earnings_calendar = client.earnings_calendar(
-            _from=start_date,
-            to=end_date,
-            symbol=ticker
-        )
+        if earnings is None:
+            earnings = _fetch_finnhub_earnings(ticker, start_date, end_date)
         
-        if not earnings_calendar.get('earningsCalendar'):
+        if not earnings:
             return f"No earnings data found for {ticker} between {start_date} and {end_date}"
         
         result = f"## {ticker} Earnings Calendar ({start_date} to {end_date})\n\n"
         
-        for earning in earnings_calendar['earningsCalendar']:
+        for earning in earnings:
             date = earning.get('date', 'N/A')
             eps_estimate = earning.get('epsEstimate', 'N/A')
             eps_actual = earning.get('epsActual', 'N/A')
@@ -214,12 +272,14 @@ def get_earnings_surprises_analysis(
     """
     try:
         # Calculate date range (approximately 2 years for 8 quarters)
-        current_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+        current_dt = datetime.fromisoformat(curr_date)
         start_dt = current_dt - timedelta(days=lookback_quarters * 90)  # Rough quarter approximation
         start_date = start_dt.strftime("%Y-%m-%d")
         
-        # Get earnings data
-        earnings_data = get_finnhub_earnings_calendar(ticker, start_date, curr_date)
+        # Get earnings data, reusing the stored settled quarters
+        earnings_data = get_finnhub_earnings_calendar(
+            ticker, start_date, curr_date, _get_earnings_rows(ticker, start_date, curr_date)
+        )
         
         if "No earnings data found" in earnings_data or "Error" in earnings_data:
             return earnings_data
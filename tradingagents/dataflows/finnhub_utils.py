@@ -1,17 +1,26 @@
 import json
 import os
+import threading
 import finnhub
 from .config import get_finnhub_api_key
 
+_clients = {}
+_clients_lock = threading.Lock()
+
 
 def get_finnhub_client():
     """
     Get a finnhub client using the API key from environment variables or config.
+    Clients are shared per API key so their HTTP session (and its connections) is reused.
     """
     api_key = get_finnhub_api_key()
     if not api_key:
         raise ValueError("Finnhub API key not found. Please set FINNHUB_API_KEY environment variable or in .env file.")
-    return finnhub.Client(api_key=api_key)
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = finnhub.Client(api_key=api_key)
+    return client
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -1,9 +1,10 @@
 import json
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import time
 import random
+from .utils import HTTP_TIMEOUT, get_http_session
+from ._ratelimit import rate_limited
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -23,11 +24,12 @@ def is_rate_limited(response):
     wait=wait_exponential(multiplier=1, min=4, max=60),
     stop=stop_after_attempt(5),
 )
+@rate_limited("google")
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Reduced delay for better performance while still avoiding detection
     time.sleep(random.uniform(1, 3))
-    response = requests.get(url, headers=headers)
+    response = get_http_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
     return response
 
 
@@ -40,10 +42,10 @@ def getNewsData(query, start_date, end_date, max_pages=3):
     max_pages: int - maximum number of pages to scrape (default 3, each page has ~10 results)
     """
     if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+        start_date = datetime.fromisoformat(start_date)
         start_date = start_date.strftime("%m/%d/%Y")
     if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        end_date = datetime.fromisoformat(end_date)
         end_date = end_date.strftime("%m/%d/%Y")
 
     headers = {
@@ -9,14 +9,29 @@ from .defillama_utils import get_fundamentals as get_defillama_fundamentals_util
 from .earnings_utils import get_earnings_calendar_data, get_earnings_surprises_analysis
 from .macro_utils import get_macro_economic_summary, get_economic_indicators_report, get_treasury_yield_curve
 from dateutil.relativedelta import relativedelta
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from datetime import date, datetime, timedelta
+import functools
 import json
 import os
+import threading
 import pandas as pd
 from tqdm import tqdm
 from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR, get_api_key
+from ._cache_db import disk_cached
+from .utils import parse_date
+
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+
+def _get_openai_client(api_key):
+    """Return a shared OpenAI client per API key, keeping its connection pool warm"""
+    with _openai_clients_lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = _openai_clients[api_key] = OpenAI(api_key=api_key)
+    return client
 
 
 def get_finnhub_news(
@@ -39,9 +54,7 @@ def get_finnhub_news(
 
     """
 
-    start_date = datetime.strptime(curr_date, "%Y-%m-%d")
-    before = start_date - relativedelta(days=look_back_days)
-    before = before.strftime("%Y-%m-%d")
+    before = (date.fromisoformat(curr_date) - timedelta(days=look_back_days)).isoformat()
 
     result = get_data_in_range(ticker, before, curr_date, "news_data", DATA_DIR)
 
@@ -78,7 +91,7 @@ def get_finnhub_company_insider_sentiment(
         str: a report of the sentiment in the past 15 days starting at curr_date
     """
 
-    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
+    date_obj = datetime.fromisoformat(curr_date)
     before = date_obj - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
@@ -119,7 +132,7 @@ def get_finnhub_company_insider_transactions(
         str: a report of the company's insider transaction/trading informtaion in the past 15 days
     """
 
-    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
+    date_obj = datetime.fromisoformat(curr_date)
     before = date_obj - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
@@ -144,6 +157,7 @@ def get_finnhub_company_insider_transactions(
     )
 
 
+@disk_cached("news")
 def get_coindesk_news(
     ticker: Annotated[str, "Ticker symbol, e.g. 'BTCUSD', 'ETH', etc."],
     num_sentences: Annotated[int, "Number of sentences to include from news body."] = 5,
@@ -169,6 +183,7 @@ def get_coindesk_news(
     return get_coindesk_news_util(crypto_symbol, n=num_sentences)
 
 
+@disk_cached("financials")
 def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
@@ -216,6 +231,7 @@ def get_simfin_balance_sheet(
     )
 
 
+@disk_cached("financials")
 def get_simfin_cashflow(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
@@ -263,6 +279,7 @@ def get_simfin_cashflow(
     )
 
 
+@disk_cached("financials")
 def get_simfin_income_statements(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
@@ -310,6 +327,7 @@ def get_simfin_income_statements(
     )
 
 
+@disk_cached("news")
 def get_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -317,7 +335,7 @@ def get_google_news(
 ) -> str:
     query = query.replace(" ", "+")
 
-    start_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    start_date = datetime.fromisoformat(curr_date)
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
@@ -351,13 +369,13 @@ def get_reddit_global_news(
         str: A formatted dataframe containing the latest news articles posts on reddit and meta information in these columns: "created_utc", "id", "title", "selftext", "score", "num_comments", "url"
     """
 
-    start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    start_date = datetime.fromisoformat(start_date)
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
     posts = []
     # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = datetime.fromisoformat(before)
 
     total_iterations = (start_date - curr_date).days + 1
     pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
@@ -405,13 +423,13 @@ def get_reddit_company_news(
         str: A formatted dataframe containing the latest news articles posts on reddit and meta information in these columns: "created_utc", "id", "title", "selftext", "score", "num_comments", "url"
     """
 
-    start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    start_date = datetime.fromisoformat(start_date)
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
     posts = []
     # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = datetime.fromisoformat(before)
 
     total_iterations = (start_date - curr_date).days + 1
     pbar = tqdm(
@@ -469,30 +487,31 @@ def get_stock_stats_indicators_window(
         str: a report of the technical indicator for the stock
     """
     curr_date_dt = pd.to_datetime(curr_date)
-    dates = []
     values = []
 
-    # Generate dates
-    for i in range(look_back_days, 0, -1):
-        date = curr_date_dt - pd.DateOffset(days=i)
-        dates.append(date.strftime("%Y-%m-%d"))
-
-    # Add current date
+    # Generate the lookback dates in one vectorized call, then add the current date
+    dates = pd.date_range(end=curr_date_dt, periods=look_back_days + 1, freq="D")[:-1]
+    dates = dates.strftime("%Y-%m-%d").tolist()
     dates.append(curr_date)
 
-    # Get indicator values for each date
-    for date in dates:
-        try:
-            value = StockstatsUtils.get_stock_stats(
-                symbol=symbol,
-                indicator=indicator,
-                curr_date=date,
-                data_dir=DATA_DIR,
-                online=online,
-            )
-            values.append(value)
-        except Exception as e:
-            values.append("N/A")
+    if online:
+        # Compute the indicator over the whole history once and read every date off it
+        frame = get_stock_stats_indicators_frame(symbol, [indicator], dates)
+        values = ["N/A" if pd.isna(value) else float(value) for value in frame[indicator]]
+    else:
+        # Get indicator values for each date
+        for day in dates:
+            try:
+                value = StockstatsUtils.get_stock_stats(
+                    symbol=symbol,
+                    indicator=indicator,
+                    curr_date=day,
+                    data_dir=DATA_DIR,
+                    online=online,
+                )
+                values.append(value)
+            except Exception as e:
+                values.append("N/A")
 
     # Format the result
     result = f"## {indicator} for {symbol} from {dates[0]} to {dates[-1]}:\n\n"
@@ -502,6 +521,43 @@ def get_stock_stats_indicators_window(
     return result
 
 
+@functools.lru_cache(maxsize=64)
+def _cached_indicator_frame(symbol, indicators, day):
+    """Indicator frame of `symbol`, computed at most once per day.
+    The online price data it is built from is itself refreshed daily, so `day`
+    (today's date) only serves to let yesterday's entries fall out of use.
+    Raises LookupError when there is not enough price data, so failures are not
+    cached. Callers must not modify the returned frame."""
+    frame = StockstatsUtils.get_stock_stats_frame(symbol, list(indicators))
+    if frame.empty:
+        raise LookupError(f"No indicator data for {symbol}")
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+def get_stock_stats_indicators_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list, "technical indicators to compute"],
+    dates: Annotated[list, "trading dates to report, YYYY-mm-dd"],
+) -> pd.DataFrame:
+    """
+    Get several technical indicators for a stock on several dates, computed once
+    Args:
+        symbol: ticker symbol of the company
+        indicators: technical indicators to compute
+        dates: dates to report, YYYY-mm-dd
+    Returns:
+        pd.DataFrame: one row per requested date (its value as of the most recent
+        trading day on or before it) and one column per indicator; NaN where unavailable
+    """
+    try:
+        frame = _cached_indicator_frame(symbol, tuple(indicators), date.today().isoformat())
+    except LookupError:
+        return pd.DataFrame(index=dates, columns=list(indicators), dtype=float)
+    result = frame.reindex(pd.to_datetime(dates), method="ffill")
+    result.index = list(dates)
+    return result
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -533,6 +589,7 @@ def get_stockstats_indicator(
         return f"Error getting {indicator} for {symbol}: {str(e)}"
 
 
+@disk_cached("news")
 def get_stock_news_openai(ticker, curr_date):
     # Get API key from environment variables or config
     api_key = get_api_key("openai_api_key", "OPENAI_API_KEY")
@@ -540,14 +597,14 @@ def get_stock_news_openai(ticker, curr_date):
         return f"Error: OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
     
     try:
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         
         # Get the selected quick model from config
         config = get_config()
         model = config.get("quick_think_llm", "gpt-4o-mini")  # fallback to default
         
         from datetime import datetime, timedelta
-        start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
+        start_date = (datetime.fromisoformat(curr_date) - timedelta(days=7)).strftime("%Y-%m-%d")
 
         response = client.chat.completions.create(
             model=model,
@@ -575,6 +632,7 @@ def get_stock_news_openai(ticker, curr_date):
         return f"Error fetching social media analysis for {ticker}: {str(e)}"
 
 
+@disk_cached("news")
 def get_global_news_openai(curr_date):
     # Get API key from environment variables or config
     api_key = get_api_key("openai_api_key", "OPENAI_API_KEY")
@@ -582,14 +640,14 @@ def get_global_news_openai(curr_date):
         return f"Error: OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
     
     try:
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         
         # Get the selected quick model from config
         config = get_config()
         model = config.get("quick_think_llm", "gpt-4o-mini")  # fallback to default
         
         from datetime import datetime, timedelta
-        start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
+        start_date = (datetime.fromisoformat(curr_date) - timedelta(days=7)).strftime("%Y-%m-%d")
 
         response = client.chat.completions.create(
             model=model,
@@ -618,6 +676,7 @@ def get_global_news_openai(curr_date):
         return f"Error fetching global news analysis: {str(e)}"
 
 
+@disk_cached("daily")
 def get_fundamentals_openai(ticker, curr_date):
     # Get API key from environment variables or config
     api_key = get_api_key("openai_api_key", "OPENAI_API_KEY")
@@ -625,14 +684,14 @@ def get_fundamentals_openai(ticker, curr_date):
         return f"Error: OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
     
     try:
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         
         # Get the selected quick model from config
         config = get_config()
         model = config.get("quick_think_llm", "gpt-4o-mini")  # fallback to default
         
         from datetime import datetime, timedelta
-        start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
+        start_date = (datetime.fromisoformat(curr_date) - timedelta(days=30)).strftime("%Y-%m-%d")
 
         response = client.chat.completions.create(
             model=model,
@@ -664,6 +723,7 @@ def get_fundamentals_openai(ticker, curr_date):
         return f"Error fetching fundamental analysis for {ticker}: {str(e)}"
 
 
+@disk_cached("daily")
 def get_defillama_fundamentals(
     ticker: Annotated[str, "Crypto ticker symbol (without USD/USDT suffix)"],
     lookback_days: Annotated[int, "Number of days to look back for data"] = 30,
@@ -706,44 +766,66 @@ def get_alpaca_data_window(
         str: a report of the stock data
     """
     try:
-        # Calculate start date based on look_back_days
-        if curr_date:
-            curr_dt = pd.to_datetime(curr_date)
-        else:
-            curr_dt = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-            
-        start_dt = curr_dt - pd.Timedelta(days=look_back_days)
-        start_date = start_dt.strftime("%Y-%m-%d")
-        
-        # Get data from Alpaca - don't pass end_date to avoid subscription limitations
-        data = AlpacaUtils.get_stock_data(
-            symbol=symbol,
-            start_date=start_date,
-            timeframe=timeframe
-        )
+        start_date, data = get_alpaca_data_window_df(symbol, curr_date, look_back_days, timeframe)
         
         if data.empty:
             return f"No data found for {symbol} from {start_date} to present"
         
-        # Format the result
+        # Format the result as CSV: one pandas call, and far fewer tokens than a padded table
         result = f"## Stock data for {symbol} from {start_date} to present:\n\n"
-        result += data.to_string()
-        
-        # Add latest quote if available
-        try:
-            latest_quote = AlpacaUtils.get_latest_quote(symbol)
-            if latest_quote:
-                result += f"\n\n## Latest Quote for {symbol}:\n"
-                result += f"Bid: {latest_quote['bid_price']} ({latest_quote['bid_size']}), "
-                result += f"Ask: {latest_quote['ask_price']} ({latest_quote['ask_size']}), "
-                result += f"Time: {latest_quote['timestamp']}"
-        except Exception as quote_error:
-            result += f"\n\nCould not fetch latest quote: {str(quote_error)}"
+        result += data.to_csv(index=False, float_format="%.4f")
+        result += get_alpaca_latest_quote_text(symbol)
         
         return result
     except Exception as e:
         return f"Error getting stock data for {symbol}: {str(e)}"
 
+
+def get_alpaca_data_window_df(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"] = None,
+    look_back_days: Annotated[int, "how many days to look back"] = 60,
+    timeframe: Annotated[str, "Timeframe for data: 1Min, 5Min, 15Min, 1Hour, 1Day"] = "1Day",
+) -> tuple:
+    """
+    Get a window of stock data from Alpaca as a DataFrame
+    Args:
+        symbol: ticker symbol of the company
+        curr_date: The current trading date you are trading on, YYYY-mm-dd (optional - if not provided, will use today's date)
+        look_back_days: how many days to look back
+        timeframe: Timeframe for data (1Min, 5Min, 15Min, 1Hour, 1Day)
+    Returns:
+        tuple: (start_date, DataFrame of bars with a tz-aware 'timestamp' column)
+    """
+    # Calculate start date based on look_back_days
+    curr_d = parse_date(curr_date) if curr_date else date.today()
+    start_date = (curr_d - timedelta(days=look_back_days)).isoformat()
+    
+    # Get data from Alpaca through the bar store, so stepping the window forward
+    # only downloads the new days - don't pass end_date to avoid subscription limitations
+    return start_date, AlpacaUtils.get_stock_data_cached(symbol, start_date, None, timeframe)
+
+
+def get_alpaca_latest_quote_text(symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+    """
+    Get the latest Alpaca quote of a symbol as a report section appended to data windows
+    Args:
+        symbol: ticker symbol of the company
+    Returns:
+        str: the quote section, a note if it could not be fetched, or "" if there is none
+    """
+    try:
+        latest_quote = AlpacaUtils.get_latest_quote(symbol)
+        if latest_quote:
+            result = f"\n\n## Latest Quote for {symbol}:\n"
+            result += f"Bid: {latest_quote['bid_price']} ({latest_quote['bid_size']}), "
+            result += f"Ask: {latest_quote['ask_price']} ({latest_quote['ask_size']}), "
+            result += f"Time: {latest_quote['timestamp']}"
+            return result
+    except Exception as quote_error:
+        return f"\n\nCould not fetch latest quote: {str(quote_error)}"
+    return ""
+
 def get_alpaca_data(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -761,13 +843,8 @@ def get_alpaca_data(
         str: a report of the stock data
     """
     try:
-        # Get data from Alpaca
-        data = AlpacaUtils.get_stock_data(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            timeframe=timeframe
-        )
+        # Get data from Alpaca, reusing bars already stored on disk
+        data = AlpacaUtils.get_stock_data_cached(symbol, start_date, end_date, timeframe)
         
         if data.empty:
             date_range = f"from {start_date}" + (f" to {end_date}" if end_date else " to present")
@@ -787,18 +864,10 @@ def get_alpaca_data(
         available_columns = [col for col in columns_order if col in df_formatted.columns]
         df_display = df_formatted[available_columns].copy()
         
-        # Round price columns for better readability
-        price_columns = ['open', 'high', 'low', 'close', 'vwap']
-        for col in price_columns:
+        # Counts are whole numbers; prices are rounded by to_csv's float_format below
+        for col in ('volume', 'trade_count'):
             if col in df_display.columns:
-                df_display[col] = df_display[col].round(2)
-        
-        # Format volume with thousands separators
-        if 'volume' in df_display.columns:
-            df_display['volume'] = df_display['volume'].apply(lambda x: f"{int(x):,}" if pd.notna(x) else "N/A")
-        
-        if 'trade_count' in df_display.columns:
-            df_display['trade_count'] = df_display['trade_count'].apply(lambda x: f"{int(x):,}" if pd.notna(x) else "N/A")
+                df_display[col] = df_display[col].round().astype('Int64')
         
         # Calculate some key metrics
         if len(df_formatted) > 1:
@@ -817,7 +886,7 @@ def get_alpaca_data(
         # Format the result
         date_range = f"from {start_date}" + (f" to {end_date}" if end_date else " to present")
         result = f"## Stock Data for {symbol} {date_range}:\n\n"
-        result += df_display.to_string(index=False)
+        result += df_display.to_csv(index=False, float_format="%.2f", na_rep="N/A")
         
         # Add key metrics summary
         if len(df_formatted) > 1:
@@ -857,6 +926,7 @@ def get_alpaca_data(
         return f"Error getting stock data for {symbol}: {str(e)}"
 
 
+@disk_cached("earnings")
 def get_earnings_calendar(
     ticker: Annotated[str, "Stock or crypto ticker symbol"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -879,6 +949,7 @@ def get_earnings_calendar(
     return get_earnings_calendar_data(ticker, start_date, end_date)
 
 
+@disk_cached("earnings")
 def get_earnings_surprise_analysis(
     ticker: Annotated[str, "Stock ticker symbol"],
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -900,6 +971,7 @@ def get_earnings_surprise_analysis(
     return get_earnings_surprises_analysis(ticker, curr_date, lookback_quarters)
 
 
+@disk_cached("news")
 def get_macro_analysis(
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     lookback_days: Annotated[int, "Number of days to look back for data"] = 90,
@@ -919,6 +991,7 @@ def get_macro_analysis(
     return get_macro_economic_summary(curr_date)
 
 
+@disk_cached("news")
 def get_economic_indicators(
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     lookback_days: Annotated[int, "Number of days to look back for data"] = 90,
@@ -937,6 +1010,7 @@ def get_economic_indicators(
     return get_economic_indicators_report(curr_date, lookback_days)
 
 
+@disk_cached("news")
 def get_yield_curve_analysis(
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
 ) -> str:
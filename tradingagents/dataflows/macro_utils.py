@@ -1,24 +1,22 @@
-import requests
 import json
 from datetime import datetime, timedelta
 from typing import Annotated, Dict, List, Optional
 from .config import get_api_key, DATA_DIR
+from .utils import HTTP_TIMEOUT, get_http_session
+from ._ratelimit import rate_limited
 import os
 import pandas as pd
 
 
 def get_fred_api_key():
     """Get FRED API key from config or environment"""
-    try:
-        api_key = get_api_key("fred_api_key", "FRED_API_KEY")
-        # print(f"FRED API key: {api_key}")
-    except:
-        api_key = None
+    api_key = get_api_key("fred_api_key", "FRED_API_KEY")
     if not api_key:
         api_key = os.getenv("FRED_API_KEY")
     return api_key
 
 
+@rate_limited("fred")
 def get_fred_data(series_id: str, start_date: str, end_date: str) -> Dict:
     """
     Get economic data from FRED API
@@ -47,7 +45,7 @@ def get_fred_data(series_id: str, start_date: str, end_date: str) -> Dict:
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = get_http_session().get(url, params=params, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -79,15 +77,17 @@ def get_treasury_yield_curve(curr_date: str) -> str:
         "30 Year": "DGS30"
     }
     
-    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
+    start_date = (datetime.fromisoformat(curr_date) - timedelta(days=30)).strftime("%Y-%m-%d")
     
     result = f"## Treasury Yield Curve as of {curr_date}\n\n"
     
     yield_data = []
+    last_error = None
     for maturity, series_id in yield_series.items():
         data = get_fred_data(series_id, start_date, curr_date)
         
         if "error" in data:
+            last_error = data["error"]
             continue
             
         observations = data.get("observations", [])
@@ -124,6 +124,9 @@ def get_treasury_yield_curve(curr_date: str) -> str:
                 result += "- **📊 FLAT YIELD CURVE**: Economic uncertainty\n"
             else:
                 result += "- **📈 NORMAL YIELD CURVE**: Healthy economic expectations\n"
+    elif last_error:
+        # Every maturity failed or came back empty: report it so it is not cached
+        result += f"**Error**: {last_error}\n"
     else:
         result += "No recent yield curve data available.\n"
     
@@ -141,7 +144,7 @@ def get_economic_indicators_report(curr_date: str, lookback_days: int = 90) -> s
     Returns:
         Formatted string with economic indicators
     """
-    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+    start_date = (datetime.fromisoformat(curr_date) - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
     
     # Key economic indicators
     indicators = {
@@ -299,7 +302,7 @@ def get_fed_calendar_and_minutes(curr_date: str) -> str:
     result = f"## Federal Reserve Calendar & Policy Updates\n\n"
     
     # Get recent Fed Funds rate data to show policy trajectory
-    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=365)).strftime("%Y-%m-%d")
+    start_date = (datetime.fromisoformat(curr_date) - timedelta(days=365)).strftime("%Y-%m-%d")
     fed_data = get_fred_data("FEDFUNDS", start_date, curr_date)
     
     if "error" not in fed_data:
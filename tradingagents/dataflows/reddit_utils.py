@@ -9,6 +9,10 @@ import re
 from .alpaca_utils import AlpacaUtils
 
 
+# Corporate suffixes stripped from a company name to get its short search term
+_COMPANY_SUFFIX_RE = re.compile(r'\s+(?:Common Stock|Class [A-Z]|Inc\.?|Corp\.?|Corporation|Ltd\.?|Limited|LLC)')
+
+
 def get_company_name(ticker: str) -> str:
     """
     Get company name from ticker symbol using Alpaca API.
@@ -49,7 +53,7 @@ def get_search_terms(ticker: str) -> List[str]:
         search_terms.append(company_name)
         
         # Split by "Common Stock", "Class A", etc.
-        name_parts = re.split(r'\s+(?:Common Stock|Class [A-Z]|Inc\.?|Corp\.?|Corporation|Ltd\.?|Limited|LLC)', company_name)
+        name_parts = _COMPANY_SUFFIX_RE.split(company_name)
         if name_parts and name_parts[0].strip():
             search_terms.append(name_parts[0].strip())
         
@@ -86,6 +90,12 @@ def fetch_top_from_category(
         os.listdir(os.path.join(base_path, category))
     )
 
+    # Compile the company's search terms (name variations and ticker) once for all posts
+    query_re = None
+    if "company" in category and query:
+        search_terms = [term for term in get_search_terms(query) if term and isinstance(term, str)]
+        query_re = re.compile("|".join(map(re.escape, search_terms)), re.IGNORECASE)
+
     for data_file in os.listdir(os.path.join(base_path, category)):
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
@@ -109,24 +119,11 @@ def fetch_top_from_category(
                     continue
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    # Get search terms including company name and ticker
-                    search_terms = get_search_terms(query)
-
-                    found = False
-                    for term in search_terms:
-                        # Only search if we have a valid term
-                        if term and isinstance(term, str):
-                            if re.search(
-                                re.escape(term), parsed_line["title"], re.IGNORECASE
-                            ) or re.search(
-                                re.escape(term), parsed_line["selftext"], re.IGNORECASE
-                            ):
-                                found = True
-                                break
-
-                    if not found:
-                        continue
+                if query_re is not None and not (
+                    query_re.search(parsed_line["title"])
+                    or query_re.search(parsed_line["selftext"])
+                ):
+                    continue
 
                 post = {
                     "title": parsed_line["title"],
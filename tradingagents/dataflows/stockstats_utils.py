@@ -1,9 +1,17 @@
+import numpy as np
 import pandas as pd
 from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config
 from .alpaca_utils import AlpacaUtils
+from ._frame_cache import get_frame, put_frame
+
+try:
+    import talib
+except ImportError:
+    # TA-Lib is optional: without it every indicator goes through stockstats
+    talib = None
 
 
 class StockstatsUtils:
@@ -45,94 +53,11 @@ class StockstatsUtils:
         else:
             # Parse the current date
             curr_date_dt = pd.to_datetime(curr_date)
-            
-            # Get more historical data to ensure proper technical indicator calculations
-            # Technical indicators like 50 SMA need at least 50+ days of data
-            end_date = pd.Timestamp.today()
-            start_date = end_date - pd.DateOffset(days=365)  # Get 1 year of data for reliable indicators
-            
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{safe_symbol}-Alpaca-data-{start_date_str}-{end_date_str}.csv",
-            )
 
             try:
-                if os.path.exists(data_file):
-                    # Load cached data
-                    data = pd.read_csv(data_file)
-                    if 'Date' in data.columns:
-                        data["Date"] = pd.to_datetime(data["Date"])
-                    
-                    # Ensure lowercase aliases exist for cached data too
-                    required_cols_map = {
-                        'Open': 'open',
-                        'High': 'high',
-                        'Low': 'low',
-                        'Close': 'close',
-                        'Volume': 'volume'
-                    }
-                    for cap, low in required_cols_map.items():
-                        if cap in data.columns and low not in data.columns:
-                            data[low] = data[cap]
-                else:
-                    # Fetch fresh data from Alpaca
-                    data = AlpacaUtils.get_stock_data(
-                        symbol=symbol,  # Use original symbol for API call
-                        start_date=start_date_str,
-                        end_date=end_date_str,
-                        timeframe="1Day"
-                    )
-                    
-                    # Ensure we have data
-                    if data.empty:
-                        return f"N/A: No data available for {symbol}"
-                    
-                    # Standardize column names for stockstats
-                    if 'timestamp' in data.columns:
-                        data = data.rename(columns={
-                            'timestamp': 'Date',
-                            'open': 'Open',
-                            'high': 'High', 
-                            'low': 'Low',
-                            'close': 'Close',
-                            'volume': 'Volume'
-                        })
-
-                    # -----------------------------------------------------------------
-                    # Ensure lowercase aliases exist for Stockstats calculations.
-                    # Stockstats expects lowercase column names like 'close' and 'volume'.
-                    # When we rename to capitalized versions for display purposes, the
-                    # original lowercase columns disappear, causing certain indicators
-                    # (e.g., OBV that relies on 'volume') to return NaN. We therefore
-                    # create lowercase duplicates without altering existing display columns.
-                    # -----------------------------------------------------------------
-                    required_cols_map = {
-                        'Open': 'open',
-                        'High': 'high',
-                        'Low': 'low',
-                        'Close': 'close',
-                        'Volume': 'volume'
-                    }
-                    for cap, low in required_cols_map.items():
-                        if cap in data.columns and low not in data.columns:
-                            data[low] = data[cap]
-                    
-                    # Ensure Date column is datetime
-                    if 'Date' in data.columns:
-                        data["Date"] = pd.to_datetime(data["Date"])
-                    
-                    # Sort by date to ensure proper chronological order for indicators
-                    data = data.sort_values('Date').reset_index(drop=True)
-                    
-                    # Save to cache
-                    data.to_csv(data_file, index=False)
+                data = StockstatsUtils._load_online_data(symbol)
+                if isinstance(data, str):
+                    return data
 
                 # Ensure we have sufficient data for technical indicators
                 if len(data) < 100:
@@ -140,142 +65,302 @@ class StockstatsUtils:
 
                 # Wrap with stockstats for technical indicator calculations
                 df = wrap(data)
-                
-                # Trigger the indicator calculation
-                # Handle problematic indicators that have issues with stockstats
-                if indicator == 'obv':
-                    try:
-                        # Calculate OBV manually
-                        obv_values = []
-                        obv = 0
-                        for i in range(len(data)):
-                            if i == 0:
-                                obv_values.append(0)
-                            else:
-                                if data['close'].iloc[i] > data['close'].iloc[i-1]:
-                                    obv += data['volume'].iloc[i]
-                                elif data['close'].iloc[i] < data['close'].iloc[i-1]:
-                                    obv -= data['volume'].iloc[i]
-                                # If close == prev close, OBV stays the same
-                                obv_values.append(obv)
-                        
-                        # Add OBV to the dataframe
-                        df['obv'] = obv_values
-                        indicator_series = df['obv']
-                    except Exception as manual_error:
-                        return f"N/A: Error calculating OBV manually: {str(manual_error)}"
-                elif indicator == 'atr_14':
-                    try:
-                        # Calculate ATR manually
-                        import numpy as np
-                        
-                        # Calculate True Range
-                        tr_values = []
-                        for i in range(len(data)):
-                            if i == 0:
-                                tr_values.append(data['high'].iloc[i] - data['low'].iloc[i])
-                            else:
-                                tr1 = data['high'].iloc[i] - data['low'].iloc[i]
-                                tr2 = abs(data['high'].iloc[i] - data['close'].iloc[i-1])
-                                tr3 = abs(data['low'].iloc[i] - data['close'].iloc[i-1])
-                                tr_values.append(max(tr1, tr2, tr3))
-                        
-                        # Calculate 14-period ATR using simple moving average
-                        atr_values = []
-                        for i in range(len(tr_values)):
-                            if i < 13:  # Not enough data for 14-period ATR
-                                atr_values.append(np.nan)
-                            else:
-                                atr = np.mean(tr_values[i-13:i+1])
-                                atr_values.append(atr)
-                        
-                        # Add ATR to the dataframe
-                        df['atr_14'] = atr_values
-                        indicator_series = df['atr_14']
-                    except Exception as manual_error:
-                        return f"N/A: Error calculating ATR manually: {str(manual_error)}"
-                elif indicator.endswith('_ema'):
-                    try:
-                        # Parse EMA indicator (e.g., 'close_8_ema')
-                        parts = indicator.split('_')
-                        column = parts[0]
-                        window = int(parts[1])
-                        
-                        # Calculate EMA manually
-                        import numpy as np
-                        alpha = 2.0 / (window + 1)
-                        ema_values = []
-                        
-                        for i in range(len(data)):
-                            if i == 0:
-                                ema_values.append(data[column].iloc[i])
-                            else:
-                                ema = alpha * data[column].iloc[i] + (1 - alpha) * ema_values[i-1]
-                                ema_values.append(ema)
-                        
-                        # Add EMA to the dataframe
-                        df[indicator] = ema_values
-                        indicator_series = df[indicator]
-                    except Exception as manual_error:
-                        return f"N/A: Error calculating EMA manually: {str(manual_error)}"
-                elif indicator.endswith('_sma'):
-                    try:
-                        # Parse SMA indicator (e.g., 'close_50_sma')
-                        parts = indicator.split('_')
-                        column = parts[0]
-                        window = int(parts[1])
-                        
-                        # Calculate SMA manually
-                        import numpy as np
-                        sma_values = []
-                        
-                        for i in range(len(data)):
-                            if i < window - 1:
-                                sma_values.append(np.nan)
-                            else:
-                                sma = np.mean(data[column].iloc[i-window+1:i+1])
-                                sma_values.append(sma)
-                        
-                        # Add SMA to the dataframe
-                        df[indicator] = sma_values
-                        indicator_series = df[indicator]
-                    except Exception as manual_error:
-                        return f"N/A: Error calculating SMA manually: {str(manual_error)}"
-                else:
-                    # Try stockstats for other indicators
-                    try:
-                        indicator_series = df[indicator]
-                    except KeyError:
-                        return f"N/A: Invalid indicator '{indicator}'"
-                    except Exception as e:
-                        return f"N/A: Error calculating {indicator}: {str(e)}"
+                return StockstatsUtils._indicator_value(df, data, indicator, curr_date_dt)
 
-                # Convert date column to string for matching
-                df["date_str"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d")
-                curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
+            except Exception as e:
+                return f"N/A: Error processing data for {symbol}: {str(e)}"
 
-                # Find the most recent trading day on or before the requested date
-                available_dates = df["date_str"].tolist()
-                matching_rows = df[df["date_str"] == curr_date_str]
-                
-                if not matching_rows.empty:
-                    indicator_value = matching_rows[indicator].iloc[-1]  # Get the last (most recent) value
-                    # Handle NaN values
-                    if pd.isna(indicator_value):
-                        return f"N/A: {indicator} not calculable for {curr_date_str}"
-                    return float(indicator_value)
-                else:
-                    # If exact date not found, try to find the most recent trading day before the requested date
-                    df_filtered = df[df["date_str"] <= curr_date_str]
-                    if not df_filtered.empty:
-                        most_recent = df_filtered.iloc[-1]
-                        indicator_value = most_recent[indicator]
-                        if pd.isna(indicator_value):
-                            return f"N/A: {indicator} not calculable for most recent trading day"
-                        actual_date = most_recent["date_str"]
-                        return f"{float(indicator_value)} (as of {actual_date})"
-                    else:
-                        return f"N/A: No trading data available on or before {curr_date_str}"
+    @staticmethod
+    def _load_online_data(symbol):
+        """Return about a year of daily bars for `symbol` prepared for stockstats,
+        or an "N/A: ..." message when no data is available."""
+        # Sanitize symbol for filename (replace / with _)
+        safe_symbol = symbol.replace('/', '_')
+
+        # Get more historical data to ensure proper technical indicator calculations
+        # Technical indicators like 50 SMA need at least 50+ days of data
+        end_date = pd.Timestamp.today()
+        start_date = end_date - pd.DateOffset(days=365)  # Get 1 year of data for reliable indicators
+        
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
+
+        # Get config and ensure cache directory exists
+        config = get_config()
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+
+        data_file = os.path.join(
+            config["data_cache_dir"],
+            f"{safe_symbol}-Alpaca-data-{start_date_str}-{end_date_str}.csv",
+        )
+
+        # Reuse bars already parsed by an earlier call in this process
+        data = get_frame(data_file)
+        if data is None and os.path.exists(data_file):
+            # Load cached data
+            data = pd.read_csv(data_file)
+            if 'Date' in data.columns:
+                data["Date"] = pd.to_datetime(data["Date"])
+            
+            # Ensure lowercase aliases exist for cached data too
+            required_cols_map = {
+                'Open': 'open',
+                'High': 'high',
+                'Low': 'low',
+                'Close': 'close',
+                'Volume': 'volume'
+            }
+            for cap, low in required_cols_map.items():
+                if cap in data.columns and low not in data.columns:
+                    data[low] = data[cap]
+            put_frame(data_file, data)
+        elif data is None:
+            # Fetch from Alpaca, reusing bars already in the on-disk bar store
+            data = AlpacaUtils.get_stock_data_cached(
+                symbol=symbol,  # Use original symbol for API call
+                start_date=start_date_str,
+                end_date=end_date_str,
+                timeframe="1Day"
+            )
+            
+            # Ensure we have data
+            if data.empty:
+                return f"N/A: No data available for {symbol}"
+            
+            # Standardize column names for stockstats
+            if 'timestamp' in data.columns:
+                data = data.rename(columns={
+                    'timestamp': 'Date',
+                    'open': 'Open',
+                    'high': 'High', 
+                    'low': 'Low',
+                    'close': 'Close',
+                    'volume': 'Volume'
+                })
+
+            # -----------------------------------------------------------------
+            # Ensure lowercase aliases exist for Stockstats calculations.
+            # Stockstats expects lowercase column names like 'close' and 'volume'.
+            # When we rename to capitalized versions for display purposes, the
+            # original lowercase columns disappear, causing certain indicators
+            # (e.g., OBV that relies on 'volume') to return NaN. We therefore
+            # create lowercase duplicates without altering existing display columns.
+            # -----------------------------------------------------------------
+            required_cols_map = {
+                'Open': 'open',
+                'High': 'high',
+                'Low': 'low',
+                'Close': 'close',
+                'Volume': 'volume'
+            }
+            for cap, low in required_cols_map.items():
+                if cap in data.columns and low not in data.columns:
+                    data[low] = data[cap]
+            
+            # Ensure Date column is datetime
+            if 'Date' in data.columns:
+                data["Date"] = pd.to_datetime(data["Date"])
+            
+            # Sort by date to ensure proper chronological order for indicators
+            data = data.sort_values('Date').reset_index(drop=True)
+            
+            # Save to cache
+            data.to_csv(data_file, index=False)
+            put_frame(data_file, data)
+
+        return data
+
+    @staticmethod
+    def get_stock_stats_frame(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            list, "quantitative indicators based off of the stock data for the company"
+        ],
+    ) -> pd.DataFrame:
+        """Compute several indicators over the whole online price history in one pass.
 
+        Returns a DataFrame indexed by trading date (oldest first) with one
+        column per indicator; an indicator that cannot be calculated is all
+        NaN. The frame is empty when there is not enough price data.
+        """
+        data = StockstatsUtils._load_online_data(symbol)
+        if isinstance(data, str) or len(data) < 100:
+            return pd.DataFrame(columns=list(indicators), dtype=float)
+
+        use_talib = talib is not None and get_config().get("indicator_backend") == "talib"
+        df = wrap(data)
+        columns = {}
+        for indicator in indicators:
+            if use_talib:
+                try:
+                    values = StockstatsUtils._talib_indicator(data, indicator)
+                except Exception:
+                    values = None
+                if values is not None:
+                    columns[indicator] = np.asarray(values, dtype=float)
+                    continue
+            try:
+                error = StockstatsUtils._compute_indicator(df, data, indicator)
+            except Exception as e:
+                error = str(e)
+            if error is None:
+                columns[indicator] = pd.to_numeric(pd.Series(df[indicator].to_numpy()), errors="coerce").to_numpy()
+            else:
+                columns[indicator] = np.nan
+
+        # Same calendar-date matching as the single-value lookup
+        return pd.DataFrame(columns, index=StockstatsUtils._trading_days(df))
+
+    @staticmethod
+    def _trading_days(df):
+        """Trading dates of the wrapped frame as naive calendar days (datetime64 array),
+        i.e. the dates the bars print as, without formatting every row to a string."""
+        dates = pd.to_datetime(df["Date"])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        return dates.dt.normalize().to_numpy()
+
+    @staticmethod
+    def _talib_indicator(data, indicator):
+        """Compute `indicator` over the whole price history with TA-Lib.
+        Returns None for indicators without a TA-Lib kernel here."""
+        close = data['close'].to_numpy(dtype=float)
+        high = data['high'].to_numpy(dtype=float)
+        low = data['low'].to_numpy(dtype=float)
+        parts = indicator.split('_')
+
+        if len(parts) == 3 and parts[0] == 'close' and parts[2] in ('ema', 'sma'):
+            kernel = talib.EMA if parts[2] == 'ema' else talib.SMA
+            return kernel(close, timeperiod=int(parts[1]))
+        if indicator in ('macd', 'macds', 'macdh'):
+            macd, signal, hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+            return {'macd': macd, 'macds': signal, 'macdh': hist}[indicator]
+        if indicator in ('boll', 'boll_ub', 'boll_lb'):
+            upper, middle, lower = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
+            return {'boll': middle, 'boll_ub': upper, 'boll_lb': lower}[indicator]
+        if indicator == 'obv':
+            return talib.OBV(close, data['volume'].to_numpy(dtype=float))
+        if len(parts) == 2 and parts[1].isdigit():
+            period = int(parts[1])
+            if parts[0] == 'rsi':
+                return talib.RSI(close, timeperiod=period)
+            if parts[0] == 'wr':
+                return talib.WILLR(high, low, close, timeperiod=period)
+            if parts[0] == 'atr':
+                return talib.ATR(high, low, close, timeperiod=period)
+            if parts[0] in ('kdjk', 'kdjd'):
+                slowk, slowd = talib.STOCH(
+                    high, low, close, fastk_period=period,
+                    slowk_period=3, slowk_matype=0, slowd_period=3, slowd_matype=0,
+                )
+                return slowk if parts[0] == 'kdjk' else slowd
+        return None
+
+    @staticmethod
+    def _compute_indicator(df, data, indicator):
+        """Add `indicator` as a column of the wrapped frame.
+        Returns an "N/A: ..." message if it cannot be calculated, otherwise None."""
+        # Trigger the indicator calculation
+        # Handle problematic indicators that have issues with stockstats
+        if indicator == 'obv':
+            try:
+                # Calculate OBV manually: add the volume on up days, subtract it on
+                # down days, leave it unchanged when the close is flat
+                direction = np.sign(data['close'].diff()).fillna(0)
+                obv_values = (direction * data['volume']).cumsum()
+                
+                # Add OBV to the dataframe
+                df['obv'] = obv_values.to_numpy()
+                indicator_series = df['obv']
+            except Exception as manual_error:
+                return f"N/A: Error calculating OBV manually: {str(manual_error)}"
+        elif indicator == 'atr_14':
+            try:
+                # Calculate ATR manually
+                # True Range; the first bar has no previous close, so it is just high - low
+                prev_close = data['close'].shift(1)
+                tr_values = pd.concat([
+                    data['high'] - data['low'],
+                    (data['high'] - prev_close).abs(),
+                    (data['low'] - prev_close).abs(),
+                ], axis=1).max(axis=1)
+                
+                # Calculate 14-period ATR using simple moving average (NaN until 14 bars)
+                atr_values = tr_values.rolling(14).mean()
+                
+                # Add ATR to the dataframe
+                df['atr_14'] = atr_values.to_numpy()
+                indicator_series = df['atr_14']
+            except Exception as manual_error:
+                return f"N/A: Error calculating ATR manually: {str(manual_error)}"
+        elif indicator.endswith('_ema'):
+            try:
+                # Parse EMA indicator (e.g., 'close_8_ema')
+                parts = indicator.split('_')
+                column = parts[0]
+                window = int(parts[1])
+                
+                # Calculate EMA manually, seeded with the first value
+                alpha = 2.0 / (window + 1)
+                ema_values = data[column].ewm(alpha=alpha, adjust=False).mean()
+                
+                # Add EMA to the dataframe
+                df[indicator] = ema_values.to_numpy()
+                indicator_series = df[indicator]
+            except Exception as manual_error:
+                return f"N/A: Error calculating EMA manually: {str(manual_error)}"
+        elif indicator.endswith('_sma'):
+            try:
+                # Parse SMA indicator (e.g., 'close_50_sma')
+                parts = indicator.split('_')
+                column = parts[0]
+                window = int(parts[1])
+                
+                # Calculate SMA manually (NaN until a full window is available)
+                sma_values = data[column].rolling(window).mean()
+                
+                # Add SMA to the dataframe
+                df[indicator] = sma_values.to_numpy()
+                indicator_series = df[indicator]
+            except Exception as manual_error:
+                return f"N/A: Error calculating SMA manually: {str(manual_error)}"
+        else:
+            # Try stockstats for other indicators
+            try:
+                indicator_series = df[indicator]
+            except KeyError:
+                return f"N/A: Invalid indicator '{indicator}'"
             except Exception as e:
-                return f"N/A: Error processing data for {symbol}: {str(e)}" 
\ No newline at end of file
+                return f"N/A: Error calculating {indicator}: {str(e)}"
+
+        return None
+
+    @staticmethod
+    def _indicator_value(df, data, indicator, curr_date_dt):
+        """Calculate `indicator` on the wrapped frame and return its value on the
+        requested date, or on the most recent trading day before it."""
+        error = StockstatsUtils._compute_indicator(df, data, indicator)
+        if error is not None:
+            return error
+
+        curr_day = pd.Timestamp(curr_date_dt).normalize()
+        curr_date_str = curr_day.strftime("%Y-%m-%d")
+
+        # Find the most recent trading day on or before the requested date (bars are sorted by date)
+        days = StockstatsUtils._trading_days(df)
+        pos = days.searchsorted(curr_day.to_datetime64(), side="right") - 1
+        if pos < 0:
+            return f"N/A: No trading data available on or before {curr_date_str}"
+
+        indicator_value = df[indicator].iloc[pos]
+        if days[pos] == curr_day.to_datetime64():
+            # Handle NaN values
+            if pd.isna(indicator_value):
+                return f"N/A: {indicator} not calculable for {curr_date_str}"
+            return float(indicator_value)
+
+        # The exact date is not a trading day: report the most recent one before it
+        if pd.isna(indicator_value):
+            return f"N/A: {indicator} not calculable for most recent trading day"
+        actual_date = pd.Timestamp(days[pos]).strftime("%Y-%m-%d")
+        return f"{float(indicator_value)} (as of {actual_date})"
\ No newline at end of file
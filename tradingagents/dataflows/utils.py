@@ -1,6 +1,10 @@
 import os
 import json
+import threading
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from datetime import date, timedelta, datetime
 from typing import Annotated
 
@@ -12,10 +16,57 @@ def save_output(data: pd.DataFrame, tag: str, save_path: SavePathType = None) ->
         print(f"{tag} saved to {save_path}")
 
 
+# Seconds to wait for a data provider to connect or send data before giving up
+HTTP_TIMEOUT = 10
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session shared by the data fetchers.
+
+    Reusing one session keeps TCP/TLS connections alive between calls, which
+    dominates the latency of small JSON requests (FRED, DeFi Llama, ...).
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = "TradingAgents/0.1 " + requests.utils.default_user_agent()
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    # Hand the final response back so callers' own status handling still applies
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
 def get_current_date():
     return date.today().strftime("%Y-%m-%d")
 
 
+def parse_date(value) -> date:
+    """Parse a trading date, taking the stdlib ISO fast path for plain YYYY-mm-dd strings
+    and falling back to pandas' general parser for anything else."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return pd.to_datetime(value).date()
+
+
 def decorate_all_methods(decorator):
     def class_decorator(cls):
         for attr_name, attr_value in cls.__dict__.items():
@@ -29,7 +80,7 @@ def decorate_all_methods(decorator):
 def get_next_weekday(date):
 
     if not isinstance(date, datetime):
-        date = datetime.strptime(date, "%Y-%m-%d")
+        date = datetime.fromisoformat(date)
 
     if date.weekday() >= 5:
         days_to_add = 7 - date.weekday()
@@ -19,8 +19,19 @@ DEFAULT_CONFIG = {
     "allow_shorts": False,  # False = Investment mode (BUY/HOLD/SELL), True = Trading mode (LONG/NEUTRAL/SHORT)
     # Execution settings
     "parallel_analysts": True,  # True = Run analysts in parallel for faster execution, False = Sequential execution
+    "trader_batch_size": 16,  # Max symbols per LLM call when using the batch trader for portfolio runs
+    # Provider rate limits (requests per minute) enforced by a shared token bucket per provider
+    "rate_limits": {
+        "alpaca": 200,
+        "finnhub": 60,
+        "fred": 120,
+        "google": 30,
+        "coindesk": 60,
+        "defillama": 300,
+    },
     # Tool settings
     "online_tools": True,
+    "indicator_backend": "stockstats",  # "talib" computes indicator tables with TA-Lib's C kernels when it is installed
     # API keys (these will be overridden by environment variables if present)
     "openai_api_key": None,
     "finnhub_api_key": None,
@@ -238,35 +238,35 @@ class GraphSetup:
             analyst_nodes["market"] = create_market_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["market"] = create_msg_delete()
+            delete_nodes["market"] = create_msg_prune()
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["social"] = create_msg_delete()
+            delete_nodes["social"] = create_msg_prune()
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["news"] = create_msg_delete()
+            delete_nodes["news"] = create_msg_prune()
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["fundamentals"] = create_msg_delete()
+            delete_nodes["fundamentals"] = create_msg_prune()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
         if "macro" in selected_analysts:
             analyst_nodes["macro"] = create_macro_analyst(
                 self.quick_thinking_llm, self.toolkit
             )
-            delete_nodes["macro"] = create_msg_delete()
+            delete_nodes["macro"] = create_msg_prune()
             tool_nodes["macro"] = self.tool_nodes["macro"]
 
         # Create researcher and manager nodes
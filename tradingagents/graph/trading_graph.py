@@ -6,7 +6,6 @@ import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
@@ -73,13 +72,13 @@ class TradingAgentsGraph:
         if not any(model_prefix in quick_think_model for model_prefix in ["o3", "o4-mini"]):
             quick_think_kwargs["temperature"] = 0.2
         
-        self.deep_thinking_llm = ChatOpenAI(
+        self.deep_thinking_llm = Toolkit.get_llm(
             model=deep_think_model, 
             openai_api_key=api_key,
             **deep_think_kwargs
         )
         
-        self.quick_thinking_llm = ChatOpenAI(
+        self.quick_thinking_llm = Toolkit.get_llm(
             model=quick_think_model, 
             openai_api_key=api_key,
             **quick_think_kwargs
@@ -130,65 +129,18 @@ class TradingAgentsGraph:
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
+        # Crypto runs use CoinDesk news in the market, social and news analysts
+        crypto_news = [self.toolkit.get_coindesk_news]
+        news_tools = self.toolkit.tools_for("NEWS") + crypto_news
+        macro_tools = self.toolkit.tools_for("MACRO")
+        # News and macro analysts may fan independent reports out in one call,
+        # limited to their own tools
         return {
-            "market": ToolNode(
-                [
-                    # online tools
-                    self.toolkit.get_alpaca_data,
-                    self.toolkit.get_stockstats_indicators_report_online,
-                    # offline tools
-                    self.toolkit.get_stockstats_indicators_report,
-                    self.toolkit.get_alpaca_data_report,
-                    # crypto
-                    self.toolkit.get_coindesk_news,
-                ]
-            ),
-            "social": ToolNode(
-                [
-                    # online tools
-                    self.toolkit.get_stock_news_openai,
-                    # offline tools
-                    self.toolkit.get_reddit_stock_info,
-                    # crypto
-                    self.toolkit.get_coindesk_news,
-                ]
-            ),
-            "news": ToolNode(
-                [
-                    # online tools
-                    self.toolkit.get_global_news_openai,
-                    self.toolkit.get_google_news,
-                    # offline tools
-                    self.toolkit.get_finnhub_news,
-                    self.toolkit.get_reddit_news,
-                    # crypto
-                    self.toolkit.get_coindesk_news,
-                ]
-            ),
-            "fundamentals": ToolNode(
-                [
-                    # online tools
-                    self.toolkit.get_fundamentals_openai,
-                    self.toolkit.get_defillama_fundamentals,
-                    # offline tools
-                    self.toolkit.get_finnhub_company_insider_sentiment,
-                    self.toolkit.get_finnhub_company_insider_transactions,
-                    self.toolkit.get_simfin_balance_sheet,
-                    self.toolkit.get_simfin_cashflow,
-                    self.toolkit.get_simfin_income_stmt,
-                    # earnings tools
-                    self.toolkit.get_earnings_calendar,
-                    self.toolkit.get_earnings_surprise_analysis,
-                ]
-            ),
-            "macro": ToolNode(
-                [
-                    # macro economic tools
-                    self.toolkit.get_macro_analysis,
-                    self.toolkit.get_economic_indicators,
-                    self.toolkit.get_yield_curve_analysis,
-                ]
-            ),
+            "market": ToolNode(self.toolkit.tools_for("MARKET") + crypto_news),
+            "social": ToolNode(self.toolkit.tools_for("SOCIAL") + crypto_news),
+            "news": ToolNode(news_tools + [self.toolkit.parallel_tool(news_tools)]),
+            "fundamentals": ToolNode(self.toolkit.tools_for("FUNDAMENTALS")),
+            "macro": ToolNode(macro_tools + [self.toolkit.parallel_tool(macro_tools)]),
         }
 
     def propagate(self, company_name, trade_date):
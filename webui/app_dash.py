@@ -112,6 +112,9 @@ def run_app(port=7860, share=False, server_name="127.0.0.1", debug=False, max_th
     
     if debug:
         print(f"Starting TradingAgents Dash Web UI on port {port}...")
+        # Show tool start/finish lines on the console
+        from tradingagents.agents.utils.agent_utils import enable_background_tool_logging
+        enable_background_tool_logging()
     else:
         print("Starting TradingAgents Web UI...")
     
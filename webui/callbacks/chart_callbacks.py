@@ -200,7 +200,7 @@ def register_chart_callbacks(app):
         try:
             last_updated = datetime.fromisoformat(chart_store_data["last_updated"])
             return f"Last updated: {last_updated.strftime('%I:%M:%S %p')}"
-        except:
+        except (TypeError, ValueError):
             return ""
 
     @app.callback(
@@ -7,7 +7,7 @@ from dash import Input, Output, State, ctx, html, ALL, dash, dcc, callback_conte
 import dash_bootstrap_components as dbc
 from webui.utils.state import app_state
 from webui.components.ui import render_researcher_debate, render_risk_debate
-from webui.utils.report_validator import validate_reports_for_ui
+from webui.utils.report_validator import report_title, validate_reports_for_ui
 from webui.utils.prompt_capture import get_agent_prompt
 
 
@@ -660,15 +660,15 @@ def register_report_callbacks(app):
                 # Analyst is done - show the final report
                 validated_reports[report_type] = content
             elif status == "in_progress":
-                validated_reports[report_type] = f"🔄 {report_type.replace('_', ' ').title()} - Analysis in progress..."
+                validated_reports[report_type] = f"🔄 {report_title(report_type)} - Analysis in progress..."
             elif status == "pending":
-                validated_reports[report_type] = f"⏳ {report_type.replace('_', ' ').title()} - Waiting to start..."
+                validated_reports[report_type] = f"⏳ {report_title(report_type)} - Waiting to start..."
             elif content:
                 # Analyst status unknown but we have content - validate it
                 content_validated = validate_reports_for_ui({report_type: content})
                 validated_reports[report_type] = content_validated[report_type]
             else:
-                validated_reports[report_type] = f"No {report_type.replace('_', ' ').title()} available yet."
+                validated_reports[report_type] = f"No {report_title(report_type)} available yet."
         
         # Get final validated reports or defaults
         market_report = validated_reports.get("market_report", "No market analysis available yet.")
@@ -899,7 +899,7 @@ def register_report_callbacks(app):
                             "trader_investment_plan": "Trader Prompt"
                         }
                         
-                        title = report_titles.get(report_type, f"{report_type.replace('_', ' ').title()} Prompt")
+                        title = report_titles.get(report_type, f"{report_title(report_type)} Prompt")
                         
                         # Update modal state
                         updated_state = {
@@ -992,7 +992,7 @@ def register_report_callbacks(app):
                             "final_trade_decision": "Portfolio Manager Tool Outputs"
                         }
                         
-                        title = report_titles.get(report_type, f"{report_type.replace('_', ' ').title()} Tool Outputs")
+                        title = report_titles.get(report_type, f"{report_title(report_type)} Tool Outputs")
                         
                         # Create the content with markdown rendering
                         content = dcc.Markdown(
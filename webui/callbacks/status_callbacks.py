@@ -6,6 +6,7 @@ from dash import Input, Output, html
 import dash_bootstrap_components as dbc
 
 from webui.utils.state import app_state
+from tradingagents.dataflows._cache_db import get_cache_stats
 from webui.config.constants import COLORS
 
 
@@ -85,8 +86,13 @@ def register_status_callbacks(app):
     )
     def update_progress_stats(n_intervals):
         """Update the progress statistics"""
+        tool_calls = f"🧰 Tool Calls: {app_state.tool_calls_count}"
+        stats = get_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        if lookups:
+            tool_calls += f" (data cache hits: {stats['hits']}/{lookups})"
         return (
-            f"🧰 Tool Calls: {app_state.tool_calls_count}",
+            tool_calls,
             f"🤖 LLM Calls: {app_state.llm_calls_count}",
             f"📊 Generated Reports: {app_state.generated_reports_count}"
         )
@@ -8,6 +8,7 @@ import dash.dependencies
 import json
 
 from webui.components.alpaca_account import render_positions_table, render_orders_table
+from tradingagents.dataflows.alpaca_utils import AlpacaUtils
 
 
 def register_trading_callbacks(app):
@@ -26,8 +27,12 @@ def register_trading_callbacks(app):
         
         page = orders_page if orders_page is not None else 1
         
-        positions_table = render_positions_table()
-        orders_table = render_orders_table(page=page)
+        # Fetch positions and orders concurrently instead of one after the other
+        snapshot = AlpacaUtils.get_account_snapshot(
+            include_orders=True, orders_page=page, include_account=False
+        )
+        positions_table = render_positions_table(snapshot["positions"])
+        orders_table = render_orders_table(page=page, orders_data=snapshot["orders"])
         
         return positions_table, orders_table
 
@@ -9,10 +9,11 @@ from datetime import datetime
 import pytz
 from tradingagents.dataflows.alpaca_utils import AlpacaUtils
 
-def render_positions_table():
-    """Render the enhanced positions table with liquidate buttons"""
+def render_positions_table(positions_data=None):
+    """Render the enhanced positions table with liquidate buttons (fetching the positions unless given)"""
     try:
-        positions_data = AlpacaUtils.get_positions_data()
+        if positions_data is None:
+            positions_data = AlpacaUtils.get_positions_data()
         
         if not positions_data:
             return html.Div([
@@ -117,10 +118,11 @@ def render_positions_table():
             ], className="text-center p-4")
         ], className="enhanced-table-container error-state")
 
-def render_orders_table(page=1, page_size=7):
-    """Render the enhanced recent orders table"""
+def render_orders_table(page=1, page_size=7, orders_data=None):
+    """Render the enhanced recent orders table (fetching the page of orders unless given)"""
     try:
-        orders_data = AlpacaUtils.get_recent_orders(page=page, page_size=page_size)
+        if orders_data is None:
+            orders_data = AlpacaUtils.get_recent_orders(page=page, page_size=page_size)
         
         if not orders_data:
             return html.Div([
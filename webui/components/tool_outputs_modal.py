@@ -134,6 +134,8 @@ def format_tool_outputs_content(tool_calls_log, report_type=None):
         inputs = tool_call.get('inputs', {})
         output = tool_call.get('output', 'No output')
         execution_time = tool_call.get('execution_time', 'Unknown')
+        if isinstance(execution_time, (int, float)):
+            execution_time = f"{execution_time:.2f}s"
         status = tool_call.get('status', 'unknown')
         agent_type = tool_call.get('agent_type', 'Unknown Agent')
         
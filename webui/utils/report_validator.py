@@ -3,9 +3,38 @@ Report validation utility to ensure UI shows complete, final reports
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# Common completion indicators, matched case-insensitively in one pass
+_COMPLETION_RE = re.compile("|".join(map(re.escape, [
+    "## Summary",
+    "## Conclusion",
+    "## Trading Implications",
+    "## Recommendation",
+    "| Key Metric |",  # Markdown table
+    "| Metric |",
+    "**Recommendation:**",
+    "## Key Points",
+    "### Trading Implications",
+])), re.IGNORECASE)
+
+# A line with at least three pipes (markdown table row); no backtracking across cells
+_TABLE_ROW_RE = re.compile(r'\|[^|\n]*\|[^|\n]*\|')
+
+
+@lru_cache(maxsize=None)
+def report_title(report_type: str) -> str:
+    """
+    Human-readable title of a report type, e.g. market_report -> Market Report.
+    Cached because the UI callbacks relabel the same few report types on every refresh.
+    """
+    return report_type.translate(_UNDERSCORE_TO_SPACE).title()
+
+
 def is_report_complete(report_content: str, report_type: str) -> bool:
     """
     Check if a report appears to be complete based on content analysis
@@ -20,25 +49,11 @@ def is_report_complete(report_content: str, report_type: str) -> bool:
     if not report_content or len(report_content.strip()) < 100:
         return False
     
-    # Check for common completion indicators
-    completion_indicators = [
-        "## Summary",
-        "## Conclusion", 
-        "## Trading Implications",
-        "## Recommendation",
-        "| Key Metric |",  # Markdown table
-        "| Metric |",
-        "**Recommendation:**",
-        "## Key Points",
-        "### Trading Implications"
-    ]
-    
     # Check if report has at least one completion indicator
-    has_completion_indicator = any(indicator.lower() in report_content.lower() 
-                                 for indicator in completion_indicators)
+    has_completion_indicator = _COMPLETION_RE.search(report_content) is not None
     
     # Check for markdown table (common in complete reports)
-    has_table = bool(re.search(r'\|.*\|.*\|', report_content))
+    has_table = _TABLE_ROW_RE.search(report_content) is not None
     
     # Check minimum length by report type
     min_lengths = {
@@ -70,7 +85,7 @@ def validate_reports_for_ui(reports: Dict[str, Optional[str]]) -> Dict[str, str]
     
     for report_type, content in reports.items():
         if not content:
-            validated_reports[report_type] = f"No {report_type.replace('_', ' ').title()} available yet."
+            validated_reports[report_type] = f"No {report_title(report_type)} available yet."
             continue
             
         if is_report_complete(content, report_type):
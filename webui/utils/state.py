@@ -2,9 +2,18 @@
 Trading Agents Framework - State Management
 """
 
+import itertools
+import threading
+from collections import deque
+
+# Number of recent tool calls kept for the tool outputs view
+TOOL_CALLS_LOG_MAXLEN = 1000
+
 # Global variables for tracking state
 class AppState:
     def __init__(self):
+        # Set from worker threads, polled and cleared by the UI refresh callback
+        self._ui_update = threading.Event()
         self.analysis_queue = []
         self.symbol_states = {}
         self.current_symbol = None  # Symbol displayed in UI
@@ -12,6 +21,7 @@ class AppState:
         self.analysis_running = False
         self.analysis_trace = []
         self.tool_calls_count = 0
+        self._tool_call_counter = itertools.count(1)
         self.llm_calls_count = 0
         self.generated_reports_count = 0
         self.needs_ui_update = False
@@ -21,7 +31,7 @@ class AppState:
         self.session_start_time = None
         
         # New: Proper tracking lists similar to CLI
-        self.tool_calls_log = []  # Store actual tool calls for proper counting
+        self.tool_calls_log = deque(maxlen=TOOL_CALLS_LOG_MAXLEN)  # Most recent tool calls for display
         self.llm_calls_log = []   # Store actual LLM calls for proper counting
         
         # Loop configuration
@@ -76,6 +86,28 @@ class AppState:
         self.trade_amount = 1000
         self.trade_occurred = False
 
+    @property
+    def needs_ui_update(self):
+        return self._ui_update.is_set()
+
+    @needs_ui_update.setter
+    def needs_ui_update(self, value):
+        if value:
+            self._ui_update.set()
+        else:
+            self._ui_update.clear()
+
+    def record_tool_call(self, tool_call_info):
+        """Log a tool call from any thread without locking: deque appends and
+        counter increments are atomic.
+
+        Readers must iterate a snapshot (`list(self.tool_calls_log)`, itself a
+        single atomic copy) - iterating the deque while a tool thread appends
+        raises "deque mutated during iteration"."""
+        self.tool_calls_log.append(tool_call_info)
+        self.tool_calls_count = next(self._tool_call_counter)
+        self._ui_update.set()
+
     def add_symbols_to_queue(self, symbols):
         """Add a list of symbols to the analysis queue."""
         self.analysis_queue.extend(symbols)
@@ -238,9 +270,10 @@ class AppState:
         self.analysis_running = False
         self.analysis_trace = []
         self.tool_calls_count = 0
+        self._tool_call_counter = itertools.count(1)
         self.llm_calls_count = 0
         # Reset the new tracking lists
-        self.tool_calls_log = []
+        self.tool_calls_log = deque(maxlen=TOOL_CALLS_LOG_MAXLEN)
         self.llm_calls_log = []
         self.generated_reports_count = 0
         # Reset session tracking
@@ -251,7 +284,7 @@ class AppState:
         """Get tool calls in a consistent format for UI display, optionally filtered by agent type"""
         formatted_calls = []
         
-        for call in self.tool_calls_log:
+        for call in list(self.tool_calls_log):
             if isinstance(call, dict):
                 # New format - already has all the data we need
                 formatted_calls.append(call)
@@ -404,9 +437,10 @@ class AppState:
         self.current_symbol = None
         self.analysis_trace = []
         self.tool_calls_count = 0
+        self._tool_call_counter = itertools.count(1)
         self.llm_calls_count = 0
         # Reset the new tracking lists
-        self.tool_calls_log = []
+        self.tool_calls_log = deque(maxlen=TOOL_CALLS_LOG_MAXLEN)
         self.llm_calls_log = []
         self.generated_reports_count = 0
         self.needs_ui_update = True